@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 
 from app.database import SessionLocal
-from app.models.models import (
+from taskio_models.orm import (
     User, ProjectType, Role, Status, TaskType,
     Project, ProjectUser, Sprint, Epic, Task
 )
@@ -69,6 +69,11 @@ class AnalyticsServiceStub(object):
                 request_serializer=analytics__pb2.GetTasksProgressByDayRequest.SerializeToString,
                 response_deserializer=analytics__pb2.TasksProgressByDayResponse.FromString,
                 _registered_method=True)
+        self.GetMetrics = channel.unary_unary(
+                '/analytics.AnalyticsService/GetMetrics',
+                request_serializer=analytics__pb2.MetricsRequest.SerializeToString,
+                response_deserializer=analytics__pb2.MetricsResponse.FromString,
+                _registered_method=True)
 
 
 class AnalyticsServiceServicer(object):
@@ -116,6 +121,12 @@ class AnalyticsServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetMetrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AnalyticsServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -154,6 +165,11 @@ def add_AnalyticsServiceServicer_to_server(servicer, server):
                     request_deserializer=analytics__pb2.GetTasksProgressByDayRequest.FromString,
                     response_serializer=analytics__pb2.TasksProgressByDayResponse.SerializeToString,
             ),
+            'GetMetrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMetrics,
+                    request_deserializer=analytics__pb2.MetricsRequest.FromString,
+                    response_serializer=analytics__pb2.MetricsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'analytics.AnalyticsService', rpc_method_handlers)
@@ -353,3 +369,30 @@ class AnalyticsService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetMetrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/analytics.AnalyticsService/GetMetrics',
+            analytics__pb2.MetricsRequest.SerializeToString,
+            analytics__pb2.MetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
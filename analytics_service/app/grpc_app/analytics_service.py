@@ -1,10 +1,68 @@
 from concurrent import futures
+import os
 import grpc
+from taskio_server import SERVER_OPTIONS
 
-from app.services.analytics import AnalyticsService
+from app.database import db_pool_stats
+from app.services.analytics import AnalyticsService, AsyncAnalyticsService
 from . import analytics_pb2
 from . import analytics_pb2_grpc
 
+GRPC_MAX_WORKERS = int(os.getenv("GRPC_MAX_WORKERS", "10"))
+
+
+def _timeline_response(timeline):
+    return analytics_pb2.TimelineResponse(
+        tasks=[
+            analytics_pb2.TaskInfo(
+                task_name=task["task_name"],
+                project_name=task["project_name"],
+                start_date=task["start_date"],
+                end_date=task["end_date"],
+            )
+            for task in timeline
+        ]
+    )
+
+
+def _tasks_completed_by_user_response(tasks_user):
+    return analytics_pb2.TasksCompletedByUserResponse(
+        user_task=[
+            analytics_pb2.UserTasks(
+                user_id=ut["user_id"],
+                full_name=ut["full_name"],
+                completed_tasks=ut["completed_tasks"],
+            )
+            for ut in tasks_user
+        ]
+    )
+
+
+def _tasks_status_in_sprints_response(sprints):
+    return analytics_pb2.TasksStatusInSprintsResponse(
+        sprints=[
+            analytics_pb2.SprintInfo(
+                sprint_id=sprint["sprint_id"],
+                name=sprint["name"],
+                completed_tasks=sprint["completed_tasks"],
+                uncompleted_tasks=sprint["uncompleted_tasks"],
+            )
+            for sprint in sprints
+        ]
+    )
+
+
+def _tasks_progress_by_day_response(days):
+    return analytics_pb2.TasksProgressByDayResponse(
+        days=[
+            analytics_pb2.DayInfo(
+                day=day["day"],
+                tasks=day["tasks"],
+            )
+            for day in days
+        ]
+    )
+
 
 class AnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
     def __init__(self):
@@ -14,17 +72,7 @@ class AnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
         try:
             timeline = self.analytics_service.get_timeline_all(request.user_id)
 
-            return analytics_pb2.TimelineResponse(
-                tasks=[
-                    analytics_pb2.TaskInfo(
-                        task_name=task["task_name"],
-                        project_name=task["project_name"],
-                        start_date=task["start_date"],
-                        end_date=task["end_date"],
-                    )
-                    for task in timeline
-                ]
-            )
+            return _timeline_response(timeline)
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Timeline reading failed: {e}")
 
@@ -32,17 +80,7 @@ class AnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
         try:
             timeline = self.analytics_service.get_timeline_project(request.user_id, request.project_id)
 
-            return analytics_pb2.TimelineResponse(
-                tasks=[
-                    analytics_pb2.TaskInfo(
-                        task_name=task["task_name"],
-                        project_name=task["project_name"],
-                        start_date=task["start_date"],
-                        end_date=task["end_date"],
-                    )
-                    for task in timeline
-                ]
-            )
+            return _timeline_response(timeline)
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Timeline reading failed: {e}")
 
@@ -50,17 +88,7 @@ class AnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
         try:
             timeline = self.analytics_service.get_timeline_all_mine(request.user_id)
 
-            return analytics_pb2.TimelineResponse(
-                tasks=[
-                    analytics_pb2.TaskInfo(
-                        task_name=task["task_name"],
-                        project_name=task["project_name"],
-                        start_date=task["start_date"],
-                        end_date=task["end_date"],
-                    )
-                    for task in timeline
-                ]
-            )
+            return _timeline_response(timeline)
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Timeline reading failed: {e}")
 
@@ -68,17 +96,7 @@ class AnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
         try:
             timeline = self.analytics_service.get_timeline_project_mine(request.user_id, request.project_id)
 
-            return analytics_pb2.TimelineResponse(
-                tasks=[
-                    analytics_pb2.TaskInfo(
-                        task_name=task["task_name"],
-                        project_name=task["project_name"],
-                        start_date=task["start_date"],
-                        end_date=task["end_date"],
-                    )
-                    for task in timeline
-                ]
-            )
+            return _timeline_response(timeline)
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Timeline reading failed: {e}")
 
@@ -86,16 +104,7 @@ class AnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
         tasks_user = self.analytics_service.get_tasks_completed_by_user(request.project_id)
 
         if tasks_user:
-            return analytics_pb2.TasksCompletedByUserResponse(
-                user_task=[
-                    analytics_pb2.UserTasks(
-                        user_id=ut["user_id"],
-                        full_name=ut["full_name"],
-                        completed_tasks=ut["completed_tasks"],
-                    )
-                    for ut in tasks_user
-                ]
-            )
+            return _tasks_completed_by_user_response(tasks_user)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Tasks completed by user reading failed")
@@ -105,17 +114,7 @@ class AnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
         try:
             sprints = self.analytics_service.get_tasks_status_in_sprints(request.project_id)
 
-            return analytics_pb2.TasksStatusInSprintsResponse(
-                sprints=[
-                    analytics_pb2.SprintInfo(
-                        sprint_id=sprint["sprint_id"],
-                        name=sprint["name"],
-                        completed_tasks=sprint["completed_tasks"],
-                        uncompleted_tasks=sprint["uncompleted_tasks"],
-                    )
-                    for sprint in sprints
-                ]
-            )
+            return _tasks_status_in_sprints_response(sprints)
 
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Tasks status in sprints reading failed: {e}")
@@ -124,23 +123,86 @@ class AnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
         days = self.analytics_service.get_tasks_progress_by_day(request.project_id)
 
         if days:
-            return analytics_pb2.TasksProgressByDayResponse(
-                days=[
-                    analytics_pb2.DayInfo(
-                        day=day["day"],
-                        tasks=day["tasks"],
-                    )
-                    for day in days
-                ]
-            )
+            return _tasks_progress_by_day_response(days)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Tasks progress by day reading failed")
             return analytics_pb2.TasksProgressByDayResponse()
 
+    def GetMetrics(self, request, context):
+        return analytics_pb2.MetricsResponse(values=db_pool_stats())
+
+
+class AsyncAnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
+    """Servicer for the grpc.aio server, every RPC is a read."""
+
+    def __init__(self):
+        self.analytics_service = AsyncAnalyticsService()
+
+    async def GetTimelineAll(self, request, context):
+        try:
+            timeline = await self.analytics_service.get_timeline_all(request.user_id)
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Timeline reading failed: {e}")
+        return _timeline_response(timeline)
+
+    async def GetTimelineProject(self, request, context):
+        try:
+            timeline = await self.analytics_service.get_timeline_project(request.user_id, request.project_id)
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Timeline reading failed: {e}")
+        return _timeline_response(timeline)
+
+    async def GetTimelineAllMine(self, request, context):
+        try:
+            timeline = await self.analytics_service.get_timeline_all_mine(request.user_id)
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Timeline reading failed: {e}")
+        return _timeline_response(timeline)
+
+    async def GetTimelineProjectMine(self, request, context):
+        try:
+            timeline = await self.analytics_service.get_timeline_project_mine(request.user_id, request.project_id)
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Timeline reading failed: {e}")
+        return _timeline_response(timeline)
+
+    async def GetTasksCompletedByUser(self, request, context):
+        tasks_user = await self.analytics_service.get_tasks_completed_by_user(request.project_id)
+
+        if not tasks_user:
+            await context.abort(grpc.StatusCode.UNKNOWN, "Tasks completed by user reading failed")
+        return _tasks_completed_by_user_response(tasks_user)
+
+    async def GetTasksStatusInSprints(self, request, context):
+        try:
+            sprints = await self.analytics_service.get_tasks_status_in_sprints(request.project_id)
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Tasks status in sprints reading failed: {e}")
+        return _tasks_status_in_sprints_response(sprints)
+
+    async def GetTasksProgressByDay(self, request, context):
+        days = await self.analytics_service.get_tasks_progress_by_day(request.project_id)
+
+        if not days:
+            await context.abort(grpc.StatusCode.UNKNOWN, "Tasks progress by day reading failed")
+        return _tasks_progress_by_day_response(days)
+
+    async def GetMetrics(self, request, context):
+        return analytics_pb2.MetricsResponse(values=db_pool_stats())
+
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=GRPC_MAX_WORKERS), options=SERVER_OPTIONS
+    )
     analytics_pb2_grpc.add_AnalyticsServiceServicer_to_server(AnalyticsServicer(), server)
     server.add_insecure_port("[::]:50054")
     return server
+
+
+def serve_aio():
+    server = grpc.aio.server(options=SERVER_OPTIONS)
+    analytics_pb2_grpc.add_AnalyticsServiceServicer_to_server(AsyncAnalyticsServicer(), server)
+    server.add_insecure_port("[::]:50054")
+    return server
@@ -1,4 +1,4 @@
-from app.database import SessionLocal
+from app.database import SessionLocal, AsyncSessionLocal
 from app.models.models import User, Task, Sprint, ProjectUser, Project, Status
 from sqlalchemy.orm import joinedload
 from sqlalchemy import select, func, and_
@@ -33,45 +33,294 @@ def _parse_date(v) -> date | None:
     raise ValueError(f"Incorrect date format: {v}. Waiting for dd.mm.yyyy")
 
 
+def _timeline_all(db, user_id):
+    q = (
+        select(
+            Task.title.label("task_name"),
+            Project.name.label("project_name"),
+            Task.start_date.label("start_date"),
+            func.coalesce(Task.end_date, Sprint.end_date).label("end_date"),
+        )
+        .join(Sprint, Task.sprint_id == Sprint.id)
+        .where(Sprint.is_started.is_(True))
+        .join(Project, Task.project_id == Project.id)
+        .join(
+            ProjectUser,
+            and_(
+                ProjectUser.project_id == Project.id,
+                ProjectUser.user_id == user_id,
+            ),
+        )
+        .order_by(func.coalesce(Task.start_date, Sprint.start_date),
+                  func.coalesce(Task.end_date, Sprint.end_date))
+    )
+
+    rows = db.execute(q).all()
+
+    result: list[dict[str, str]] = [
+        {
+            "task_name": task_name,
+            "project_name": project_name,
+            "start_date": _fmt_date(start_date),
+            "end_date": _fmt_date(end_date),
+        }
+        for task_name, project_name, start_date, end_date in rows
+    ]
+
+    return result
+
+
+def _timeline_project(db, user_id, project_id):
+    q = (
+        select(
+            Task.title.label("task_name"),
+            Project.name.label("project_name"),
+            Task.start_date.label("start_date"),
+            func.coalesce(Task.end_date, Sprint.end_date).label("end_date"),
+        )
+        .join(Sprint, Task.sprint_id == Sprint.id)
+        .where(Sprint.is_started.is_(True))
+        .join(Project, Task.project_id == Project.id)
+        .where(Project.id == project_id)
+        .join(
+            ProjectUser,
+            and_(
+                ProjectUser.project_id == Project.id,
+                ProjectUser.user_id == user_id,
+            ),
+        )
+        .order_by(
+            func.coalesce(Task.start_date, Sprint.start_date),
+            func.coalesce(Task.end_date, Sprint.end_date),
+            Task.title,
+        )
+    )
+
+    rows = db.execute(q).all()
+
+    return [
+        {
+            "task_name": task_name,
+            "project_name": project_name,
+            "start_date": _fmt_date(start_date),
+            "end_date": _fmt_date(end_date),
+        }
+        for task_name, project_name, start_date, end_date in rows
+    ]
+
+
+def _timeline_all_mine(db, user_id):
+    q = (
+        select(
+            Task.title.label("task_name"),
+            Project.name.label("project_name"),
+            Task.start_date.label("start_date"),
+            func.coalesce(Task.end_date, Sprint.end_date).label("end_date"),
+        )
+        .join(Sprint, Task.sprint_id == Sprint.id)
+        .where(Sprint.is_started.is_(True))
+        .join(Project, Task.project_id == Project.id)
+        .join(
+            ProjectUser,
+            and_(
+                ProjectUser.project_id == Project.id,
+                ProjectUser.user_id == user_id,
+            ),
+        )
+        .where(Task.assigned_to == user_id)
+        .order_by(
+            func.coalesce(Task.start_date, Sprint.start_date),
+            func.coalesce(Task.end_date, Sprint.end_date),
+            Task.title,
+        )
+    )
+
+    rows = db.execute(q).all()
+
+    return [
+        {
+            "task_name": task_name,
+            "project_name": project_name,
+            "start_date": _fmt_date(start_date),
+            "end_date": _fmt_date(end_date),
+        }
+        for task_name, project_name, start_date, end_date in rows
+    ]
+
+
+def _timeline_project_mine(db, user_id, project_id):
+    q = (
+        select(
+            Task.title.label("task_name"),
+            Project.name.label("project_name"),
+            Task.start_date.label("start_date"),
+            func.coalesce(Task.end_date, Sprint.end_date).label("end_date"),
+        )
+        .join(Sprint, Task.sprint_id == Sprint.id)
+        .where(Sprint.is_started.is_(True))
+        .join(Project, Task.project_id == Project.id)
+        .where(Project.id == project_id)
+        .join(
+            ProjectUser,
+            and_(
+                ProjectUser.project_id == Project.id,
+                ProjectUser.user_id == user_id,
+            ),
+        )
+        .where(Task.assigned_to == user_id)
+        .order_by(
+            func.coalesce(Task.start_date, Sprint.start_date),
+            func.coalesce(Task.end_date, Sprint.end_date),
+            Task.title,
+        )
+    )
+
+    rows = db.execute(q).all()
+
+    return [
+        {
+            "task_name": task_name,
+            "project_name": project_name,
+            "start_date": _fmt_date(start_date),
+            "end_date": _fmt_date(end_date),
+        }
+        for task_name, project_name, start_date, end_date in rows
+    ]
+
+
+def _tasks_completed_by_user(db, project_id):
+    users_rows = db.execute(
+        select(User.id, User.name, User.surname)
+        .join(ProjectUser, ProjectUser.user_id == User.id)
+        .where(ProjectUser.project_id == project_id)
+        .order_by(User.surname, User.name)
+    ).all()
+
+    result_map: dict = {
+        uid: {
+            "user_id": str(uid),
+            "full_name": f"{name} {surname}",
+            "completed_tasks": [],
+        }
+        for uid, name, surname in users_rows
+    }
+
+    if not result_map:
+        return []
+
+    user_ids = list(result_map.keys())
+
+    done_rows = db.execute(
+        select(Task.title, Task.assigned_to)
+        .join(Status, Task.status_id == Status.id)
+        .where(
+            Task.project_id == project_id,
+            Status.name == "done",
+            Task.assigned_to.in_(user_ids),
+        )
+        .order_by(Task.title)
+    ).all()
+
+    for title, assignee_id in done_rows:
+        result_map[assignee_id]["completed_tasks"].append(title)
+
+    return list(result_map.values())
+
+
+def _tasks_status_in_sprints(db, project_id):
+    sprints = db.execute(
+        select(Sprint.id, Sprint.name)
+        .where(Sprint.project_id == project_id)
+        .order_by(Sprint.start_date, Sprint.created_at, Sprint.name)
+    ).all()
+
+    if not sprints:
+        return []
+
+    result_map: dict = {
+        sid: {
+            "sprint_id": str(sid),
+            "name": name,
+            "completed_tasks": [],
+            "uncompleted_tasks": [],
+        }
+        for sid, name in sprints
+    }
+    sprint_ids = list(result_map.keys())
+
+    rows = db.execute(
+        select(
+            Task.sprint_id,
+            Task.title,
+            (func.lower(Status.name) == "done").label("is_done"),
+        )
+        .join(Status, Status.id == Task.status_id)
+        .where(
+            Task.project_id == project_id,
+            Task.sprint_id.in_(sprint_ids),
+        )
+        .order_by(Task.sprint_id, Task.title)
+    ).all()
+
+    for sprint_id, title, is_done in rows:
+        if is_done:
+            result_map[sprint_id]["completed_tasks"].append(title)
+        else:
+            result_map[sprint_id]["uncompleted_tasks"].append(title)
+
+    return list(result_map.values())
+
+
+def _tasks_progress_by_day(db, project_id):
+    project_start = db.execute(
+        select(func.min(Sprint.start_date)).where(
+            Sprint.project_id == project_id,
+            Sprint.start_date.isnot(None),
+        )
+    ).scalar()
+
+    if project_start is None:
+        return []
+
+    today = date.today()
+    if project_start > today:
+        return []
+
+    rows = db.execute(
+        select(Task.title, Task.end_date)
+        .join(Status, Status.id == Task.status_id)
+        .where(
+            Task.project_id == project_id,
+            func.lower(Status.name) == "done",
+            Task.end_date.isnot(None),
+            Task.end_date >= project_start,
+            Task.end_date <= today,
+        )
+        .order_by(Task.end_date, Task.title)
+    ).all()
+
+    done_by_day: dict[date, list[str]] = {}
+    for title, end_dt in rows:
+        done_by_day.setdefault(end_dt, []).append(title)
+
+    days_count = (today - project_start).days
+    result: list[dict[str, object]] = []
+    for i in range(days_count + 1):
+        day = project_start + timedelta(days=i)
+        result.append({
+            "day": _fmt_date(day),
+            "tasks": done_by_day.get(day, []),
+        })
+
+    return result
+
+
 class AnalyticsService:
     def get_timeline_all(self, user_id):
         db = SessionLocal()
         user_id = _to_uuid_or_none(user_id)
         try:
-            q = (
-                select(
-                    Task.title.label("task_name"),
-                    Project.name.label("project_name"),
-                    Task.start_date.label("start_date"),
-                    func.coalesce(Task.end_date, Sprint.end_date).label("end_date"),
-                )
-                .join(Sprint, Task.sprint_id == Sprint.id)
-                .where(Sprint.is_started.is_(True))
-                .join(Project, Task.project_id == Project.id)
-                .join(
-                    ProjectUser,
-                    and_(
-                        ProjectUser.project_id == Project.id,
-                        ProjectUser.user_id == user_id,
-                    ),
-                )
-                .order_by(func.coalesce(Task.start_date, Sprint.start_date),
-                          func.coalesce(Task.end_date, Sprint.end_date))
-            )
-
-            rows = db.execute(q).all()
-
-            result: list[dict[str, str]] = [
-                {
-                    "task_name": task_name,
-                    "project_name": project_name,
-                    "start_date": _fmt_date(start_date),
-                    "end_date": _fmt_date(end_date),
-                }
-                for task_name, project_name, start_date, end_date in rows
-            ]
-
-            return result
+            return _timeline_all(db, user_id)
         finally:
             db.close()
 
@@ -80,42 +329,7 @@ class AnalyticsService:
         user_id = _to_uuid_or_none(user_id)
         project_id = _to_uuid_or_none(project_id)
         try:
-            q = (
-                select(
-                    Task.title.label("task_name"),
-                    Project.name.label("project_name"),
-                    Task.start_date.label("start_date"),
-                    func.coalesce(Task.end_date, Sprint.end_date).label("end_date"),
-                )
-                .join(Sprint, Task.sprint_id == Sprint.id)
-                .where(Sprint.is_started.is_(True))
-                .join(Project, Task.project_id == Project.id)
-                .where(Project.id == project_id)
-                .join(
-                    ProjectUser,
-                    and_(
-                        ProjectUser.project_id == Project.id,
-                        ProjectUser.user_id == user_id,
-                    ),
-                )
-                .order_by(
-                    func.coalesce(Task.start_date, Sprint.start_date),
-                    func.coalesce(Task.end_date, Sprint.end_date),
-                    Task.title,
-                )
-            )
-
-            rows = db.execute(q).all()
-
-            return [
-                {
-                    "task_name": task_name,
-                    "project_name": project_name,
-                    "start_date": _fmt_date(start_date),
-                    "end_date": _fmt_date(end_date),
-                }
-                for task_name, project_name, start_date, end_date in rows
-            ]
+            return _timeline_project(db, user_id, project_id)
         finally:
             db.close()
 
@@ -123,223 +337,70 @@ class AnalyticsService:
         db = SessionLocal()
         user_id = _to_uuid_or_none(user_id)
         try:
-            q = (
-                select(
-                    Task.title.label("task_name"),
-                    Project.name.label("project_name"),
-                    Task.start_date.label("start_date"),
-                    func.coalesce(Task.end_date, Sprint.end_date).label("end_date"),
-                )
-                .join(Sprint, Task.sprint_id == Sprint.id)
-                .where(Sprint.is_started.is_(True))
-                .join(Project, Task.project_id == Project.id)
-                .join(
-                    ProjectUser,
-                    and_(
-                        ProjectUser.project_id == Project.id,
-                        ProjectUser.user_id == user_id,
-                    ),
-                )
-                .where(Task.assigned_to == user_id)
-                .order_by(
-                    func.coalesce(Task.start_date, Sprint.start_date),
-                    func.coalesce(Task.end_date, Sprint.end_date),
-                    Task.title,
-                )
-            )
-
-            rows = db.execute(q).all()
-
-            return [
-                {
-                    "task_name": task_name,
-                    "project_name": project_name,
-                    "start_date": _fmt_date(start_date),
-                    "end_date": _fmt_date(end_date),
-                }
-                for task_name, project_name, start_date, end_date in rows
-            ]
+            return _timeline_all_mine(db, user_id)
         finally:
             db.close()
 
     def get_timeline_project_mine(self, user_id, project_id):
         db = SessionLocal()
         try:
-            q = (
-                select(
-                    Task.title.label("task_name"),
-                    Project.name.label("project_name"),
-                    Task.start_date.label("start_date"),
-                    func.coalesce(Task.end_date, Sprint.end_date).label("end_date"),
-                )
-                .join(Sprint, Task.sprint_id == Sprint.id)
-                .where(Sprint.is_started.is_(True))
-                .join(Project, Task.project_id == Project.id)
-                .where(Project.id == project_id)
-                .join(
-                    ProjectUser,
-                    and_(
-                        ProjectUser.project_id == Project.id,
-                        ProjectUser.user_id == user_id,
-                    ),
-                )
-                .where(Task.assigned_to == user_id)
-                .order_by(
-                    func.coalesce(Task.start_date, Sprint.start_date),
-                    func.coalesce(Task.end_date, Sprint.end_date),
-                    Task.title,
-                )
-            )
-
-            rows = db.execute(q).all()
-
-            return [
-                {
-                    "task_name": task_name,
-                    "project_name": project_name,
-                    "start_date": _fmt_date(start_date),
-                    "end_date": _fmt_date(end_date),
-                }
-                for task_name, project_name, start_date, end_date in rows
-            ]
+            return _timeline_project_mine(db, user_id, project_id)
         finally:
             db.close()
 
     def get_tasks_completed_by_user(self, project_id):
         db = SessionLocal()
         try:
-            users_rows = db.execute(
-                select(User.id, User.name, User.surname)
-                .join(ProjectUser, ProjectUser.user_id == User.id)
-                .where(ProjectUser.project_id == project_id)
-                .order_by(User.surname, User.name)
-            ).all()
-
-            result_map: dict = {
-                uid: {
-                    "user_id": str(uid),
-                    "full_name": f"{name} {surname}",
-                    "completed_tasks": [],
-                }
-                for uid, name, surname in users_rows
-            }
-
-            if not result_map:
-                return []
-
-            user_ids = list(result_map.keys())
-
-            done_rows = db.execute(
-                select(Task.title, Task.assigned_to)
-                .join(Status, Task.status_id == Status.id)
-                .where(
-                    Task.project_id == project_id,
-                    Status.name == "done",
-                    Task.assigned_to.in_(user_ids),
-                )
-                .order_by(Task.title)
-            ).all()
-
-            for title, assignee_id in done_rows:
-                result_map[assignee_id]["completed_tasks"].append(title)
-
-            return list(result_map.values())
-
+            return _tasks_completed_by_user(db, project_id)
         finally:
             db.close()
 
     def get_tasks_status_in_sprints(self, project_id):
         db = SessionLocal()
         try:
-            sprints = db.execute(
-                select(Sprint.id, Sprint.name)
-                .where(Sprint.project_id == project_id)
-                .order_by(Sprint.start_date, Sprint.created_at, Sprint.name)
-            ).all()
-
-            if not sprints:
-                return []
-
-            result_map: dict = {
-                sid: {
-                    "sprint_id": str(sid),
-                    "name": name,
-                    "completed_tasks": [],
-                    "uncompleted_tasks": [],
-                }
-                for sid, name in sprints
-            }
-            sprint_ids = list(result_map.keys())
-
-            rows = db.execute(
-                select(
-                    Task.sprint_id,
-                    Task.title,
-                    (func.lower(Status.name) == "done").label("is_done"),
-                )
-                .join(Status, Status.id == Task.status_id)
-                .where(
-                    Task.project_id == project_id,
-                    Task.sprint_id.in_(sprint_ids),
-                )
-                .order_by(Task.sprint_id, Task.title)
-            ).all()
-
-            for sprint_id, title, is_done in rows:
-                if is_done:
-                    result_map[sprint_id]["completed_tasks"].append(title)
-                else:
-                    result_map[sprint_id]["uncompleted_tasks"].append(title)
-
-            return list(result_map.values())
-
+            return _tasks_status_in_sprints(db, project_id)
         finally:
             db.close()
 
     def get_tasks_progress_by_day(self, project_id):
         db = SessionLocal()
         try:
-            project_start = db.execute(
-                select(func.min(Sprint.start_date)).where(
-                    Sprint.project_id == project_id,
-                    Sprint.start_date.isnot(None),
-                )
-            ).scalar()
-
-            if project_start is None:
-                return []
-
-            today = date.today()
-            if project_start > today:
-                return []
-
-            rows = db.execute(
-                select(Task.title, Task.end_date)
-                .join(Status, Status.id == Task.status_id)
-                .where(
-                    Task.project_id == project_id,
-                    func.lower(Status.name) == "done",
-                    Task.end_date.isnot(None),
-                    Task.end_date >= project_start,
-                    Task.end_date <= today,
-                )
-                .order_by(Task.end_date, Task.title)
-            ).all()
-
-            done_by_day: dict[date, list[str]] = {}
-            for title, end_dt in rows:
-                done_by_day.setdefault(end_dt, []).append(title)
-
-            days_count = (today - project_start).days
-            result: list[dict[str, object]] = []
-            for i in range(days_count + 1):
-                day = project_start + timedelta(days=i)
-                result.append({
-                    "day": _fmt_date(day),
-                    "tasks": done_by_day.get(day, []),
-                })
-
-            return result
-
+            return _tasks_progress_by_day(db, project_id)
         finally:
             db.close()
+
+
+class AsyncAnalyticsService:
+    """Analytics for the grpc.aio server mode, over the same loaders."""
+
+    async def get_timeline_all(self, user_id):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(_timeline_all, _to_uuid_or_none(user_id))
+
+    async def get_timeline_project(self, user_id, project_id):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(
+                _timeline_project, _to_uuid_or_none(user_id), _to_uuid_or_none(project_id)
+            )
+
+    async def get_timeline_all_mine(self, user_id):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(_timeline_all_mine, _to_uuid_or_none(user_id))
+
+    async def get_timeline_project_mine(self, user_id, project_id):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(
+                _timeline_project_mine, _to_uuid_or_none(user_id), _to_uuid_or_none(project_id)
+            )
+
+    async def get_tasks_completed_by_user(self, project_id):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(_tasks_completed_by_user, _to_uuid_or_none(project_id))
+
+    async def get_tasks_status_in_sprints(self, project_id):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(_tasks_status_in_sprints, _to_uuid_or_none(project_id))
+
+    async def get_tasks_progress_by_day(self, project_id):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(_tasks_progress_by_day, _to_uuid_or_none(project_id))
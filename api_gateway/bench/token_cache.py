@@ -0,0 +1,63 @@
+"""Compares per-request token verification with and without the cache.
+
+Tokens are signed with a throwaway secret, nothing outside the process
+is touched:
+
+    python -m bench.token_cache --tokens 1000 --requests 100000
+"""
+import argparse
+import statistics
+import time
+from uuid import uuid4
+
+from jose import jwt
+
+from clients.token_cache import TokenCache
+from models.auth_models import User
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--algorithm", default="HS256")
+    parser.add_argument("--tokens", type=int, default=1000, help="distinct tokens in rotation")
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--cache-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    secret = "benchmark-secret"
+    exp = time.time() + 3600
+    tokens = [
+        jwt.encode(
+            {"sub": str(uuid4()), "email": f"bench{i}@example.com", "jti": str(uuid4()), "exp": exp},
+            secret,
+            algorithm=args.algorithm,
+        )
+        for i in range(args.tokens)
+    ]
+
+    def decode(token):
+        payload = jwt.decode(token, secret, algorithms=[args.algorithm])
+        return User(user_id=payload["sub"], email=payload["email"]), payload
+
+    cache = TokenCache(args.cache_size)
+
+    def cached(token):
+        user = cache.get(token)
+        if user is None:
+            user, payload = decode(token)
+            cache.put(token, user, payload["exp"], payload.get("jti"))
+        return user
+
+    print(f"{'mode':<12}{'p50 us':>10}{'p99 us':>10}{'req/s':>12}")
+    for label, verify in (("decode", lambda t: decode(t)[0]), ("cached", cached)):
+        timings = []
+        started = time.perf_counter()
+        for i in range(args.requests):
+            token = tokens[i % len(tokens)]
+            t0 = time.perf_counter()
+            verify(token)
+            timings.append((time.perf_counter() - t0) * 1e6)
+        total = time.perf_counter() - started
+        timings.sort()
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(f"{label:<12}{statistics.median(timings):>10.1f}{p99:>10.1f}{args.requests / total:>12.0f}")
+    print(cache.stats())
@@ -1,44 +1,55 @@
 import grpc
 
+from config import get_settings
+from clients.grpc.channels import channel_registry
 from proto.analytics import analytics_pb2, analytics_pb2_grpc
 
 
 class AnalyticsGrpcClient:
-    def __init__(self, host="analytics_service", port=50054):
-        self.channel = grpc.insecure_channel(f"{host}:{port}")
+    def __init__(
+        self, channel=None, host="analytics_service", port=50054, timeout=None
+    ):
+        self.channel = channel or grpc.aio.insecure_channel(f"{host}:{port}")
+        self.timeout = timeout
         self.stub = analytics_pb2_grpc.AnalyticsServiceStub(self.channel)
 
-    def get_all_timeline(self, user_id):
+    async def get_all_timeline(self, user_id):
         req = analytics_pb2.GetTimelineAllRequest(user_id=user_id)
-        res = self.stub.GetTimelineAll(req)
+        res = await self.stub.GetTimelineAll(req, timeout=self.timeout)
         return res
 
-    def get_project_timeline(self, user_id, project_id):
+    async def get_project_timeline(self, user_id, project_id):
         req = analytics_pb2.GetTimelineProjectRequest(user_id=user_id, project_id=project_id)
-        res = self.stub.GetTimelineProject(req)
+        res = await self.stub.GetTimelineProject(req, timeout=self.timeout)
         return res
 
-    def get_all_mine_timeline(self, user_id):
+    async def get_all_mine_timeline(self, user_id):
         req = analytics_pb2.GetTimelineAllMineRequest(user_id=user_id)
-        res = self.stub.GetTimelineAllMine(req)
+        res = await self.stub.GetTimelineAllMine(req, timeout=self.timeout)
         return res
 
-    def get_mine_project_timeline(self, user_id, project_id):
+    async def get_mine_project_timeline(self, user_id, project_id):
         req = analytics_pb2.GetTimelineProjectMineRequest(user_id=user_id, project_id=project_id)
-        res = self.stub.GetTimelineProjectMine(req)
+        res = await self.stub.GetTimelineProjectMine(req, timeout=self.timeout)
         return res
 
-    def get_tasks_completed_by_users(self, project_id):
+    async def get_tasks_completed_by_users(self, project_id):
         req = analytics_pb2.GetTasksCompletedByUserRequest(project_id=project_id)
-        res = self.stub.GetTasksCompletedByUser(req)
+        res = await self.stub.GetTasksCompletedByUser(req, timeout=self.timeout)
         return res
 
-    def get_tasks_status_in_sprints(self, project_id):
+    async def get_tasks_status_in_sprints(self, project_id):
         req = analytics_pb2.GetTasksStatusInSprintsRequest(project_id=project_id)
-        res = self.stub.GetTasksStatusInSprints(req)
+        res = await self.stub.GetTasksStatusInSprints(req, timeout=self.timeout)
         return res
 
-    def get_tasks_progress_by_day(self, project_id):
+    async def get_tasks_progress_by_day(self, project_id):
         req = analytics_pb2.GetTasksProgressByDayRequest(project_id=project_id)
-        res = self.stub.GetTasksProgressByDay(req)
+        res = await self.stub.GetTasksProgressByDay(req, timeout=self.timeout)
         return res
+
+
+async def get_analytics_client() -> AnalyticsGrpcClient:
+    return AnalyticsGrpcClient(
+        channel_registry.channel("analytics"), timeout=get_settings().GRPC_DEADLINE
+    )
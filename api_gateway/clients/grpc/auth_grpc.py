@@ -1,14 +1,19 @@
 import grpc
 
+from config import get_settings
+from clients.grpc.channels import channel_registry
 from proto.auth import auth_pb2, auth_pb2_grpc
 
 
 class AuthGrpcClient:
-    def __init__(self, host="auth_service", port=50051):
-        self.channel = grpc.insecure_channel(f"{host}:{port}")
+    def __init__(
+        self, channel=None, host="auth_service", port=50051, timeout=None
+    ):
+        self.channel = channel or grpc.aio.insecure_channel(f"{host}:{port}")
+        self.timeout = timeout
         self.stub = auth_pb2_grpc.AuthServiceStub(self.channel)
 
-    def create_user(self, name, surname, email, password, img_url):
+    async def create_user(self, name, surname, email, password, img_url):
         request = auth_pb2.CreateUserRequest(
             name=name,
             surname=surname,
@@ -16,59 +21,74 @@ class AuthGrpcClient:
             password=password,
             img_url=img_url
         )
-        response = self.stub.CreateUser(request)
+        response = await self.stub.CreateUser(request, timeout=self.timeout)
         return response
 
-    def login_user(self, email, password):
+    async def login_user(self, email, password):
         request = auth_pb2.LoginUserRequest(
             email=email,
             password=password
         )
-        response = self.stub.LoginUser(request)
+        response = await self.stub.LoginUser(request, timeout=self.timeout)
         return response
 
-    def get_user_by_id(self, uuid):
+    async def get_user_by_id(self, uuid):
         request = auth_pb2.GetUserRequest(
             user_id=uuid
         )
-        response = self.stub.GetUser(request)
+        response = await self.stub.GetUser(request, timeout=self.timeout)
         return response
 
-    def update_user(self, name, surname, email, password):
+    async def get_users(self, user_ids):
+        request = auth_pb2.GetUsersRequest(
+            user_ids=list(user_ids)
+        )
+        response = await self.stub.GetUsers(request, timeout=self.timeout)
+        return response
+
+    async def update_user(self, name, surname, email, password):
         request = auth_pb2.UpdateUserRequest(
             name=name,
             surname=surname,
             email=email,
             password=password
         )
-        response = self.stub.UpdateUser(request)
+        response = await self.stub.UpdateUser(request, timeout=self.timeout)
         return response
 
-    def update_user_img(self, email, img_url):
+    async def update_user_img(self, email, img_url):
         request = auth_pb2.UpdateUserImageRequest(
             email=email,
             img_url=img_url
         )
-        response = self.stub.UpdateUserImage(request)
+        response = await self.stub.UpdateUserImage(request, timeout=self.timeout)
         return response
 
-    def delete_user(self, email):
+    async def delete_user(self, email):
         request = auth_pb2.DeleteUserRequest(
             email=email
         )
-        response = self.stub.DeleteUser(request)
+        response = await self.stub.DeleteUser(request, timeout=self.timeout)
         return response
 
-    def search_users(self, substr: str):
+    async def search_users(self, substr: str, page_size: int = 0, page_token: str = ""):
         request = auth_pb2.SearchUsersRequest(
-            substr=substr
+            substr=substr,
+            page_size=page_size,
+            page_token=page_token
         )
-        response = self.stub.SearchUsers(request)
+        response = await self.stub.SearchUsers(request, timeout=self.timeout)
         return response
 
-    def init_db(self, num):
+    async def init_db(self, num):
         request = auth_pb2.InitDBRequest(
             num=num
         )
-        response = self.stub.InitDB(request)
+        response = await self.stub.InitDB(request, timeout=self.timeout)
         return response
+
+
+async def get_auth_client() -> AuthGrpcClient:
+    return AuthGrpcClient(
+        channel_registry.channel("auth"), timeout=get_settings().GRPC_DEADLINE
+    )
@@ -0,0 +1,101 @@
+import itertools
+import logging
+from typing import Dict, List
+
+import grpc
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledChannel:
+    def __init__(self, target: str, options: list):
+        self.target = target
+        self.options = options
+        self.channel = grpc.aio.insecure_channel(target, options=options)
+
+    def reconnect(self):
+        # The old channel is already shut down, nothing left to close
+        self.channel = grpc.aio.insecure_channel(self.target, options=self.options)
+        logger.warning("[gRPC] Reconnected channel to %s", self.target)
+
+    @property
+    def state(self) -> grpc.ChannelConnectivity:
+        return self.channel.get_state(try_to_connect=True)
+
+    @property
+    def healthy(self) -> bool:
+        return self.state not in (
+            grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+            grpc.ChannelConnectivity.SHUTDOWN,
+        )
+
+
+class GrpcChannelRegistry:
+    """Long-lived grpc.aio channels shared by every request of the gateway.
+
+    Each backend gets ``channels_per_target`` channels for every replica
+    address; ``channel(name)`` hands them out round-robin and skips channels
+    whose connectivity state is a failure.
+
+    aio channels are bound to the event loop they were created on, so
+    ``configure`` must be called from the running loop (``main.lifespan``).
+    """
+
+    def __init__(self):
+        self._backends: Dict[str, List[_PooledChannel]] = {}
+        self._cycles: Dict[str, itertools.cycle] = {}
+
+    def configure(
+        self,
+        targets: Dict[str, List[str]],
+        channels_per_target: int = 1,
+        keepalive_time_ms: int = 30000,
+        keepalive_timeout_ms: int = 10000,
+    ):
+        options = [
+            ("grpc.keepalive_time_ms", keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+            # Spread calls over every address the name resolves to
+            ("grpc.lb_policy_name", "round_robin"),
+            # Without this, channels to the same target share one subchannel
+            ("grpc.use_local_subchannel_pool", 1),
+        ]
+
+        for name, addresses in targets.items():
+            pool = [
+                _PooledChannel(address, options)
+                for address in addresses
+                for _ in range(channels_per_target)
+            ]
+            self._backends[name] = pool
+            self._cycles[name] = itertools.cycle(pool)
+
+    def channel(self, name: str) -> grpc.aio.Channel:
+        if name not in self._backends:
+            raise RuntimeError(f"gRPC backend '{name}' is not configured")
+
+        pool = self._backends[name]
+        cycle = self._cycles[name]
+        for _ in range(len(pool)):
+            pooled = next(cycle)
+            if pooled.healthy:
+                return pooled.channel
+
+        # Every channel is failing: recreate the next one if it was shut
+        # down, otherwise let gRPC retry the connection with its own backoff
+        pooled = next(cycle)
+        if pooled.state == grpc.ChannelConnectivity.SHUTDOWN:
+            pooled.reconnect()
+        return pooled.channel
+
+    async def close(self):
+        for pool in self._backends.values():
+            for pooled in pool:
+                await pooled.channel.close()
+        self._backends.clear()
+        self._cycles.clear()
+
+
+channel_registry = GrpcChannelRegistry()
@@ -1,15 +1,20 @@
 import grpc
 
 from models.pm_models import CreateSprintRequest
+from config import get_settings
+from clients.grpc.channels import channel_registry
 from proto.pm import pm_pb2, pm_pb2_grpc
 
 
 class PmGrpcClient:
-    def __init__(self, host="pm_service", port=50052):
-        self.channel = grpc.insecure_channel(f"{host}:{port}")
+    def __init__(
+        self, channel=None, host="pm_service", port=50052, timeout=None
+    ):
+        self.channel = channel or grpc.aio.insecure_channel(f"{host}:{port}")
+        self.timeout = timeout
         self.stub = pm_pb2_grpc.ProjectServiceStub(self.channel)
 
-    def create_project(self, name, description, color, img_url, type, users):
+    async def create_project(self, name, description, color, img_url, type, users):
 
         users_ready = list()
 
@@ -26,62 +31,62 @@ class PmGrpcClient:
             type=type,
             users=users_ready,
         )
-        res = self.stub.CreateProject(req)
+        res = await self.stub.CreateProject(req, timeout=self.timeout)
         return res
 
-    def get_project(self, project_id):
+    async def get_project(self, project_id):
         req = pm_pb2.GetProjectRequest(project_id=project_id)
-        res = self.stub.GetProject(req)
+        res = await self.stub.GetProject(req, timeout=self.timeout)
         return res
 
-    def update_project(self, project_id, name, description, color, type):
+    async def update_project(self, project_id, name, description, color, type):
         req = pm_pb2.UpdateProjectRequest(
             id=project_id, name=name, description=description, color=color, type=type
         )
-        res = self.stub.UpdateProject(req)
+        res = await self.stub.UpdateProject(req, timeout=self.timeout)
         return res
 
-    def update_project_img(self, project_id, img_url):
+    async def update_project_img(self, project_id, img_url):
         req = pm_pb2.UpdateProjectImgRequest(id=project_id, img_url=img_url)
-        res = self.stub.UpdateProjectImg(req)
+        res = await self.stub.UpdateProjectImg(req, timeout=self.timeout)
         return res
 
-    def update_project_users(self, project_id, users):
+    async def update_project_users(self, project_id, users):
         users_grpc = []
 
         for u in users:
             users_grpc.append(pm_pb2.UserRole(id=u.id, role=u.role))
 
         req = pm_pb2.UpdateProjectUsersRequest(id=project_id, users=users_grpc)
-        res = self.stub.UpdateProjectUsers(req)
+        res = await self.stub.UpdateProjectUsers(req, timeout=self.timeout)
         return res
 
-    def delete_project(self, project_id):
+    async def delete_project(self, project_id):
         req = pm_pb2.DeleteProjectRequest(id=project_id)
-        res = self.stub.DeleteProject(req)
+        res = await self.stub.DeleteProject(req, timeout=self.timeout)
         return res
 
-    def get_project_users(self, project_id):
+    async def get_project_users(self, project_id):
         req = pm_pb2.GetProjectUsersRequest(project_id=project_id)
-        res = self.stub.GetProjectUsers(req)
+        res = await self.stub.GetProjectUsers(req, timeout=self.timeout)
         return res
 
-    def get_user_projects(self, user_id):
+    async def get_user_projects(self, user_id):
         req = pm_pb2.GetUserProjectsRequest(user_id=user_id)
-        res = self.stub.GetUserProjects(req)
+        res = await self.stub.GetUserProjects(req, timeout=self.timeout)
         return res
 
-    def get_sprint(self, id):
+    async def get_sprint(self, id):
         req = pm_pb2.GetSprintRequest(id=id)
-        res = self.stub.GetSprint(req)
+        res = await self.stub.GetSprint(req, timeout=self.timeout)
         return res
 
-    def get_project_sprints(self, project_id):
+    async def get_project_sprints(self, project_id):
         req = pm_pb2.GetProjectSprintsRequest(project_id=project_id)
-        res = self.stub.GetProjectSprints(req)
+        res = await self.stub.GetProjectSprints(req, timeout=self.timeout)
         return res
 
-    def create_sprint(
+    async def create_sprint(
         self, name, description, start_date, end_date, is_started, project_id, tasks
     ):
         req = pm_pb2.CreateSprintRequest(
@@ -93,10 +98,10 @@ class PmGrpcClient:
             project_id=project_id,
             tasks=tasks,
         )
-        res = self.stub.CreateSprint(req)
+        res = await self.stub.CreateSprint(req, timeout=self.timeout)
         return res
 
-    def update_sprint(
+    async def update_sprint(
         self, id, name, description, start_date, end_date, is_started, project_id, tasks
     ):
         req = pm_pb2.UpdateSprintRequest(
@@ -109,25 +114,25 @@ class PmGrpcClient:
             project_id=project_id,
             tasks=tasks,
         )
-        res = self.stub.UpdateSprint(req)
+        res = await self.stub.UpdateSprint(req, timeout=self.timeout)
         return res
 
-    def delete_sprint(self, id):
+    async def delete_sprint(self, id):
         req = pm_pb2.DeleteSprintRequest(id=id)
-        res = self.stub.DeleteSprint(req)
+        res = await self.stub.DeleteSprint(req, timeout=self.timeout)
         return res
 
-    def get_epic(self, id):
+    async def get_epic(self, id):
         req = pm_pb2.GetEpicRequest(id=id)
-        res = self.stub.GetEpic(req)
+        res = await self.stub.GetEpic(req, timeout=self.timeout)
         return res
 
-    def get_project_epics(self, project_id):
+    async def get_project_epics(self, project_id):
         req = pm_pb2.GetProjectEpicsRequest(project_id=project_id)
-        res = self.stub.GetProjectEpics(req)
+        res = await self.stub.GetProjectEpics(req, timeout=self.timeout)
         return res
 
-    def create_epic(
+    async def create_epic(
         self, name, description, priority, start_date, end_date, project_id, tasks
     ):
         req = pm_pb2.CreateEpicRequest(
@@ -139,10 +144,10 @@ class PmGrpcClient:
             project_id=project_id,
             tasks=tasks,
         )
-        res = self.stub.CreateEpic(req)
+        res = await self.stub.CreateEpic(req, timeout=self.timeout)
         return res
 
-    def update_epic(
+    async def update_epic(
         self, id, name, description, priority, start_date, end_date, project_id, tasks
     ):
         req = pm_pb2.UpdateEpicRequest(
@@ -155,10 +160,16 @@ class PmGrpcClient:
             project_id=project_id,
             tasks=tasks,
         )
-        res = self.stub.UpdateEpic(req)
+        res = await self.stub.UpdateEpic(req, timeout=self.timeout)
         return res
 
-    def delete_epic(self, id):
+    async def delete_epic(self, id):
         req = pm_pb2.DeleteEpicRequest(id=id)
-        res = self.stub.DeleteEpic(req)
+        res = await self.stub.DeleteEpic(req, timeout=self.timeout)
         return res
+
+
+async def get_pm_client() -> PmGrpcClient:
+    return PmGrpcClient(
+        channel_registry.channel("pm"), timeout=get_settings().GRPC_DEADLINE
+    )
@@ -1,46 +1,71 @@
 import grpc
 
+from config import get_settings
+from clients.grpc.channels import channel_registry
 from proto.task import task_pb2, task_pb2_grpc
 
 
 class TaskGrpcClient:
-    def __init__(self, host="task_service", port=50053):
-        self.channel = grpc.insecure_channel(f"{host}:{port}")
+    def __init__(
+        self, channel=None, host="task_service", port=50053, timeout=None
+    ):
+        self.channel = channel or grpc.aio.insecure_channel(f"{host}:{port}")
+        self.timeout = timeout
         self.stub = task_pb2_grpc.TaskServiceStub(self.channel)
 
-    def get_task(self, task_id):
+    async def get_task(self, task_id):
         req = task_pb2.GetTaskRequest(
             id=task_id
         )
 
-        res = self.stub.GetTask(req)
+        res = await self.stub.GetTask(req, timeout=self.timeout)
         return res
 
-    def get_project_tasks(self, project_id):
+    async def get_project_tasks(self, project_id):
         req = task_pb2.GetProjectTasksRequest(
             project_id=project_id
         )
 
-        res = self.stub.GetProjectTasks(req)
+        res = await self.stub.GetProjectTasks(req, timeout=self.timeout)
         return res
 
-    def get_sprint_tasks(self, sprint_id):
+    async def list_tasks(self, project_id="", sprint_id="", epic_id="", **filters):
+        req = task_pb2.ListTasksRequest(
+            project_id=project_id,
+            sprint_id=sprint_id,
+            epic_id=epic_id,
+            **filters
+        )
+
+        res = await self.stub.ListTasks(req, timeout=self.timeout)
+        return res
+
+    def stream_project_tasks(self, project_id, chunk_size=0, timeout=None):
+        req = task_pb2.StreamProjectTasksRequest(
+            project_id=project_id,
+            chunk_size=chunk_size
+        )
+
+        # The call is async-iterable, one TasksResponse per chunk
+        return self.stub.StreamProjectTasks(req, timeout=timeout or self.timeout)
+
+    async def get_sprint_tasks(self, sprint_id):
         req = task_pb2.GetSprintTasksRequest(
             sprint_id=sprint_id
         )
 
-        res = self.stub.GetSprintTasks(req)
+        res = await self.stub.GetSprintTasks(req, timeout=self.timeout)
         return res
 
-    def get_epic_tasks(self, epic_id):
+    async def get_epic_tasks(self, epic_id):
         req = task_pb2.GetEpicTasksRequest(
             epic_id=epic_id
         )
 
-        res = self.stub.GetEpicTasks(req)
+        res = await self.stub.GetEpicTasks(req, timeout=self.timeout)
         return res
 
-    def create_task(
+    async def create_task(
         self,
         title,
         description,
@@ -66,10 +91,10 @@ class TaskGrpcClient:
             end_date=end_date
         )
 
-        res = self.stub.CreateTask(req)
+        res = await self.stub.CreateTask(req, timeout=self.timeout)
         return res
 
-    def update_task(
+    async def update_task(
         self,
         id,
         title,
@@ -99,13 +124,35 @@ class TaskGrpcClient:
             end_date=end_date
         )
 
-        res = self.stub.UpdateTask(req)
+        res = await self.stub.UpdateTask(req, timeout=self.timeout)
         return res
 
-    def delete_task(self, task_id):
+    async def delete_task(self, task_id):
         req = task_pb2.DeleteTaskRequest(
             id=task_id
         )
 
-        res = self.stub.DeleteTask(req)
+        res = await self.stub.DeleteTask(req, timeout=self.timeout)
+        return res
+
+    async def batch_create_tasks(self, tasks):
+        req = task_pb2.BatchCreateTasksRequest(
+            tasks=[task_pb2.CreateTaskRequest(**task) for task in tasks]
+        )
+
+        res = await self.stub.BatchCreateTasks(req, timeout=self.timeout)
         return res
+
+    async def batch_update_tasks(self, tasks):
+        req = task_pb2.BatchUpdateTasksRequest(
+            tasks=[task_pb2.UpdateTaskRequest(**task) for task in tasks]
+        )
+
+        res = await self.stub.BatchUpdateTasks(req, timeout=self.timeout)
+        return res
+
+
+async def get_task_client() -> TaskGrpcClient:
+    return TaskGrpcClient(
+        channel_registry.channel("task"), timeout=get_settings().GRPC_DEADLINE
+    )
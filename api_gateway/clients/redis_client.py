@@ -1,6 +1,8 @@
 import redis
+import redis.asyncio
 from config import get_settings
 
 settings = get_settings()
 
 redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+async_redis_client = redis.asyncio.Redis.from_url(settings.REDIS_URL, decode_responses=True)
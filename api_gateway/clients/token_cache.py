@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set
+
+import redis
+
+from models.auth_models import User
+
+logger = logging.getLogger(__name__)
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+class TokenCache:
+    """Bounded LRU of access tokens that already passed ``jwt.decode``.
+
+    Entries are keyed by the SHA-256 of the token, so raw tokens are never
+    kept in memory, and live until the token's own ``exp``. Tokens carry the
+    ``jti`` of their login session; ``revoke(jti)`` drops every cached token
+    of that session, which is how logouts reach other gateway processes
+    through ``RevocationListener``.
+    """
+
+    def __init__(self, max_size: int = 0):
+        self.max_size = max_size
+        self._items: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._by_jti: Dict[str, Set[bytes]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revoked = 0
+
+    def configure(self, max_size: int):
+        with self._lock:
+            self.max_size = max_size
+            while len(self._items) > max(max_size, 0):
+                old_key, (_, _, old_jti) = self._items.popitem(last=False)
+                self._unlink(old_key, old_jti)
+
+    def get(self, token: str) -> Optional[User]:
+        key = _digest(token)
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+            user, exp, jti = item
+            if exp <= time.time():
+                self._drop(key, jti)
+                self._misses += 1
+                return None
+            self._items.move_to_end(key)
+            self._hits += 1
+            return user
+
+    def put(self, token: str, user: User, exp: float, jti: Optional[str]):
+        if self.max_size <= 0:
+            return
+        key = _digest(token)
+        with self._lock:
+            self._items[key] = (user, exp, jti)
+            self._items.move_to_end(key)
+            if jti:
+                self._by_jti.setdefault(jti, set()).add(key)
+            while len(self._items) > self.max_size:
+                old_key, (_, _, old_jti) = self._items.popitem(last=False)
+                self._unlink(old_key, old_jti)
+
+    def revoke(self, jti: str):
+        with self._lock:
+            for key in self._by_jti.pop(jti, ()):
+                self._items.pop(key, None)
+                self._revoked += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._by_jti.clear()
+
+    def _drop(self, key: bytes, jti: Optional[str]):
+        self._items.pop(key, None)
+        self._unlink(key, jti)
+
+    def _unlink(self, key: bytes, jti: Optional[str]):
+        if not jti:
+            return
+        keys = self._by_jti.get(jti)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_jti[jti]
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "jwt_cache_size": float(len(self._items)),
+                "jwt_cache_hits": float(self._hits),
+                "jwt_cache_misses": float(self._misses),
+                "jwt_cache_revoked": float(self._revoked),
+                "jwt_cache_hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
+
+
+class RevocationListener:
+    """Evicts revoked sessions from a ``TokenCache`` as logouts are published.
+
+    Subscribes to ``channel`` with a redis.asyncio client; every message is a
+    ``jti``. Messages published while the subscription was down are lost, so
+    the cache is cleared each time the listener (re)subscribes.
+    """
+
+    def __init__(self, client, channel: str, cache: TokenCache, retry_delay: float = 1.0):
+        self.client = client
+        self.channel = channel
+        self.cache = cache
+        self.retry_delay = retry_delay
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self):
+        while True:
+            try:
+                async with self.client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    self.cache.clear()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.cache.revoke(message["data"])
+            except redis.RedisError as e:
+                logger.warning("[JWT] Revocation channel lost (%s), retrying", e)
+                await asyncio.sleep(self.retry_delay)
+
+
+# Disabled until ``main.lifespan`` configures it from the settings
+token_cache = TokenCache()
@@ -18,6 +18,27 @@ class Settings(BaseSettings):
 
     REDIS_URL: str = Field(env="REDIS_URL")
 
+    # Verified access tokens kept in memory per gateway process; 0 disables
+    JWT_CACHE_SIZE: int = Field(10000, env="JWT_CACHE_SIZE")
+    # Logouts publish the revoked jti here so every process evicts it
+    JWT_REVOCATION_CHANNEL: str = Field("jwt_revocations", env="JWT_REVOCATION_CHANNEL")
+
+    # Comma-separated "host:port" list, one entry per replica
+    AUTH_SERVICE: str = Field("auth_service:50051", env="AUTH_SERVICE")
+    PM_SERVICE: str = Field("pm_service:50052", env="PM_SERVICE")
+    TASK_SERVICE: str = Field("task_service:50053", env="TASK_SERVICE")
+    ANALYTICS_SERVICE: str = Field("analytics_service:50054", env="ANALYTICS_SERVICE")
+
+    GRPC_CHANNELS_PER_TARGET: int = Field(2, env="GRPC_CHANNELS_PER_TARGET")
+    # Also sent on idle channels; the services accept pings down to their
+    # GRPC_MIN_PING_INTERVAL_MS (10 s by default) apart, keep this above it
+    GRPC_KEEPALIVE_TIME_MS: int = Field(30000, env="GRPC_KEEPALIVE_TIME_MS")
+    GRPC_KEEPALIVE_TIMEOUT_MS: int = Field(10000, env="GRPC_KEEPALIVE_TIMEOUT_MS")
+    # Per-call deadline in seconds for every backend RPC
+    GRPC_DEADLINE: float = Field(5.0, env="GRPC_DEADLINE")
+    # Deadline in seconds for a whole server-streaming RPC
+    GRPC_STREAM_DEADLINE: float = Field(120.0, env="GRPC_STREAM_DEADLINE")
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -6,6 +6,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config import get_settings
 from clients.kafka_client import KafkaManager
+from clients.grpc.channels import channel_registry
+from clients.redis_client import async_redis_client
+from clients.token_cache import RevocationListener, token_cache
 from routers.auth_service import router as auth_router
 from routers.pm_service import router as pm_router
 from routers.task_service import router as task_router
@@ -34,6 +37,24 @@ async def lifespan(app: FastAPI):
 
     await asyncio.sleep(3)
 
+    channel_registry.configure(
+        targets={
+            "auth": settings.AUTH_SERVICE.split(","),
+            "pm": settings.PM_SERVICE.split(","),
+            "task": settings.TASK_SERVICE.split(","),
+            "analytics": settings.ANALYTICS_SERVICE.split(","),
+        },
+        channels_per_target=settings.GRPC_CHANNELS_PER_TARGET,
+        keepalive_time_ms=settings.GRPC_KEEPALIVE_TIME_MS,
+        keepalive_timeout_ms=settings.GRPC_KEEPALIVE_TIMEOUT_MS,
+    )
+
+    token_cache.configure(settings.JWT_CACHE_SIZE)
+    revocation_listener = RevocationListener(
+        async_redis_client, settings.JWT_REVOCATION_CHANNEL, token_cache
+    )
+    revocation_listener.start()
+
     app.state.kafka_manager = KafkaManager(
         bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
         update_topic="notifications_update",
@@ -55,6 +76,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("KafkaManager shutdown failed: %s", e)
 
+    await revocation_listener.stop()
+    await channel_registry.close()
+
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["auth"])
@@ -68,4 +92,5 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Page-Token"],
 )
@@ -36,6 +36,26 @@ class TaskResponse(BaseModel):
 
 class TasksResponse(BaseModel):
     tasks: list[TaskResponse] = []
+    # Set on a filtered or paged listing that has more pages
+    next_page_token: str | None = None
+
+
+class BatchCreateTasksRequest(BaseModel):
+    tasks: list[CreateTaskRequest]
+
+
+class BatchUpdateTasksRequest(BaseModel):
+    tasks: list[UpdateTaskRequest]
+
+
+class BatchTaskResult(BaseModel):
+    index: int
+    task: TaskResponse | None = None
+    error: str | None = None
+
+
+class BatchTasksResponse(BaseModel):
+    results: list[BatchTaskResult] = []
 
 
 class MessageResponse(BaseModel):
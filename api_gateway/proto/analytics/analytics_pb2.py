@@ -24,13 +24,15 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0f\x61nalytics.proto\x12\tanalytics\"(\n\x15GetTimelineAllRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"@\n\x19GetTimelineProjectRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\",\n\x19GetTimelineAllMineRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"D\n\x1dGetTimelineProjectMineRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\"Y\n\x08TaskInfo\x12\x11\n\ttask_name\x18\x01 \x01(\t\x12\x14\n\x0cproject_name\x18\x02 \x01(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\"6\n\x10TimelineResponse\x12\"\n\x05tasks\x18\x01 \x03(\x0b\x32\x13.analytics.TaskInfo\"4\n\x1eGetTasksCompletedByUserRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"H\n\tUserTasks\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tfull_name\x18\x02 \x01(\t\x12\x17\n\x0f\x63ompleted_tasks\x18\x03 \x03(\t\"G\n\x1cTasksCompletedByUserResponse\x12\'\n\tuser_task\x18\x01 \x03(\x0b\x32\x14.analytics.UserTasks\"4\n\x1eGetTasksStatusInSprintsRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"a\n\nSprintInfo\x12\x11\n\tsprint_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\x0f\x63ompleted_tasks\x18\x03 \x03(\t\x12\x19\n\x11uncompleted_tasks\x18\x04 \x03(\t\"F\n\x1cTasksStatusInSprintsResponse\x12&\n\x07sprints\x18\x01 \x03(\x0b\x32\x15.analytics.SprintInfo\"2\n\x1cGetTasksProgressByDayRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"%\n\x07\x44\x61yInfo\x12\x0b\n\x03\x64\x61y\x18\x01 \x01(\t\x12\r\n\x05tasks\x18\x02 \x03(\t\">\n\x1aTasksProgressByDayResponse\x12 \n\x04\x64\x61ys\x18\x01 \x03(\x0b\x32\x12.analytics.DayInfo2\xbd\x05\n\x10\x41nalyticsService\x12O\n\x0eGetTimelineAll\x12 .analytics.GetTimelineAllRequest\x1a\x1b.analytics.TimelineResponse\x12W\n\x12GetTimelineProject\x12$.analytics.GetTimelineProjectRequest\x1a\x1b.analytics.TimelineResponse\x12W\n\x12GetTimelineAllMine\x12$.analytics.GetTimelineAllMineRequest\x1a\x1b.analytics.TimelineResponse\x12_\n\x16GetTimelineProjectMine\x12(.analytics.GetTimelineProjectMineRequest\x1a\x1b.analytics.TimelineResponse\x12m\n\x17GetTasksCompletedByUser\x12).analytics.GetTasksCompletedByUserRequest\x1a\'.analytics.TasksCompletedByUserResponse\x12m\n\x17GetTasksStatusInSprints\x12).analytics.GetTasksStatusInSprintsRequest\x1a\'.analytics.TasksStatusInSprintsResponse\x12g\n\x15GetTasksProgressByDay\x12\'.analytics.GetTasksProgressByDayRequest\x1a%.analytics.TasksProgressByDayResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0f\x61nalytics.proto\x12\tanalytics\"(\n\x15GetTimelineAllRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"@\n\x19GetTimelineProjectRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\",\n\x19GetTimelineAllMineRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"D\n\x1dGetTimelineProjectMineRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\"Y\n\x08TaskInfo\x12\x11\n\ttask_name\x18\x01 \x01(\t\x12\x14\n\x0cproject_name\x18\x02 \x01(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\"6\n\x10TimelineResponse\x12\"\n\x05tasks\x18\x01 \x03(\x0b\x32\x13.analytics.TaskInfo\"4\n\x1eGetTasksCompletedByUserRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"H\n\tUserTasks\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tfull_name\x18\x02 \x01(\t\x12\x17\n\x0f\x63ompleted_tasks\x18\x03 \x03(\t\"G\n\x1cTasksCompletedByUserResponse\x12\'\n\tuser_task\x18\x01 \x03(\x0b\x32\x14.analytics.UserTasks\"4\n\x1eGetTasksStatusInSprintsRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"a\n\nSprintInfo\x12\x11\n\tsprint_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\x0f\x63ompleted_tasks\x18\x03 \x03(\t\x12\x19\n\x11uncompleted_tasks\x18\x04 \x03(\t\"F\n\x1cTasksStatusInSprintsResponse\x12&\n\x07sprints\x18\x01 \x03(\x0b\x32\x15.analytics.SprintInfo\"2\n\x1cGetTasksProgressByDayRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"%\n\x07\x44\x61yInfo\x12\x0b\n\x03\x64\x61y\x18\x01 \x01(\t\x12\r\n\x05tasks\x18\x02 \x03(\t\">\n\x1aTasksProgressByDayResponse\x12 \n\x04\x64\x61ys\x18\x01 \x03(\x0b\x32\x12.analytics.DayInfo\"\x10\n\x0eMetricsRequest\"x\n\x0fMetricsResponse\x12\x36\n\x06values\x18\x01 \x03(\x0b\x32&.analytics.MetricsResponse.ValuesEntry\x1a-\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x32\x82\x06\n\x10\x41nalyticsService\x12O\n\x0eGetTimelineAll\x12 .analytics.GetTimelineAllRequest\x1a\x1b.analytics.TimelineResponse\x12W\n\x12GetTimelineProject\x12$.analytics.GetTimelineProjectRequest\x1a\x1b.analytics.TimelineResponse\x12W\n\x12GetTimelineAllMine\x12$.analytics.GetTimelineAllMineRequest\x1a\x1b.analytics.TimelineResponse\x12_\n\x16GetTimelineProjectMine\x12(.analytics.GetTimelineProjectMineRequest\x1a\x1b.analytics.TimelineResponse\x12m\n\x17GetTasksCompletedByUser\x12).analytics.GetTasksCompletedByUserRequest\x1a\'.analytics.TasksCompletedByUserResponse\x12m\n\x17GetTasksStatusInSprints\x12).analytics.GetTasksStatusInSprintsRequest\x1a\'.analytics.TasksStatusInSprintsResponse\x12g\n\x15GetTasksProgressByDay\x12\'.analytics.GetTasksProgressByDayRequest\x1a%.analytics.TasksProgressByDayResponse\x12\x43\n\nGetMetrics\x12\x19.analytics.MetricsRequest\x1a\x1a.analytics.MetricsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'analytics_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_METRICSRESPONSE_VALUESENTRY']._loaded_options = None
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_options = b'8\001'
   _globals['_GETTIMELINEALLREQUEST']._serialized_start=30
   _globals['_GETTIMELINEALLREQUEST']._serialized_end=70
   _globals['_GETTIMELINEPROJECTREQUEST']._serialized_start=72
@@ -61,6 +63,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_DAYINFO']._serialized_end=916
   _globals['_TASKSPROGRESSBYDAYRESPONSE']._serialized_start=918
   _globals['_TASKSPROGRESSBYDAYRESPONSE']._serialized_end=980
-  _globals['_ANALYTICSSERVICE']._serialized_start=983
-  _globals['_ANALYTICSSERVICE']._serialized_end=1684
+  _globals['_METRICSREQUEST']._serialized_start=982
+  _globals['_METRICSREQUEST']._serialized_end=998
+  _globals['_METRICSRESPONSE']._serialized_start=1000
+  _globals['_METRICSRESPONSE']._serialized_end=1120
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_start=1075
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_end=1120
+  _globals['_ANALYTICSSERVICE']._serialized_start=1123
+  _globals['_ANALYTICSSERVICE']._serialized_end=1893
 # @@protoc_insertion_point(module_scope)
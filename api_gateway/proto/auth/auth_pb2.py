@@ -24,39 +24,51 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nauth.proto\x12\x04\x61uth\"d\n\x11\x43reateUserRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07surname\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x10\n\x08password\x18\x04 \x01(\t\x12\x0f\n\x07img_url\x18\x05 \x01(\t\"3\n\x10LoginUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"!\n\x0eGetUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"S\n\x11UpdateUserRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07surname\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x10\n\x08password\x18\x04 \x01(\t\"8\n\x16UpdateUserImageRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0f\n\x07img_url\x18\x02 \x01(\t\"\"\n\x11\x44\x65leteUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"2\n\x0fMessageResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"o\n\x0cUserResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x0f\n\x07surname\x18\x05 \x01(\t\x12\x0f\n\x07img_url\x18\x06 \x01(\t\"$\n\x12SearchUsersRequest\x12\x0e\n\x06substr\x18\x01 \x01(\t\"I\n\x08UserInfo\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07surname\x18\x03 \x01(\t\x12\r\n\x05\x65mail\x18\x04 \x01(\t\"4\n\x13SearchUsersResponse\x12\x1d\n\x05users\x18\x01 \x03(\x0b\x32\x0e.auth.UserInfo\"\x1c\n\rInitDBRequest\x12\x0b\n\x03num\x18\x01 \x01(\x05\" \n\x0eInitDBResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x32\xed\x03\n\x0b\x41uthService\x12\x39\n\nCreateUser\x12\x17.auth.CreateUserRequest\x1a\x12.auth.UserResponse\x12\x37\n\tLoginUser\x12\x16.auth.LoginUserRequest\x1a\x12.auth.UserResponse\x12\x33\n\x07GetUser\x12\x14.auth.GetUserRequest\x1a\x12.auth.UserResponse\x12\x39\n\nUpdateUser\x12\x17.auth.UpdateUserRequest\x1a\x12.auth.UserResponse\x12\x43\n\x0fUpdateUserImage\x12\x1c.auth.UpdateUserImageRequest\x1a\x12.auth.UserResponse\x12<\n\nDeleteUser\x12\x17.auth.DeleteUserRequest\x1a\x15.auth.MessageResponse\x12\x42\n\x0bSearchUsers\x12\x18.auth.SearchUsersRequest\x1a\x19.auth.SearchUsersResponse\x12\x33\n\x06InitDB\x12\x13.auth.InitDBRequest\x1a\x14.auth.InitDBResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nauth.proto\x12\x04\x61uth\"d\n\x11\x43reateUserRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07surname\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x10\n\x08password\x18\x04 \x01(\t\x12\x0f\n\x07img_url\x18\x05 \x01(\t\"3\n\x10LoginUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"!\n\x0eGetUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"#\n\x0fGetUsersRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\t\"5\n\x10GetUsersResponse\x12!\n\x05users\x18\x01 \x03(\x0b\x32\x12.auth.UserResponse\"S\n\x11UpdateUserRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07surname\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x10\n\x08password\x18\x04 \x01(\t\"8\n\x16UpdateUserImageRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0f\n\x07img_url\x18\x02 \x01(\t\"\"\n\x11\x44\x65leteUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"2\n\x0fMessageResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"o\n\x0cUserResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x0f\n\x07surname\x18\x05 \x01(\t\x12\x0f\n\x07img_url\x18\x06 \x01(\t\"K\n\x12SearchUsersRequest\x12\x0e\n\x06substr\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\"I\n\x08UserInfo\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07surname\x18\x03 \x01(\t\x12\r\n\x05\x65mail\x18\x04 \x01(\t\"M\n\x13SearchUsersResponse\x12\x1d\n\x05users\x18\x01 \x03(\x0b\x32\x0e.auth.UserInfo\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\x1c\n\rInitDBRequest\x12\x0b\n\x03num\x18\x01 \x01(\x05\" \n\x0eInitDBResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\"\x10\n\x0eMetricsRequest\"s\n\x0fMetricsResponse\x12\x31\n\x06values\x18\x01 \x03(\x0b\x32!.auth.MetricsResponse.ValuesEntry\x1a-\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x32\xe3\x04\n\x0b\x41uthService\x12\x39\n\nCreateUser\x12\x17.auth.CreateUserRequest\x1a\x12.auth.UserResponse\x12\x37\n\tLoginUser\x12\x16.auth.LoginUserRequest\x1a\x12.auth.UserResponse\x12\x33\n\x07GetUser\x12\x14.auth.GetUserRequest\x1a\x12.auth.UserResponse\x12\x39\n\x08GetUsers\x12\x15.auth.GetUsersRequest\x1a\x16.auth.GetUsersResponse\x12\x39\n\nUpdateUser\x12\x17.auth.UpdateUserRequest\x1a\x12.auth.UserResponse\x12\x43\n\x0fUpdateUserImage\x12\x1c.auth.UpdateUserImageRequest\x1a\x12.auth.UserResponse\x12<\n\nDeleteUser\x12\x17.auth.DeleteUserRequest\x1a\x15.auth.MessageResponse\x12\x42\n\x0bSearchUsers\x12\x18.auth.SearchUsersRequest\x1a\x19.auth.SearchUsersResponse\x12\x33\n\x06InitDB\x12\x13.auth.InitDBRequest\x1a\x14.auth.InitDBResponse\x12\x39\n\nGetMetrics\x12\x14.auth.MetricsRequest\x1a\x15.auth.MetricsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'auth_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_METRICSRESPONSE_VALUESENTRY']._loaded_options = None
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_options = b'8\001'
   _globals['_CREATEUSERREQUEST']._serialized_start=20
   _globals['_CREATEUSERREQUEST']._serialized_end=120
   _globals['_LOGINUSERREQUEST']._serialized_start=122
   _globals['_LOGINUSERREQUEST']._serialized_end=173
   _globals['_GETUSERREQUEST']._serialized_start=175
   _globals['_GETUSERREQUEST']._serialized_end=208
-  _globals['_UPDATEUSERREQUEST']._serialized_start=210
-  _globals['_UPDATEUSERREQUEST']._serialized_end=293
-  _globals['_UPDATEUSERIMAGEREQUEST']._serialized_start=295
-  _globals['_UPDATEUSERIMAGEREQUEST']._serialized_end=351
-  _globals['_DELETEUSERREQUEST']._serialized_start=353
-  _globals['_DELETEUSERREQUEST']._serialized_end=387
-  _globals['_MESSAGERESPONSE']._serialized_start=389
-  _globals['_MESSAGERESPONSE']._serialized_end=439
-  _globals['_USERRESPONSE']._serialized_start=441
-  _globals['_USERRESPONSE']._serialized_end=552
-  _globals['_SEARCHUSERSREQUEST']._serialized_start=554
-  _globals['_SEARCHUSERSREQUEST']._serialized_end=590
-  _globals['_USERINFO']._serialized_start=592
-  _globals['_USERINFO']._serialized_end=665
-  _globals['_SEARCHUSERSRESPONSE']._serialized_start=667
-  _globals['_SEARCHUSERSRESPONSE']._serialized_end=719
-  _globals['_INITDBREQUEST']._serialized_start=721
-  _globals['_INITDBREQUEST']._serialized_end=749
-  _globals['_INITDBRESPONSE']._serialized_start=751
-  _globals['_INITDBRESPONSE']._serialized_end=783
-  _globals['_AUTHSERVICE']._serialized_start=786
-  _globals['_AUTHSERVICE']._serialized_end=1279
+  _globals['_GETUSERSREQUEST']._serialized_start=210
+  _globals['_GETUSERSREQUEST']._serialized_end=245
+  _globals['_GETUSERSRESPONSE']._serialized_start=247
+  _globals['_GETUSERSRESPONSE']._serialized_end=300
+  _globals['_UPDATEUSERREQUEST']._serialized_start=302
+  _globals['_UPDATEUSERREQUEST']._serialized_end=385
+  _globals['_UPDATEUSERIMAGEREQUEST']._serialized_start=387
+  _globals['_UPDATEUSERIMAGEREQUEST']._serialized_end=443
+  _globals['_DELETEUSERREQUEST']._serialized_start=445
+  _globals['_DELETEUSERREQUEST']._serialized_end=479
+  _globals['_MESSAGERESPONSE']._serialized_start=481
+  _globals['_MESSAGERESPONSE']._serialized_end=531
+  _globals['_USERRESPONSE']._serialized_start=533
+  _globals['_USERRESPONSE']._serialized_end=644
+  _globals['_SEARCHUSERSREQUEST']._serialized_start=646
+  _globals['_SEARCHUSERSREQUEST']._serialized_end=721
+  _globals['_USERINFO']._serialized_start=723
+  _globals['_USERINFO']._serialized_end=796
+  _globals['_SEARCHUSERSRESPONSE']._serialized_start=798
+  _globals['_SEARCHUSERSRESPONSE']._serialized_end=875
+  _globals['_INITDBREQUEST']._serialized_start=877
+  _globals['_INITDBREQUEST']._serialized_end=905
+  _globals['_INITDBRESPONSE']._serialized_start=907
+  _globals['_INITDBRESPONSE']._serialized_end=939
+  _globals['_METRICSREQUEST']._serialized_start=941
+  _globals['_METRICSREQUEST']._serialized_end=957
+  _globals['_METRICSRESPONSE']._serialized_start=959
+  _globals['_METRICSRESPONSE']._serialized_end=1074
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_start=1029
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_end=1074
+  _globals['_AUTHSERVICE']._serialized_start=1077
+  _globals['_AUTHSERVICE']._serialized_end=1688
 # @@protoc_insertion_point(module_scope)
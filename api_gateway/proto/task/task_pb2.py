@@ -24,33 +24,55 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ntask.proto\x12\x04task\"\x1c\n\x0eGetTaskRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\xe1\x01\n\x0cTaskResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12\x0c\n\x04type\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x13\n\x0b\x61ssigned_to\x18\x07 \x01(\t\x12\x0f\n\x07\x65pic_id\x18\x08 \x01(\t\x12\x11\n\tsprint_id\x18\t \x01(\t\x12\x12\n\nproject_id\x18\n \x01(\t\x12\x12\n\nstart_date\x18\x0b \x01(\t\x12\x10\n\x08\x65nd_date\x18\x0c \x01(\t\",\n\x16GetProjectTasksRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"*\n\x15GetSprintTasksRequest\x12\x11\n\tsprint_id\x18\x01 \x01(\t\"&\n\x13GetEpicTasksRequest\x12\x0f\n\x07\x65pic_id\x18\x01 \x01(\t\"2\n\rTasksResponse\x12!\n\x05tasks\x18\x01 \x03(\x0b\x32\x12.task.TaskResponse\"\xca\x01\n\x11\x43reateTaskRequest\x12\r\n\x05title\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x10\n\x08priority\x18\x03 \x01(\x05\x12\x0c\n\x04type\x18\x04 \x01(\t\x12\x13\n\x0b\x61ssigned_to\x18\x05 \x01(\t\x12\x0f\n\x07\x65pic_id\x18\x06 \x01(\t\x12\x11\n\tsprint_id\x18\x07 \x01(\t\x12\x12\n\nproject_id\x18\x08 \x01(\t\x12\x12\n\nstart_date\x18\t \x01(\t\x12\x10\n\x08\x65nd_date\x18\n \x01(\t\"\xe6\x01\n\x11UpdateTaskRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12\x0c\n\x04type\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x13\n\x0b\x61ssigned_to\x18\x07 \x01(\t\x12\x0f\n\x07\x65pic_id\x18\x08 \x01(\t\x12\x11\n\tsprint_id\x18\t \x01(\t\x12\x12\n\nproject_id\x18\n \x01(\t\x12\x12\n\nstart_date\x18\x0b \x01(\t\x12\x10\n\x08\x65nd_date\x18\x0c \x01(\t\"\x1f\n\x11\x44\x65leteTaskRequest\x12\n\n\x02id\x18\x01 \x01(\t\"5\n\x12\x44\x65leteTaskResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t2\xc3\x03\n\x0bTaskService\x12\x33\n\x07GetTask\x12\x14.task.GetTaskRequest\x1a\x12.task.TaskResponse\x12\x44\n\x0fGetProjectTasks\x12\x1c.task.GetProjectTasksRequest\x1a\x13.task.TasksResponse\x12\x42\n\x0eGetSprintTasks\x12\x1b.task.GetSprintTasksRequest\x1a\x13.task.TasksResponse\x12>\n\x0cGetEpicTasks\x12\x19.task.GetEpicTasksRequest\x1a\x13.task.TasksResponse\x12\x39\n\nCreateTask\x12\x17.task.CreateTaskRequest\x1a\x12.task.TaskResponse\x12\x39\n\nUpdateTask\x12\x17.task.UpdateTaskRequest\x1a\x12.task.TaskResponse\x12?\n\nDeleteTask\x12\x17.task.DeleteTaskRequest\x1a\x18.task.DeleteTaskResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ntask.proto\x12\x04task\"\x1c\n\x0eGetTaskRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\xe1\x01\n\x0cTaskResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12\x0c\n\x04type\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x13\n\x0b\x61ssigned_to\x18\x07 \x01(\t\x12\x0f\n\x07\x65pic_id\x18\x08 \x01(\t\x12\x11\n\tsprint_id\x18\t \x01(\t\x12\x12\n\nproject_id\x18\n \x01(\t\x12\x12\n\nstart_date\x18\x0b \x01(\t\x12\x10\n\x08\x65nd_date\x18\x0c \x01(\t\",\n\x16GetProjectTasksRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"C\n\x19StreamProjectTasksRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x12\n\nchunk_size\x18\x02 \x01(\x05\"*\n\x15GetSprintTasksRequest\x12\x11\n\tsprint_id\x18\x01 \x01(\t\"&\n\x13GetEpicTasksRequest\x12\x0f\n\x07\x65pic_id\x18\x01 \x01(\t\"2\n\rTasksResponse\x12!\n\x05tasks\x18\x01 \x03(\x0b\x32\x12.task.TaskResponse\"\x99\x02\n\x10ListTasksRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\tsprint_id\x18\x02 \x01(\t\x12\x0f\n\x07\x65pic_id\x18\x03 \x01(\t\x12\x10\n\x08statuses\x18\x04 \x03(\t\x12\r\n\x05types\x18\x05 \x03(\t\x12\x13\n\x0b\x61ssigned_to\x18\x06 \x03(\t\x12\x14\n\x0cmin_priority\x18\x07 \x01(\x05\x12\x14\n\x0cmax_priority\x18\x08 \x01(\x05\x12\x11\n\tdate_from\x18\t \x01(\t\x12\x0f\n\x07\x64\x61te_to\x18\n \x01(\t\x12\x0c\n\x04sort\x18\x0b \x01(\t\x12\x12\n\ndescending\x18\x0c \x01(\x08\x12\x11\n\tpage_size\x18\r \x01(\x05\x12\x12\n\npage_token\x18\x0e \x01(\t\"O\n\x11ListTasksResponse\x12!\n\x05tasks\x18\x01 \x03(\x0b\x32\x12.task.TaskResponse\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xca\x01\n\x11\x43reateTaskRequest\x12\r\n\x05title\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x10\n\x08priority\x18\x03 \x01(\x05\x12\x0c\n\x04type\x18\x04 \x01(\t\x12\x13\n\x0b\x61ssigned_to\x18\x05 \x01(\t\x12\x0f\n\x07\x65pic_id\x18\x06 \x01(\t\x12\x11\n\tsprint_id\x18\x07 \x01(\t\x12\x12\n\nproject_id\x18\x08 \x01(\t\x12\x12\n\nstart_date\x18\t \x01(\t\x12\x10\n\x08\x65nd_date\x18\n \x01(\t\"\xe6\x01\n\x11UpdateTaskRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12\x0c\n\x04type\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x13\n\x0b\x61ssigned_to\x18\x07 \x01(\t\x12\x0f\n\x07\x65pic_id\x18\x08 \x01(\t\x12\x11\n\tsprint_id\x18\t \x01(\t\x12\x12\n\nproject_id\x18\n \x01(\t\x12\x12\n\nstart_date\x18\x0b \x01(\t\x12\x10\n\x08\x65nd_date\x18\x0c \x01(\t\"\x1f\n\x11\x44\x65leteTaskRequest\x12\n\n\x02id\x18\x01 \x01(\t\"5\n\x12\x44\x65leteTaskResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"A\n\x17\x42\x61tchCreateTasksRequest\x12&\n\x05tasks\x18\x01 \x03(\x0b\x32\x17.task.CreateTaskRequest\"A\n\x17\x42\x61tchUpdateTasksRequest\x12&\n\x05tasks\x18\x01 \x03(\x0b\x32\x17.task.UpdateTaskRequest\"Q\n\x0f\x42\x61tchTaskResult\x12\r\n\x05index\x18\x01 \x01(\x05\x12 \n\x04task\x18\x02 \x01(\x0b\x32\x12.task.TaskResponse\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"<\n\x12\x42\x61tchTasksResponse\x12&\n\x07results\x18\x01 \x03(\x0b\x32\x15.task.BatchTaskResult\"\x10\n\x0eMetricsRequest\"s\n\x0fMetricsResponse\x12\x31\n\x06values\x18\x01 \x03(\x0b\x32!.task.MetricsResponse.ValuesEntry\x1a-\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x32\xa4\x06\n\x0bTaskService\x12\x33\n\x07GetTask\x12\x14.task.GetTaskRequest\x1a\x12.task.TaskResponse\x12\x44\n\x0fGetProjectTasks\x12\x1c.task.GetProjectTasksRequest\x1a\x13.task.TasksResponse\x12L\n\x12StreamProjectTasks\x12\x1f.task.StreamProjectTasksRequest\x1a\x13.task.TasksResponse0\x01\x12<\n\tListTasks\x12\x16.task.ListTasksRequest\x1a\x17.task.ListTasksResponse\x12\x42\n\x0eGetSprintTasks\x12\x1b.task.GetSprintTasksRequest\x1a\x13.task.TasksResponse\x12>\n\x0cGetEpicTasks\x12\x19.task.GetEpicTasksRequest\x1a\x13.task.TasksResponse\x12\x39\n\nCreateTask\x12\x17.task.CreateTaskRequest\x1a\x12.task.TaskResponse\x12\x39\n\nUpdateTask\x12\x17.task.UpdateTaskRequest\x1a\x12.task.TaskResponse\x12?\n\nDeleteTask\x12\x17.task.DeleteTaskRequest\x1a\x18.task.DeleteTaskResponse\x12K\n\x10\x42\x61tchCreateTasks\x12\x1d.task.BatchCreateTasksRequest\x1a\x18.task.BatchTasksResponse\x12K\n\x10\x42\x61tchUpdateTasks\x12\x1d.task.BatchUpdateTasksRequest\x1a\x18.task.BatchTasksResponse\x12\x39\n\nGetMetrics\x12\x14.task.MetricsRequest\x1a\x15.task.MetricsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'task_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_METRICSRESPONSE_VALUESENTRY']._loaded_options = None
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_options = b'8\001'
   _globals['_GETTASKREQUEST']._serialized_start=20
   _globals['_GETTASKREQUEST']._serialized_end=48
   _globals['_TASKRESPONSE']._serialized_start=51
   _globals['_TASKRESPONSE']._serialized_end=276
   _globals['_GETPROJECTTASKSREQUEST']._serialized_start=278
   _globals['_GETPROJECTTASKSREQUEST']._serialized_end=322
-  _globals['_GETSPRINTTASKSREQUEST']._serialized_start=324
-  _globals['_GETSPRINTTASKSREQUEST']._serialized_end=366
-  _globals['_GETEPICTASKSREQUEST']._serialized_start=368
-  _globals['_GETEPICTASKSREQUEST']._serialized_end=406
-  _globals['_TASKSRESPONSE']._serialized_start=408
-  _globals['_TASKSRESPONSE']._serialized_end=458
-  _globals['_CREATETASKREQUEST']._serialized_start=461
-  _globals['_CREATETASKREQUEST']._serialized_end=663
-  _globals['_UPDATETASKREQUEST']._serialized_start=666
-  _globals['_UPDATETASKREQUEST']._serialized_end=896
-  _globals['_DELETETASKREQUEST']._serialized_start=898
-  _globals['_DELETETASKREQUEST']._serialized_end=929
-  _globals['_DELETETASKRESPONSE']._serialized_start=931
-  _globals['_DELETETASKRESPONSE']._serialized_end=984
-  _globals['_TASKSERVICE']._serialized_start=987
-  _globals['_TASKSERVICE']._serialized_end=1438
+  _globals['_STREAMPROJECTTASKSREQUEST']._serialized_start=324
+  _globals['_STREAMPROJECTTASKSREQUEST']._serialized_end=391
+  _globals['_GETSPRINTTASKSREQUEST']._serialized_start=393
+  _globals['_GETSPRINTTASKSREQUEST']._serialized_end=435
+  _globals['_GETEPICTASKSREQUEST']._serialized_start=437
+  _globals['_GETEPICTASKSREQUEST']._serialized_end=475
+  _globals['_TASKSRESPONSE']._serialized_start=477
+  _globals['_TASKSRESPONSE']._serialized_end=527
+  _globals['_LISTTASKSREQUEST']._serialized_start=530
+  _globals['_LISTTASKSREQUEST']._serialized_end=811
+  _globals['_LISTTASKSRESPONSE']._serialized_start=813
+  _globals['_LISTTASKSRESPONSE']._serialized_end=892
+  _globals['_CREATETASKREQUEST']._serialized_start=895
+  _globals['_CREATETASKREQUEST']._serialized_end=1097
+  _globals['_UPDATETASKREQUEST']._serialized_start=1100
+  _globals['_UPDATETASKREQUEST']._serialized_end=1330
+  _globals['_DELETETASKREQUEST']._serialized_start=1332
+  _globals['_DELETETASKREQUEST']._serialized_end=1363
+  _globals['_DELETETASKRESPONSE']._serialized_start=1365
+  _globals['_DELETETASKRESPONSE']._serialized_end=1418
+  _globals['_BATCHCREATETASKSREQUEST']._serialized_start=1420
+  _globals['_BATCHCREATETASKSREQUEST']._serialized_end=1485
+  _globals['_BATCHUPDATETASKSREQUEST']._serialized_start=1487
+  _globals['_BATCHUPDATETASKSREQUEST']._serialized_end=1552
+  _globals['_BATCHTASKRESULT']._serialized_start=1554
+  _globals['_BATCHTASKRESULT']._serialized_end=1635
+  _globals['_BATCHTASKSRESPONSE']._serialized_start=1637
+  _globals['_BATCHTASKSRESPONSE']._serialized_end=1697
+  _globals['_METRICSREQUEST']._serialized_start=1699
+  _globals['_METRICSREQUEST']._serialized_end=1715
+  _globals['_METRICSRESPONSE']._serialized_start=1717
+  _globals['_METRICSRESPONSE']._serialized_end=1832
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_start=1787
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_end=1832
+  _globals['_TASKSERVICE']._serialized_start=1835
+  _globals['_TASKSERVICE']._serialized_end=2639
 # @@protoc_insertion_point(module_scope)
@@ -44,6 +44,16 @@ class TaskServiceStub(object):
                 request_serializer=task__pb2.GetProjectTasksRequest.SerializeToString,
                 response_deserializer=task__pb2.TasksResponse.FromString,
                 _registered_method=True)
+        self.StreamProjectTasks = channel.unary_stream(
+                '/task.TaskService/StreamProjectTasks',
+                request_serializer=task__pb2.StreamProjectTasksRequest.SerializeToString,
+                response_deserializer=task__pb2.TasksResponse.FromString,
+                _registered_method=True)
+        self.ListTasks = channel.unary_unary(
+                '/task.TaskService/ListTasks',
+                request_serializer=task__pb2.ListTasksRequest.SerializeToString,
+                response_deserializer=task__pb2.ListTasksResponse.FromString,
+                _registered_method=True)
         self.GetSprintTasks = channel.unary_unary(
                 '/task.TaskService/GetSprintTasks',
                 request_serializer=task__pb2.GetSprintTasksRequest.SerializeToString,
@@ -69,6 +79,21 @@ class TaskServiceStub(object):
                 request_serializer=task__pb2.DeleteTaskRequest.SerializeToString,
                 response_deserializer=task__pb2.DeleteTaskResponse.FromString,
                 _registered_method=True)
+        self.BatchCreateTasks = channel.unary_unary(
+                '/task.TaskService/BatchCreateTasks',
+                request_serializer=task__pb2.BatchCreateTasksRequest.SerializeToString,
+                response_deserializer=task__pb2.BatchTasksResponse.FromString,
+                _registered_method=True)
+        self.BatchUpdateTasks = channel.unary_unary(
+                '/task.TaskService/BatchUpdateTasks',
+                request_serializer=task__pb2.BatchUpdateTasksRequest.SerializeToString,
+                response_deserializer=task__pb2.BatchTasksResponse.FromString,
+                _registered_method=True)
+        self.GetMetrics = channel.unary_unary(
+                '/task.TaskService/GetMetrics',
+                request_serializer=task__pb2.MetricsRequest.SerializeToString,
+                response_deserializer=task__pb2.MetricsResponse.FromString,
+                _registered_method=True)
 
 
 class TaskServiceServicer(object):
@@ -86,6 +111,18 @@ class TaskServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamProjectTasks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListTasks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetSprintTasks(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -116,6 +153,24 @@ class TaskServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchCreateTasks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchUpdateTasks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetMetrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TaskServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -129,6 +184,16 @@ def add_TaskServiceServicer_to_server(servicer, server):
                     request_deserializer=task__pb2.GetProjectTasksRequest.FromString,
                     response_serializer=task__pb2.TasksResponse.SerializeToString,
             ),
+            'StreamProjectTasks': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamProjectTasks,
+                    request_deserializer=task__pb2.StreamProjectTasksRequest.FromString,
+                    response_serializer=task__pb2.TasksResponse.SerializeToString,
+            ),
+            'ListTasks': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListTasks,
+                    request_deserializer=task__pb2.ListTasksRequest.FromString,
+                    response_serializer=task__pb2.ListTasksResponse.SerializeToString,
+            ),
             'GetSprintTasks': grpc.unary_unary_rpc_method_handler(
                     servicer.GetSprintTasks,
                     request_deserializer=task__pb2.GetSprintTasksRequest.FromString,
@@ -154,6 +219,21 @@ def add_TaskServiceServicer_to_server(servicer, server):
                     request_deserializer=task__pb2.DeleteTaskRequest.FromString,
                     response_serializer=task__pb2.DeleteTaskResponse.SerializeToString,
             ),
+            'BatchCreateTasks': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchCreateTasks,
+                    request_deserializer=task__pb2.BatchCreateTasksRequest.FromString,
+                    response_serializer=task__pb2.BatchTasksResponse.SerializeToString,
+            ),
+            'BatchUpdateTasks': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchUpdateTasks,
+                    request_deserializer=task__pb2.BatchUpdateTasksRequest.FromString,
+                    response_serializer=task__pb2.BatchTasksResponse.SerializeToString,
+            ),
+            'GetMetrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMetrics,
+                    request_deserializer=task__pb2.MetricsRequest.FromString,
+                    response_serializer=task__pb2.MetricsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'task.TaskService', rpc_method_handlers)
@@ -219,6 +299,60 @@ class TaskService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamProjectTasks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/task.TaskService/StreamProjectTasks',
+            task__pb2.StreamProjectTasksRequest.SerializeToString,
+            task__pb2.TasksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListTasks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/task.TaskService/ListTasks',
+            task__pb2.ListTasksRequest.SerializeToString,
+            task__pb2.ListTasksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetSprintTasks(request,
             target,
@@ -353,3 +487,84 @@ class TaskService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def BatchCreateTasks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/task.TaskService/BatchCreateTasks',
+            task__pb2.BatchCreateTasksRequest.SerializeToString,
+            task__pb2.BatchTasksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchUpdateTasks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/task.TaskService/BatchUpdateTasks',
+            task__pb2.BatchUpdateTasksRequest.SerializeToString,
+            task__pb2.BatchTasksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetMetrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/task.TaskService/GetMetrics',
+            task__pb2.MetricsRequest.SerializeToString,
+            task__pb2.MetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -3,18 +3,20 @@ from fastapi.params import Depends
 from models.analytics_models import TaskInfo, UserTasks, SprintInfo, DayInfo
 from routers.auth_service import get_current_user
 from models.auth_models import User
-from clients.grpc.analytics_grpc import AnalyticsGrpcClient
+from clients.grpc.analytics_grpc import AnalyticsGrpcClient, get_analytics_client
 
 router = APIRouter()
 
 
 @router.get("/timeline/all", response_model=list[TaskInfo])
-def get_all_timeline(current_user: User = Depends(get_current_user)):
+async def get_all_timeline(
+    current_user: User = Depends(get_current_user),
+    client: AnalyticsGrpcClient = Depends(get_analytics_client),
+):
     user_id = current_user.user_id
-    client = AnalyticsGrpcClient()
 
     try:
-        resp = client.get_all_timeline(user_id)
+        resp = await client.get_all_timeline(user_id)
 
         return [
             TaskInfo(
@@ -31,15 +33,15 @@ def get_all_timeline(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/timeline/{project_id}", response_model=list[TaskInfo])
-def get_project_timeline(
+async def get_project_timeline(
     project_id: str = Path(..., description="Project UUID"),
     current_user: User = Depends(get_current_user),
+    client: AnalyticsGrpcClient = Depends(get_analytics_client),
 ):
     user_id = current_user.user_id
-    client = AnalyticsGrpcClient()
 
     try:
-        resp = client.get_project_timeline(user_id, project_id)
+        resp = await client.get_project_timeline(user_id, project_id)
 
         return [
             TaskInfo(
@@ -56,12 +58,14 @@ def get_project_timeline(
 
 
 @router.get("/timeline/all/me", response_model=list[TaskInfo])
-def get_all_mine_timeline(current_user: User = Depends(get_current_user)):
+async def get_all_mine_timeline(
+    current_user: User = Depends(get_current_user),
+    client: AnalyticsGrpcClient = Depends(get_analytics_client),
+):
     user_id = current_user.user_id
-    client = AnalyticsGrpcClient()
 
     try:
-        resp = client.get_all_mine_timeline(user_id)
+        resp = await client.get_all_mine_timeline(user_id)
 
         return [
             TaskInfo(
@@ -78,15 +82,15 @@ def get_all_mine_timeline(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/timeline/me/{project_id}", response_model=list[TaskInfo])
-def get_mine_project_timeline(
+async def get_mine_project_timeline(
     project_id: str = Path(..., description="Project UUID"),
     current_user: User = Depends(get_current_user),
+    client: AnalyticsGrpcClient = Depends(get_analytics_client),
 ):
     user_id = current_user.user_id
-    client = AnalyticsGrpcClient()
 
     try:
-        resp = client.get_mine_project_timeline(user_id, project_id)
+        resp = await client.get_mine_project_timeline(user_id, project_id)
 
         return [
             TaskInfo(
@@ -103,14 +107,13 @@ def get_mine_project_timeline(
 
 
 @router.get("/tasks/completed-by-user/{project_id}", response_model=list[UserTasks])
-def get_tasks_completed_by_users(
+async def get_tasks_completed_by_users(
     project_id: str = Path(..., description="Project UUID"),
     current_user: User = Depends(get_current_user),
+    client: AnalyticsGrpcClient = Depends(get_analytics_client),
 ):
-    client = AnalyticsGrpcClient()
-
     try:
-        resp = client.get_tasks_completed_by_users(project_id)
+        resp = await client.get_tasks_completed_by_users(project_id)
 
         return [
             UserTasks(
@@ -126,14 +129,13 @@ def get_tasks_completed_by_users(
 
 
 @router.get("/sprints/task-status/{project_id}", response_model=list[SprintInfo])
-def get_tasks_status_in_sprints(
+async def get_tasks_status_in_sprints(
     project_id: str = Path(..., description="Project UUID"),
     current_user: User = Depends(get_current_user),
+    client: AnalyticsGrpcClient = Depends(get_analytics_client),
 ):
-    client = AnalyticsGrpcClient()
-
     try:
-        resp = client.get_tasks_status_in_sprints(project_id)
+        resp = await client.get_tasks_status_in_sprints(project_id)
 
         return [
             SprintInfo(
@@ -150,14 +152,13 @@ def get_tasks_status_in_sprints(
 
 
 @router.get("/tasks/progress-by-day/{project_id}", response_model=list[DayInfo])
-def get_tasks_progress_by_day(
+async def get_tasks_progress_by_day(
     project_id: str = Path(..., description="Project UUID"),
     current_user: User = Depends(get_current_user),
+    client: AnalyticsGrpcClient = Depends(get_analytics_client),
 ):
-    client = AnalyticsGrpcClient()
-
     try:
-        resp = client.get_tasks_progress_by_day(project_id)
+        resp = await client.get_tasks_progress_by_day(project_id)
 
         return [
             DayInfo(
@@ -8,6 +8,7 @@ from fastapi import (
     File,
     UploadFile,
     Path,
+    Query,
 )
 from models.auth_models import (
     RegisterData,
@@ -24,13 +25,20 @@ from models.auth_models import (
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from fastapi.security import OAuth2PasswordBearer
+from starlette.concurrency import run_in_threadpool
 from config import get_settings, Settings
-from clients.grpc.auth_grpc import AuthGrpcClient
+from clients.grpc.auth_grpc import AuthGrpcClient, get_auth_client
 from clients.minio_client import upload_file
-from clients.redis_client import redis_client
+from clients.redis_client import redis_client, async_redis_client
+from clients.token_cache import token_cache
 from uuid import uuid4
+import logging
 import os
-from typing import List
+from typing import List, Optional
+import grpc
+import redis
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/form-login")
@@ -48,37 +56,57 @@ def create_access_token(
     return jwt.encode(to_encode, secret_key, algorithm=algo)
 
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme), settings: Settings = Depends(get_settings)
 ) -> User:
+    user = token_cache.get(token)
+    if user is not None:
+        return user
+
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
         )
-        user_id = payload.get("sub")
-        email = payload.get("email")
-        if not user_id or not email:
-            raise HTTPException(status_code=401, detail="Invalid token")
-        return User(user_id=user_id, email=email)
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    user_id = payload.get("sub")
+    email = payload.get("email")
+    if not user_id or not email:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    # Access tokens share the jti of their login session, so a logout
+    # revokes them together with the refresh token
+    jti = payload.get("jti")
+    if jti:
+        try:
+            revoked = await async_redis_client.exists(f"bl:{jti}")
+        except redis.RedisError as e:
+            logger.warning("[JWT] Revocation check failed: %s", e)
+            revoked = False
+        if revoked:
+            raise HTTPException(status_code=401, detail="Token revoked")
+
+    user = User(user_id=user_id, email=email)
+    token_cache.put(token, user, payload["exp"], jti)
+    return user
+
 
 @router.get("/init-db")
-def init_db():
-    client = AuthGrpcClient()
+async def init_db(client: AuthGrpcClient = Depends(get_auth_client)):
     try:
-        response = client.init_db(200)
+        response = await client.init_db(200)
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/register", response_model=UserInfo)
-def register(data: RegisterData):
-    client = AuthGrpcClient()
+async def register(
+    data: RegisterData, client: AuthGrpcClient = Depends(get_auth_client)
+):
     try:
-        response = client.create_user(
+        response = await client.create_user(
             name=data.name,
             surname=data.surname,
             email=data.email,
@@ -91,12 +119,14 @@ def register(data: RegisterData):
 
 
 @router.post("/login", response_model=TokenPair)
-def login(
-    data: LoginInput, response: Response, settings: Settings = Depends(get_settings)
+async def login(
+    data: LoginInput,
+    response: Response,
+    settings: Settings = Depends(get_settings),
+    client: AuthGrpcClient = Depends(get_auth_client),
 ):
-    client = AuthGrpcClient()
     try:
-        grpc_user = client.login_user(data.email, data.password)
+        grpc_user = await client.login_user(data.email, data.password)
 
         if not grpc_user.user_id:
             raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -104,7 +134,7 @@ def login(
         jti = str(uuid4())
 
         access_token = create_access_token(
-            data={"sub": grpc_user.user_id, "email": grpc_user.email},
+            data={"sub": grpc_user.user_id, "email": grpc_user.email, "jti": jti},
             secret_key=settings.JWT_SECRET,
             algo=settings.JWT_ALGORITHM,
             expires_delta=settings.ACCESS_TOKEN_EXPIRE,
@@ -150,6 +180,8 @@ def logout(
         jti = payload.get("jti")
         if jti:
             redis_client.setex(f"bl:{jti}", settings.REFRESH_TOKEN_EXPIRE, "true")
+            token_cache.revoke(jti)
+            redis_client.publish(settings.JWT_REVOCATION_CHANNEL, jti)
 
     except JWTError:
         pass
@@ -160,15 +192,15 @@ def logout(
 
 
 @router.post("/form-login", include_in_schema=False)
-def login_form(
+async def login_form(
     response: Response,
     username: str = Form(),
     password: str = Form(),
     settings: Settings = Depends(get_settings),
+    client: AuthGrpcClient = Depends(get_auth_client),
 ):
-    client = AuthGrpcClient()
     try:
-        grpc_user = client.login_user(username, password)
+        grpc_user = await client.login_user(username, password)
 
         if not grpc_user.user_id:
             raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -176,7 +208,7 @@ def login_form(
         jti = str(uuid4())
 
         access_token = create_access_token(
-            data={"sub": grpc_user.user_id, "email": grpc_user.email},
+            data={"sub": grpc_user.user_id, "email": grpc_user.email, "jti": jti},
             secret_key=settings.JWT_SECRET,
             algo=settings.JWT_ALGORITHM,
             expires_delta=settings.ACCESS_TOKEN_EXPIRE,
@@ -206,10 +238,12 @@ def login_form(
 
 
 @router.get("/me", response_model=UserInfo)
-def read_me(current_user: User = Depends(get_current_user)):
-    client = AuthGrpcClient()
+async def read_me(
+    current_user: User = Depends(get_current_user),
+    client: AuthGrpcClient = Depends(get_auth_client),
+):
     try:
-        response = client.get_user_by_id(current_user.user_id)
+        response = await client.get_user_by_id(current_user.user_id)
         if not response:
             raise HTTPException(status_code=401, detail="Invalid credentials")
         return response
@@ -218,13 +252,13 @@ def read_me(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/user/{user_id}", response_model=UserInfo)
-def read_user(
+async def read_user(
     user_id: str = Path(..., description="User UUID"),
     current_user: User = Depends(get_current_user),
+    client: AuthGrpcClient = Depends(get_auth_client),
 ):
-    client = AuthGrpcClient()
     try:
-        response = client.get_user_by_id(user_id)
+        response = await client.get_user_by_id(user_id)
         if not response:
             raise HTTPException(
                 status_code=401,
@@ -235,6 +269,36 @@ def read_user(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/users", response_model=List[UserInfo])
+async def read_users(
+    ids: List[str] = Query(..., description="User UUIDs, repeated or comma-separated"),
+    current_user: User = Depends(get_current_user),
+    client: AuthGrpcClient = Depends(get_auth_client),
+):
+    user_ids = [i.strip() for value in ids for i in value.split(",") if i.strip()]
+    if not user_ids:
+        return []
+
+    try:
+        response = await client.get_users(user_ids)
+        return [
+            UserInfo(
+                user_id=u.user_id,
+                email=u.email,
+                name=u.name,
+                surname=u.surname,
+                img_url=u.img_url,
+            )
+            for u in response.users
+        ]
+    except grpc.aio.AioRpcError as e:
+        if e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+            raise HTTPException(status_code=400, detail=e.details())
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/refresh", response_model=TokenRefreshResponse)
 def refresh_access_token(request: Request, settings: Settings = Depends(get_settings)):
     refresh_token = request.cookies.get("refresh_token")
@@ -256,7 +320,7 @@ def refresh_access_token(request: Request, settings: Settings = Depends(get_sett
             raise HTTPException(status_code=401, detail="Invalid token")
 
         new_access_token = create_access_token(
-            data={"sub": user_id, "email": email},
+            data={"sub": user_id, "email": email, "jti": jti},
             secret_key=settings.JWT_SECRET,
             algo=settings.JWT_ALGORITHM,
             expires_delta=settings.ACCESS_TOKEN_EXPIRE,
@@ -269,12 +333,13 @@ def refresh_access_token(request: Request, settings: Settings = Depends(get_sett
 
 
 @router.patch("/me", response_model=UserInfo)
-def update_user(
-    data: UserUpdateRequest, current_user: User = Depends(get_current_user)
+async def update_user(
+    data: UserUpdateRequest,
+    current_user: User = Depends(get_current_user),
+    client: AuthGrpcClient = Depends(get_auth_client),
 ):
-    client = AuthGrpcClient()
     try:
-        response = client.update_user(
+        response = await client.update_user(
             name=data.name,
             surname=data.surname,
             email=current_user.email,
@@ -288,10 +353,12 @@ def update_user(
 
 
 @router.get("/me/img", response_model=ImageResponse)
-def get_user_img(current_user: User = Depends(get_current_user)):
-    client = AuthGrpcClient()
+async def get_user_img(
+    current_user: User = Depends(get_current_user),
+    client: AuthGrpcClient = Depends(get_auth_client),
+):
     try:
-        response = client.get_user_by_id(uuid=current_user.user_id)
+        response = await client.get_user_by_id(uuid=current_user.user_id)
         if not response:
             raise HTTPException(status_code=401, detail="Invalid credentials")
         url = response.img_url
@@ -301,20 +368,22 @@ def get_user_img(current_user: User = Depends(get_current_user)):
 
 
 @router.patch("/me/img", response_model=UserInfo)
-def update_user_img(
-    file: UploadFile = File(...), current_user: User = Depends(get_current_user)
+async def update_user_img(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+    client: AuthGrpcClient = Depends(get_auth_client),
 ):
-    client = AuthGrpcClient()
     try:
         ext = os.path.splitext(file.filename)[1]
         file_name = f"{current_user.user_id}_{uuid4().hex}{ext}"
-        url = upload_file(
+        url = await run_in_threadpool(
+            upload_file,
             bucket_name="avatars",
             file_data=file.file,
             file_name=file_name,
             content_type=file.content_type,
         )
-        response = client.update_user_img(email=current_user.email, img_url=url)
+        response = await client.update_user_img(email=current_user.email, img_url=url)
         if not response:
             raise HTTPException(status_code=401, detail="Invalid credentials")
         return response
@@ -323,10 +392,12 @@ def update_user_img(
 
 
 @router.delete("/me", response_model=MessageResponse)
-def delete_user(current_user: User = Depends(get_current_user)):
-    client = AuthGrpcClient()
+async def delete_user(
+    current_user: User = Depends(get_current_user),
+    client: AuthGrpcClient = Depends(get_auth_client),
+):
     try:
-        response = client.delete_user(email=current_user.email)
+        response = await client.delete_user(email=current_user.email)
         if not response:
             raise HTTPException(status_code=401, detail="Invalid credentials")
         return response
@@ -335,13 +406,27 @@ def delete_user(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/search", response_model=List[UserOut])
-def search_users(substr: str, current_user: User = Depends(get_current_user)):
-    client = AuthGrpcClient()
+async def search_users(
+    substr: str,
+    response: Response,
+    page_size: int = Query(20, ge=1, le=100),
+    page_token: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    client: AuthGrpcClient = Depends(get_auth_client),
+):
     try:
-        response = client.search_users(substr=substr)
+        res = await client.search_users(
+            substr=substr, page_size=page_size, page_token=page_token or ""
+        )
+        if res.next_page_token:
+            response.headers["X-Next-Page-Token"] = res.next_page_token
         return [
             UserOut(user_id=u.user_id, name=u.name, surname=u.surname, email=u.email)
-            for u in response.users
+            for u in res.users
         ]
+    except grpc.aio.AioRpcError as e:
+        if e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+            raise HTTPException(status_code=400, detail=e.details())
+        raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -3,9 +3,10 @@ from fastapi.params import Depends
 
 import os
 from uuid import uuid4
+from starlette.concurrency import run_in_threadpool
 from clients.minio_client import upload_file
 
-from clients.grpc.pm_grpc import PmGrpcClient
+from clients.grpc.pm_grpc import PmGrpcClient, get_pm_client
 from config import get_settings, Settings
 from routers.auth_service import get_current_user
 from models.auth_models import User
@@ -43,12 +44,12 @@ router = APIRouter()
 
 @router.post("/project", response_model=ProjectResponse, tags=["project"])
 async def create_project(
-    project: CreateProjectRequest, current_user: User = Depends(get_current_user)
+    project: CreateProjectRequest,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
-
     try:
-        resp = client.create_project(
+        resp = await client.create_project(
             name=project.name,
             description=project.description,
             color=project.color,
@@ -68,11 +69,13 @@ async def create_project(
 
 
 @router.get("/project", response_model=ProjectResponse, tags=["project"])
-def get_project(project_id: str, current_user: User = Depends(get_current_user)):
-    client = PmGrpcClient()
-
+async def get_project(
+    project_id: str,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
+):
     try:
-        resp = client.get_project(project_id)
+        resp = await client.get_project(project_id)
         return resp
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -80,12 +83,12 @@ def get_project(project_id: str, current_user: User = Depends(get_current_user))
 
 @router.patch("/project", response_model=ProjectResponse, tags=["project"])
 async def update_project(
-    project: UpdateProjectRequest, current_user: User = Depends(get_current_user)
+    project: UpdateProjectRequest,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
-
     try:
-        resp = client.update_project(
+        resp = await client.update_project(
             project_id=project.id,
             name=project.name,
             description=project.description,
@@ -118,18 +121,19 @@ async def update_project_img(
     project_id: str = Path(..., description="Project UUID"),
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
         ext = os.path.splitext(file.filename)[1]
         file_name = f"{project_id}_{uuid4().hex}{ext}"
-        url = upload_file(
+        url = await run_in_threadpool(
+            upload_file,
             bucket_name="project-avatars",
             file_data=file.file,
             file_name=file_name,
             content_type=file.content_type,
         )
-        resp = client.update_project_img(project_id=project_id, img_url=url)
+        resp = await client.update_project_img(project_id=project_id, img_url=url)
         if not resp:
             raise HTTPException(status_code=401, detail="Invalid project ID")
 
@@ -146,14 +150,15 @@ async def update_project_img(
 
 @router.put("/project/users", response_model=ProjectUsersResponse, tags=["project"])
 async def update_project_users(
-    req: ProjectUsersRequest, current_user: User = Depends(get_current_user)
+    req: ProjectUsersRequest,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        old_resp = client.get_project_users(project_id=req.id)
+        old_resp = await client.get_project_users(project_id=req.id)
         old_users = [u.user_id for u in old_resp.users]
 
-        resp = client.update_project_users(project_id=req.id, users=req.users)
+        resp = await client.update_project_users(project_id=req.id, users=req.users)
         new_users = [u.id for u in resp.users]
 
         await notify_project_user_changes(
@@ -167,13 +172,14 @@ async def update_project_users(
 
 @router.delete("/project", response_model=DeleteProjectResponse, tags=["project"])
 async def delete_project(
-    project_id: str, current_user: User = Depends(get_current_user)
+    project_id: str,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        pu = get_project_users(project_id=project_id)
+        pu = await get_project_users(project_id=project_id, client=client)
         user_ids = [u.id for u in pu.users]
-        resp = client.delete_project(project_id=project_id)
+        resp = await client.delete_project(project_id=project_id)
 
         for uid in user_ids:
             await ws_manager.send_personal_json(
@@ -188,10 +194,13 @@ async def delete_project(
 @router.get(
     "/project/users", response_model=ProjectUsersResponseExtended, tags=["project"]
 )
-def get_project_users(project_id: str, current_user: User = Depends(get_current_user)):
-    client = PmGrpcClient()
+async def get_project_users(
+    project_id: str,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
+):
     try:
-        resp = client.get_project_users(project_id=project_id)
+        resp = await client.get_project_users(project_id=project_id)
 
         users = ProjectUsersResponseExtended(
             users=[
@@ -212,10 +221,12 @@ def get_project_users(project_id: str, current_user: User = Depends(get_current_
 
 
 @router.get("/me/projects", response_model=UserProjectsResponse, tags=["project"])
-def get_user_projects(current_user: User = Depends(get_current_user)):
-    client = PmGrpcClient()
+async def get_user_projects(
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
+):
     try:
-        resp = client.get_user_projects(user_id=current_user.user_id)
+        resp = await client.get_user_projects(user_id=current_user.user_id)
 
         projects = UserProjectsResponse(
             projects=[
@@ -237,13 +248,13 @@ def get_user_projects(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/sprint/{sprint_id}", response_model=SprintResponse, tags=["sprint"])
-def get_sprint(
+async def get_sprint(
     sprint_id: str = Path(..., description="Sprint UUID"),
     current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        resp = client.get_sprint(id=sprint_id)
+        resp = await client.get_sprint(id=sprint_id)
         return resp
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -252,13 +263,13 @@ def get_sprint(
 @router.get(
     "/sprint/project/{project_id}", response_model=SprintsResponse, tags=["sprint"]
 )
-def get_project_sprints(
+async def get_project_sprints(
     project_id: str = Path(..., description="Project UUID"),
     current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        resp = client.get_project_sprints(project_id=project_id)
+        resp = await client.get_project_sprints(project_id=project_id)
 
         return SprintsResponse(
             sprints=[
@@ -280,11 +291,12 @@ def get_project_sprints(
 
 @router.post("/sprint", response_model=SprintResponse, tags=["sprint"])
 async def create_sprint(
-    sprint: CreateSprintRequest, current_user: User = Depends(get_current_user)
+    sprint: CreateSprintRequest,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        resp = client.create_sprint(
+        resp = await client.create_sprint(
             name=sprint.name,
             description=sprint.description,
             start_date=sprint.start_date,
@@ -302,11 +314,12 @@ async def create_sprint(
 
 @router.put("/sprint", response_model=SprintResponse, tags=["sprint"])
 async def update_sprint(
-    sprint: UpdateSprintRequest, current_user: User = Depends(get_current_user)
+    sprint: UpdateSprintRequest,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        resp = client.update_sprint(
+        resp = await client.update_sprint(
             id=sprint.id,
             name=sprint.name,
             description=sprint.description,
@@ -329,11 +342,11 @@ async def update_sprint(
 async def delete_sprint(
     sprint_id: str = Path(..., description="Sprint UUID"),
     current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        before = client.get_sprint(id=sprint_id)
-        resp = client.delete_sprint(id=sprint_id)
+        before = await client.get_sprint(id=sprint_id)
+        resp = await client.delete_sprint(id=sprint_id)
 
         await notify_project_participants(
             project_id=before.project_id,
@@ -346,26 +359,26 @@ async def delete_sprint(
 
 
 @router.get("/epic/{epic_id}", response_model=EpicResponse, tags=["epic"])
-def get_epic(
+async def get_epic(
     epic_id: str = Path(..., description="Epic UUID"),
     current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        resp = client.get_epic(id=epic_id)
+        resp = await client.get_epic(id=epic_id)
         return resp
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/epic/project/{project_id}", response_model=EpicsResponse, tags=["epic"])
-def get_project_epics(
+async def get_project_epics(
     project_id: str = Path(..., description="Project UUID"),
     current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        resp = client.get_project_epics(project_id=project_id)
+        resp = await client.get_project_epics(project_id=project_id)
 
         return EpicsResponse(
             epics=[
@@ -387,11 +400,12 @@ def get_project_epics(
 
 @router.post("/epic", response_model=EpicResponse, tags=["epic"])
 async def create_epic(
-    epic: CreateEpicRequest, current_user: User = Depends(get_current_user)
+    epic: CreateEpicRequest,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        resp = client.create_epic(
+        resp = await client.create_epic(
             name=epic.name,
             description=epic.description,
             priority=epic.priority,
@@ -409,11 +423,12 @@ async def create_epic(
 
 @router.put("/epic", response_model=EpicResponse, tags=["epic"])
 async def update_epic(
-    epic: UpdateEpicRequest, current_user: User = Depends(get_current_user)
+    epic: UpdateEpicRequest,
+    current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        resp = client.update_epic(
+        resp = await client.update_epic(
             id=epic.id,
             name=epic.name,
             description=epic.description,
@@ -434,11 +449,11 @@ async def update_epic(
 async def delete_epic(
     epic_id: str = Path(..., description="Epic UUID"),
     current_user: User = Depends(get_current_user),
+    client: PmGrpcClient = Depends(get_pm_client),
 ):
-    client = PmGrpcClient()
     try:
-        before = client.get_epic(id=epic_id)
-        resp = client.delete_epic(id=epic_id)
+        before = await client.get_epic(id=epic_id)
+        resp = await client.delete_epic(id=epic_id)
 
         await notify_project_participants(
             project_id=before.project_id,
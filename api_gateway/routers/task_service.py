@@ -1,41 +1,89 @@
-from fastapi import APIRouter, HTTPException, Path
+import grpc
+from fastapi import APIRouter, HTTPException, Path, Query
 from fastapi.params import Depends
+from fastapi.responses import StreamingResponse
 from models.task_models import (
     TaskResponse,
     TasksResponse,
     MessageResponse,
     CreateTaskRequest,
     UpdateTaskRequest,
+    BatchCreateTasksRequest,
+    BatchUpdateTasksRequest,
+    BatchTaskResult,
+    BatchTasksResponse,
 )
+from config import get_settings, Settings
 from routers.auth_service import get_current_user
 from models.auth_models import User
-from clients.grpc.task_grpc import TaskGrpcClient
-from utils.notifications import notify_task_event, notify_project_participants
+from clients.grpc.task_grpc import TaskGrpcClient, get_task_client
+from utils.notifications import notify_task_event, notify_task_events, notify_project_participants
 
 router = APIRouter()
 
 
 @router.get("/task/{task_id}", response_model=TaskResponse)
-def get_task(
+async def get_task(
     task_id: str = Path(..., description="Task UUID"),
     current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
 ):
-    client = TaskGrpcClient()
     try:
-        resp = client.get_task(task_id)
+        resp = await client.get_task(task_id)
         return resp
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/task/project/{project_id}", response_model=TasksResponse)
-def get_project_tasks(
+async def get_project_tasks(
     project_id: str = Path(..., description="Task UUID"),
+    status: list[str] = Query([], description="Status names, any of them"),
+    type: list[str] = Query([], description="Task type names, any of them"),
+    assigned_to: list[str] = Query([], description="Assignee UUIDs, any of them"),
+    min_priority: int = Query(0, ge=0),
+    max_priority: int = Query(0, ge=0),
+    date_from: str = Query("", description="Tasks starting on or after, dd.mm.yyyy"),
+    date_to: str = Query("", description="Tasks ending on or before, dd.mm.yyyy"),
+    sort: str = Query("", description="created_at, priority, start_date, end_date or title"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    page_size: int = Query(0, ge=0, description="0 for the default"),
+    page_token: str = Query("", description="next_page_token of the previous page"),
     current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
 ):
-    client = TaskGrpcClient()
+    """All tasks of the project, or one page of them.
+
+    Any filter, sort or paging parameter switches to a keyset-paged listing;
+    follow next_page_token until it comes back empty.
+    """
+    filters = {
+        "statuses": status,
+        "types": type,
+        "assigned_to": assigned_to,
+        "min_priority": min_priority,
+        "max_priority": max_priority,
+        "date_from": date_from,
+        "date_to": date_to,
+        "sort": sort,
+        "descending": order == "desc",
+        "page_size": page_size,
+        "page_token": page_token,
+    }
+    if any(filters.values()):
+        try:
+            resp = await client.list_tasks(project_id=project_id, **filters)
+        except grpc.aio.AioRpcError as e:
+            if e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+                raise HTTPException(status_code=400, detail=e.details())
+            raise HTTPException(status_code=500, detail=str(e))
+        return TasksResponse(
+            tasks=[_task_model(task) for task in resp.tasks],
+            next_page_token=resp.next_page_token or None,
+        )
+
     try:
-        resp = client.get_project_tasks(project_id)
+        resp = await client.get_project_tasks(project_id)
 
         tasks = TasksResponse(
             tasks=[
@@ -61,14 +109,70 @@ def get_project_tasks(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _task_model(task) -> TaskResponse:
+    return TaskResponse(
+        id=task.id,
+        title=task.title,
+        description=task.description,
+        priority=task.priority,
+        type=task.type,
+        status=task.status,
+        assigned_to=task.assigned_to,
+        epic_id=task.epic_id,
+        sprint_id=task.sprint_id,
+        project_id=task.project_id,
+        start_date=task.start_date,
+        end_date=task.end_date,
+    )
+
+
+def _task_json(task) -> str:
+    return _task_model(task).model_dump_json()
+
+
+@router.get("/task/project/{project_id}/stream")
+async def stream_project_tasks(
+    project_id: str = Path(..., description="Project UUID"),
+    chunk_size: int = Query(0, ge=0, description="Tasks per backend message, 0 for the default"),
+    current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
+    settings: Settings = Depends(get_settings),
+):
+    """The tasks of a project as NDJSON, one task per line.
+
+    Relayed chunk by chunk from StreamProjectTasks, so neither side holds
+    the whole project in memory.
+    """
+    chunks = aiter(client.stream_project_tasks(
+        project_id, chunk_size, timeout=settings.GRPC_STREAM_DEADLINE
+    ))
+    # The first chunk is awaited here so backend errors still become an
+    # HTTP status; once the body has started they can only cut it short
+    try:
+        first = await anext(chunks, None)
+    except grpc.aio.AioRpcError as e:
+        if e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+            raise HTTPException(status_code=400, detail=e.details())
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def ndjson():
+        if first is None:
+            return
+        yield "".join(_task_json(task) + "\n" for task in first.tasks)
+        async for chunk in chunks:
+            yield "".join(_task_json(task) + "\n" for task in chunk.tasks)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/task/sprint/{sprint_id}", response_model=TasksResponse)
-def get_sprint_tasks(
+async def get_sprint_tasks(
     sprint_id: str = Path(..., description="Task UUID"),
     current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
 ):
-    client = TaskGrpcClient()
     try:
-        resp = client.get_sprint_tasks(sprint_id)
+        resp = await client.get_sprint_tasks(sprint_id)
 
         tasks = TasksResponse(
             tasks=[
@@ -95,13 +199,13 @@ def get_sprint_tasks(
 
 
 @router.get("/task/epic/{epic_id}", response_model=TasksResponse)
-def get_epic_tasks(
+async def get_epic_tasks(
     epic_id: str = Path(..., description="Task UUID"),
     current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
 ):
-    client = TaskGrpcClient()
     try:
-        resp = client.get_epic_tasks(epic_id)
+        resp = await client.get_epic_tasks(epic_id)
 
         tasks = TasksResponse(
             tasks=[
@@ -129,12 +233,12 @@ def get_epic_tasks(
 
 @router.post("/task", response_model=TaskResponse)
 async def create_task(
-    task: CreateTaskRequest, current_user: User = Depends(get_current_user)
+    task: CreateTaskRequest,
+    current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
 ):
-    client = TaskGrpcClient()
-
     try:
-        resp = client.create_task(
+        resp = await client.create_task(
             title=task.title,
             description=task.description,
             priority=task.priority,
@@ -155,12 +259,12 @@ async def create_task(
 
 @router.put("/task", response_model=TaskResponse)
 async def update_task(
-    task: UpdateTaskRequest, current_user: User = Depends(get_current_user)
+    task: UpdateTaskRequest,
+    current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
 ):
-    client = TaskGrpcClient()
-
     try:
-        resp = client.update_task(
+        resp = await client.update_task(
             id=task.id,
             title=task.title,
             description=task.description,
@@ -181,16 +285,79 @@ async def update_task(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _batch_results(resp) -> BatchTasksResponse:
+    return BatchTasksResponse(
+        results=[
+            BatchTaskResult(
+                index=r.index,
+                task=TaskResponse(
+                    id=r.task.id,
+                    title=r.task.title,
+                    description=r.task.description,
+                    priority=r.task.priority,
+                    type=r.task.type,
+                    status=r.task.status,
+                    assigned_to=r.task.assigned_to,
+                    epic_id=r.task.epic_id,
+                    sprint_id=r.task.sprint_id,
+                    project_id=r.task.project_id,
+                    start_date=r.task.start_date,
+                    end_date=r.task.end_date,
+                ) if r.HasField("task") else None,
+                error=r.error or None,
+            )
+            for r in resp.results
+        ]
+    )
+
+
+@router.post("/task/batch", response_model=BatchTasksResponse)
+async def batch_create_tasks(
+    batch: BatchCreateTasksRequest,
+    current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
+):
+    try:
+        resp = await client.batch_create_tasks([task.model_dump() for task in batch.tasks])
+
+        await notify_task_events("task_created", [r.task for r in resp.results if r.HasField("task")])
+        return _batch_results(resp)
+    except grpc.aio.AioRpcError as e:
+        if e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+            raise HTTPException(status_code=400, detail=e.details())
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.put("/task/batch", response_model=BatchTasksResponse)
+async def batch_update_tasks(
+    batch: BatchUpdateTasksRequest,
+    current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
+):
+    try:
+        resp = await client.batch_update_tasks([task.model_dump() for task in batch.tasks])
+
+        await notify_task_events("task_updated", [r.task for r in resp.results if r.HasField("task")])
+        return _batch_results(resp)
+    except grpc.aio.AioRpcError as e:
+        if e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+            raise HTTPException(status_code=400, detail=e.details())
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.delete("/task/{task_id}", response_model=MessageResponse)
 async def delete_task(
     task_id: str = Path(..., description="Task UUID"),
     current_user: User = Depends(get_current_user),
+    client: TaskGrpcClient = Depends(get_task_client),
 ):
-    client = TaskGrpcClient()
-
     try:
-        before = client.get_task(task_id)
-        resp = client.delete_task(task_id)
+        before = await client.get_task(task_id)
+        resp = await client.delete_task(task_id)
 
         await notify_project_participants(
             project_id=before.project_id,
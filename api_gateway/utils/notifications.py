@@ -1,4 +1,4 @@
-from clients.grpc.pm_grpc import PmGrpcClient
+from clients.grpc.pm_grpc import get_pm_client
 from websockets.manager import manager as ws_manager
 
 
@@ -7,8 +7,8 @@ async def notify_project_participants(
     event_type: str,
     payload: dict
 ):
-    client = PmGrpcClient()
-    users_resp = client.get_project_users(project_id)
+    client = await get_pm_client()
+    users_resp = await client.get_project_users(project_id)
     user_ids = [u.user_id for u in users_resp.users]
     event = {"type": event_type, "project_id": project_id, **payload}
     for uid in user_ids:
@@ -75,18 +75,10 @@ async def notify_epic_event(event_type: str, epic) -> None:
     )
 
 
-async def notify_task_event(event_type: str, task) -> None:
-    project_id = getattr(task, "project_id", None)
-    if not project_id:
-        return
-
-    client = PmGrpcClient()
-    users_resp = client.get_project_users(project_id)
-    user_ids = [u.user_id for u in users_resp.users]
-
-    payload = {
+def _task_payload(event_type: str, task) -> dict:
+    return {
         "type": event_type,
-        "project_id": project_id,
+        "project_id": task.project_id,
         "task": {
             "id": task.id,
             "title": task.title,
@@ -101,5 +93,27 @@ async def notify_task_event(event_type: str, task) -> None:
             "end_date": task.end_date,
         },
     }
-    for uid in user_ids:
-        await ws_manager.send_personal_json(uid, payload)
+
+
+async def notify_task_event(event_type: str, task) -> None:
+    await notify_task_events(event_type, [task])
+
+
+async def notify_task_events(event_type: str, tasks) -> None:
+    """One event per task, looking up the participants once per project."""
+    by_project = {}
+    for task in tasks:
+        project_id = getattr(task, "project_id", None)
+        if project_id:
+            by_project.setdefault(project_id, []).append(task)
+    if not by_project:
+        return
+
+    client = await get_pm_client()
+    for project_id, project_tasks in by_project.items():
+        users_resp = await client.get_project_users(project_id)
+        user_ids = [u.user_id for u in users_resp.users]
+        for task in project_tasks:
+            payload = _task_payload(event_type, task)
+            for uid in user_ids:
+                await ws_manager.send_personal_json(uid, payload)
@@ -1,4 +1,5 @@
 import redis
+import redis.asyncio
 import os
 
 redis_client = redis.Redis(
@@ -6,3 +7,9 @@ redis_client = redis.Redis(
     port=int(os.getenv("REDIS_PORT", 6379)),
     decode_responses=True
 )
+
+async_redis_client = redis.asyncio.Redis(
+    host=os.getenv("REDIS_HOST", "redis"),
+    port=int(os.getenv("REDIS_PORT", 6379)),
+    decode_responses=True
+)
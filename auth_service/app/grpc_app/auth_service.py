@@ -1,9 +1,47 @@
 from concurrent import futures
+from concurrent.futures.process import BrokenProcessPool
+import os
 import grpc
-from app.services.auth import AuthService
+from taskio_server import SERVER_OPTIONS
+from app.database import db_pool_stats
+from app.services.auth import AuthService, AsyncAuthService
+from app.services.hashing import hashing_pool, HashingPoolSaturated
+from app.services.user_cache import user_cache
 from . import auth_pb2
 from . import auth_pb2_grpc
 
+GRPC_MAX_WORKERS = int(os.getenv("GRPC_MAX_WORKERS", "10"))
+
+
+# How a password hashing failure is answered; see HashingPool
+_HASHING_ERRORS = (
+    (HashingPoolSaturated, grpc.StatusCode.RESOURCE_EXHAUSTED, "Too many password operations, retry later"),
+    (TimeoutError, grpc.StatusCode.DEADLINE_EXCEEDED, "Password operation timed out, retry later"),
+    (BrokenProcessPool, grpc.StatusCode.UNAVAILABLE, "Password hashing worker failed, retry later"),
+)
+_HASHING_ERROR_TYPES = tuple(error for error, _, _ in _HASHING_ERRORS)
+
+
+def _abort_hashing(context, e):
+    for error, code, details in _HASHING_ERRORS:
+        if isinstance(e, error):
+            context.abort(code, details)
+
+
+def _users_response(users):
+    return auth_pb2.GetUsersResponse(
+        users=[
+            auth_pb2.UserResponse(
+                user_id=str(user.id),
+                email=user.email,
+                name=user.name,
+                surname=user.surname,
+                img_url=user.img_url
+            )
+            for user in users
+        ]
+    )
+
 
 class AuthServicer(auth_pb2_grpc.AuthServiceServicer):
     def __init__(self):
@@ -16,13 +54,16 @@ class AuthServicer(auth_pb2_grpc.AuthServiceServicer):
             context.set_details("User with this email already exists")
             return auth_pb2.UserResponse()
 
-        user = self.auth_service.create_user(
-            name=request.name,
-            surname=request.surname,
-            email=request.email,
-            password=request.password,
-            img_url=request.img_url or None
-        )
+        try:
+            user = self.auth_service.create_user(
+                name=request.name,
+                surname=request.surname,
+                email=request.email,
+                password=request.password,
+                img_url=request.img_url or None
+            )
+        except _HASHING_ERROR_TYPES as e:
+            _abort_hashing(context, e)
         if user:
             return auth_pb2.UserResponse(
                 message="User created successfully",
@@ -38,10 +79,13 @@ class AuthServicer(auth_pb2_grpc.AuthServiceServicer):
             return auth_pb2.UserResponse()
 
     def LoginUser(self, request, context):
-        user = self.auth_service.login_user(
-            email=request.email,
-            password=request.password
-        )
+        try:
+            user = self.auth_service.login_user(
+                email=request.email,
+                password=request.password
+            )
+        except _HASHING_ERROR_TYPES as e:
+            _abort_hashing(context, e)
         if user:
             return auth_pb2.UserResponse(
                 message="Login successful",
@@ -70,8 +114,18 @@ class AuthServicer(auth_pb2_grpc.AuthServiceServicer):
         context.set_details("Invalid credentials or user is not found")
         return auth_pb2.UserResponse()
 
+    def GetUsers(self, request, context):
+        try:
+            users = self.auth_service.get_users(list(request.user_ids))
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        return _users_response(users)
+
     def UpdateUser(self, request, context):
-        user = self.auth_service.update_user(name=request.name, surname=request.surname, email=request.email, password=request.password)
+        try:
+            user = self.auth_service.update_user(name=request.name, surname=request.surname, email=request.email, password=request.password)
+        except _HASHING_ERROR_TYPES as e:
+            _abort_hashing(context, e)
         if user:
             return auth_pb2.UserResponse(
                 message="Updating user successful",
@@ -112,8 +166,13 @@ class AuthServicer(auth_pb2_grpc.AuthServiceServicer):
         return auth_pb2.MessageResponse()
 
     def SearchUsers(self, request, context):
-        users = self.auth_service.search_users(request.substr)
-        resp = auth_pb2.SearchUsersResponse()
+        try:
+            users, next_page_token = self.auth_service.search_users(
+                request.substr, request.page_size, request.page_token
+            )
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        resp = auth_pb2.SearchUsersResponse(next_page_token=next_page_token)
         for u in users:
             resp.users.add(
                 user_id=str(u.id),
@@ -131,9 +190,78 @@ class AuthServicer(auth_pb2_grpc.AuthServiceServicer):
         context.set_details("Invalid credentials or user is not found")
         return auth_pb2.InitDBResponse()
 
+    def GetMetrics(self, request, context):
+        return auth_pb2.MetricsResponse(
+            values={**hashing_pool.stats(), **user_cache.stats(), **db_pool_stats()}
+        )
+
+
+class AsyncAuthServicer(AuthServicer):
+    """Servicer for the grpc.aio server.
+
+    Lookups are served on the event loop; RPCs that hash passwords or write
+    are inherited from AuthServicer and run in the migration thread pool.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.async_auth_service = AsyncAuthService()
+
+    async def GetUser(self, request, context):
+        user = await self.async_auth_service.get_user_by_id(request.user_id)
+        if user:
+            return auth_pb2.UserResponse(
+                message="Getting user successful",
+                user_id=str(user.id),
+                email=user.email,
+                name=user.name,
+                surname=user.surname,
+                img_url=user.img_url
+            )
+        await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Invalid credentials or user is not found")
+
+    async def GetUsers(self, request, context):
+        try:
+            users = await self.async_auth_service.get_users(list(request.user_ids))
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        return _users_response(users)
+
+    async def SearchUsers(self, request, context):
+        try:
+            users, next_page_token = await self.async_auth_service.search_users(
+                request.substr, request.page_size, request.page_token
+            )
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        resp = auth_pb2.SearchUsersResponse(next_page_token=next_page_token)
+        for u in users:
+            resp.users.add(
+                user_id=str(u.id),
+                name=u.name,
+                surname=u.surname,
+                email=u.email
+            )
+        return resp
+
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    hashing_pool.start()
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=GRPC_MAX_WORKERS), options=SERVER_OPTIONS
+    )
     auth_pb2_grpc.add_AuthServiceServicer_to_server(AuthServicer(), server)
     server.add_insecure_port('[::]:50051')
     return server
+
+
+def serve_aio():
+    hashing_pool.start()
+    # Sync handlers (login, writes) are run in the migration thread pool
+    server = grpc.aio.server(
+        migration_thread_pool=futures.ThreadPoolExecutor(max_workers=GRPC_MAX_WORKERS),
+        options=SERVER_OPTIONS,
+    )
+    auth_pb2_grpc.add_AuthServiceServicer_to_server(AsyncAuthServicer(), server)
+    server.add_insecure_port('[::]:50051')
+    return server
@@ -3,10 +3,11 @@ import os
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from grpc_app.auth_service import serve
+from taskio_server import run
+
+from app.database import engine, async_engine
+from grpc_app.auth_service import serve, serve_aio
+
 
 if __name__ == "__main__":
-    server = serve()
-    print("Starting AuthService on port 50051...")
-    server.start()
-    server.wait_for_termination()
+    run("AuthService", 50051, serve, serve_aio, engines=(engine, async_engine.sync_engine))
@@ -1,22 +1,43 @@
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
-from app.database import SessionLocal
+from sqlalchemy import select
+from app.database import SessionLocal, AsyncSessionLocal
 from app.models.models import User, ProjectType, Role, TaskType, Status
-from passlib.context import CryptContext
+from app.services.hashing import hashing_pool
+from app.services.user_cache import user_cache
+from app.services.user_search import user_search
+from app.dependencies.redis_client import redis_client
+from taskio_models.lookup import publish_invalidation
+import uuid
 import os
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 JWT_REFRESH_SECRET = os.getenv("JWT_REFRESH_SECRET")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 REFRESH_EXPIRE_SECONDS = os.getenv("REFRESH_TOKEN_EXPIRE", 86400)
 
+GET_USERS_MAX_IDS = int(os.getenv("GET_USERS_MAX_IDS", 500))
+
+
+def _normalize_user_ids(user_ids):
+    """Canonical, de-duplicated ids in request order; malformed ids are dropped."""
+    if len(user_ids) > GET_USERS_MAX_IDS:
+        raise ValueError(f"At most {GET_USERS_MAX_IDS} user ids per request")
+
+    ids = []
+    for user_id in user_ids:
+        try:
+            user_id = str(uuid.UUID(str(user_id)))
+        except ValueError:
+            continue
+        if user_id not in ids:
+            ids.append(user_id)
+    return ids
+
 
 class AuthService:
     def create_user(self, name, surname, email, password, img_url=None):
         db = SessionLocal()
         try:
-            hashed_password = pwd_context.hash(password)
+            hashed_password = hashing_pool.hash(password)
             user = User(
                 name=name,
                 surname=surname,
@@ -27,6 +48,7 @@ class AuthService:
             db.add(user)
             db.commit()
             db.refresh(user)
+            user_search.index_user(user)
             return user
         except IntegrityError:
             db.rollback()
@@ -38,43 +60,87 @@ class AuthService:
         db = SessionLocal()
         try:
             user = db.query(User).filter(User.email == email).first()
-            if user and pwd_context.verify(password, user.password):
-                return user
-            return None
         finally:
             db.close()
 
+        if user is None:
+            return None
+
+        # The connection goes back to the pool before the slow verify
+        ok, new_hash = hashing_pool.verify_and_update(password, user.password)
+        if not ok:
+            return None
+
+        if new_hash:
+            # The stored hash predates the current policy (scheme or cost)
+            db = SessionLocal()
+            try:
+                db.query(User).filter(User.id == user.id).update({User.password: new_hash})
+                db.commit()
+                user.password = new_hash
+            except Exception as e:
+                db.rollback()
+                print(f"Password rehash failed for user {user.id}: {e}", flush=True)
+            finally:
+                db.close()
+
+        return user
+
     def get_user_by_id(self, user_id):
-        db = SessionLocal()
-        try:
-            user = db.query(User).filter(User.id == user_id).first()
-            return user
-        finally:
-            db.close()
+        def load():
+            db = SessionLocal()
+            try:
+                return db.query(User).filter(User.id == user_id).first()
+            finally:
+                db.close()
+
+        return user_cache.get_by_id(user_id, load)
 
     def get_user_by_email(self, email):
-        db = SessionLocal()
-        try:
-            user = db.query(User).filter(User.email == email).first()
-            return user
-        finally:
-            db.close()
+        def load():
+            db = SessionLocal()
+            try:
+                return db.query(User).filter(User.email == email).first()
+            finally:
+                db.close()
+
+        return user_cache.get_by_email(email, load)
+
+    def get_users(self, user_ids):
+        """Users for the given ids in request order, unknown ids are skipped."""
+        user_ids = _normalize_user_ids(user_ids)
+
+        def load(missing):
+            db = SessionLocal()
+            try:
+                return db.scalars(
+                    select(User).where(User.id.in_([uuid.UUID(i) for i in missing]))
+                ).all()
+            finally:
+                db.close()
+
+        found = user_cache.get_many(user_ids, load)
+        return [found[user_id] for user_id in user_ids if user_id in found]
 
     def update_user(self, name, surname, email, password):
+        # Hashed before the session takes a connection, so none is held
+        # for the slow hash
+        hashed_password = hashing_pool.hash(password)
+
         db = SessionLocal()
         try:
             user = db.query(User).filter(User.email == email).first()
             if not user:
                 return None
 
-            hashed_password = pwd_context.hash(password)
-
             user.name = name
             user.surname = surname
             user.password = hashed_password
 
             db.commit()
             db.refresh(user)
+            user_cache.invalidate(user.id, user.email)
+            user_search.index_user(user)
             return user
         finally:
             db.close()
@@ -90,6 +156,7 @@ class AuthService:
 
             db.commit()
             db.refresh(user)
+            user_cache.invalidate(user.id, user.email)
             return user
         finally:
             db.close()
@@ -103,17 +170,16 @@ class AuthService:
 
             db.delete(user)
             db.commit()
+            user_cache.invalidate(user.id, user.email)
+            user_search.remove_user(user.id)
             return True
         finally:
             db.close()
 
-    def search_users(self, substr):
+    def search_users(self, substr, page_size=0, page_token=""):
         db = SessionLocal()
         try:
-            pattern = f"%{substr}%"
-            full_name = func.concat(User.name, ' ', User.surname)
-            q = db.query(User).filter(full_name.ilike(pattern)).limit(20)
-            return q.all()
+            return user_search.search(db, substr, page_size, page_token)
         finally:
             db.close()
 
@@ -156,6 +222,53 @@ class AuthService:
                 type_model = TaskType(name=type_item)
                 db.add(type_model)
                 db.commit()
+
+            # The task and pm services cache these tables
+            publish_invalidation(redis_client, "project_types", "roles", "statuses", "task_types")
         finally:
             db.close()
 
+
+class AsyncAuthService:
+    """Read side of AuthService for the grpc.aio server mode.
+
+    Password hashing stays in AuthService, it is CPU bound and would block
+    the event loop.
+    """
+
+    async def get_user_by_id(self, user_id):
+        try:
+            user_id = uuid.UUID(str(user_id))
+        except ValueError:
+            return None
+
+        async def load():
+            async with AsyncSessionLocal() as db:
+                return await db.scalar(select(User).where(User.id == user_id))
+
+        return await user_cache.aget_by_id(user_id, load)
+
+    async def get_user_by_email(self, email):
+        async def load():
+            async with AsyncSessionLocal() as db:
+                return await db.scalar(select(User).where(User.email == email))
+
+        return await user_cache.aget_by_email(email, load)
+
+    async def get_users(self, user_ids):
+        user_ids = _normalize_user_ids(user_ids)
+
+        async def load(missing):
+            async with AsyncSessionLocal() as db:
+                return (
+                    await db.scalars(
+                        select(User).where(User.id.in_([uuid.UUID(i) for i in missing]))
+                    )
+                ).all()
+
+        found = await user_cache.aget_many(user_ids, load)
+        return [found[user_id] for user_id in user_ids if user_id in found]
+
+    async def search_users(self, substr, page_size=0, page_token=""):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(user_search.search, substr, page_size, page_token)
@@ -0,0 +1,205 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from passlib.context import CryptContext
+
+PASSWORD_SCHEME = os.getenv("PASSWORD_SCHEME", "bcrypt")
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", 65536))
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", 3))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", 4))
+
+# Every gRPC worker process (GRPC_WORKERS, see taskio_server.launcher) has
+# its own pool, so by default they share the cores rather than each taking
+# all of them
+GRPC_WORKERS = int(os.getenv("GRPC_WORKERS", "1"))
+HASH_POOL_SIZE = int(os.getenv("HASH_POOL_SIZE", max(1, (os.cpu_count() or 1) // GRPC_WORKERS)))
+HASH_QUEUE_LIMIT = int(os.getenv("HASH_QUEUE_LIMIT", HASH_POOL_SIZE * 4))
+HASH_TIMEOUT = float(os.getenv("HASH_TIMEOUT", 10))
+
+
+class HashingPoolSaturated(Exception):
+    pass
+
+
+def build_context(
+    scheme=PASSWORD_SCHEME,
+    bcrypt_rounds=BCRYPT_ROUNDS,
+    argon2_memory_cost=ARGON2_MEMORY_COST,
+    argon2_time_cost=ARGON2_TIME_COST,
+    argon2_parallelism=ARGON2_PARALLELISM,
+):
+    """CryptContext for the configured hash policy.
+
+    Both schemes stay verifiable; hashes made with the other scheme or with
+    different cost parameters are reported by ``needs_update`` and get
+    rehashed on the next successful login. Pinning min and max rounds to the
+    same value means lowering the cost rehashes too, not only raising it.
+    """
+    if scheme not in ("bcrypt", "argon2"):
+        raise ValueError(f"Unsupported password scheme: {scheme}")
+
+    schemes = [scheme] + [s for s in ("bcrypt", "argon2") if s != scheme]
+    return CryptContext(
+        schemes=schemes,
+        default=scheme,
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__time_cost=argon2_time_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+# Built from the environment, so spawned workers get the same policy
+pwd_context = build_context()
+
+
+def _hash(password):
+    return pwd_context.hash(password)
+
+
+def _verify(password, hashed):
+    return pwd_context.verify(password, hashed)
+
+
+def _verify_and_update(password, hashed):
+    return pwd_context.verify_and_update(password, hashed)
+
+
+class HashingPool:
+    """Runs password hashing in worker processes so it does not hold the GIL.
+
+    At most ``queue_limit`` calls may be running or waiting at once; past that
+    ``HashingPoolSaturated`` is raised straight away instead of queueing, and
+    the caller answers RESOURCE_EXHAUSTED. A call that times out is
+    cancelled if it has not started; otherwise it keeps its slot until the
+    worker is done with it, so abandoned hashes still count against the
+    limit.
+
+    If a worker process dies the executor is broken for good: it is
+    dropped and the next call starts a new one. The call that was running
+    raises ``BrokenProcessPool``; one that only found the pool broken is
+    submitted again to the new pool, as it never ran.
+    """
+
+    def __init__(self, max_workers, queue_limit, timeout):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(queue_limit)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._restarts = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    def start(self):
+        # Spawned, not forked: the gRPC server in this process may already
+        # have threads running
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+        return self._executor
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _discard(self, executor):
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def hash(self, password):
+        return self._run(_hash, password)
+
+    def verify(self, password, hashed):
+        return self._run(_verify, password, hashed)
+
+    def verify_and_update(self, password, hashed):
+        """Returns ``(ok, new_hash)``, ``new_hash`` is None unless a rehash is due."""
+        return self._run(_verify_and_update, password, hashed)
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HashingPoolSaturated("Password hashing pool is saturated")
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            executor = self.start()
+            try:
+                future = executor.submit(fn, *args)
+            except BrokenProcessPool:
+                self._discard(executor)
+                executor = self.start()
+                future = executor.submit(fn, *args)
+        except BaseException:
+            self._finished(None)
+            raise
+        future.add_done_callback(self._finished)
+
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = future.result(timeout=self.timeout)
+            ok = True
+            return result
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise
+        finally:
+            if not ok:
+                future.cancel()
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                if ok:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+                self._total_seconds += elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+
+    def _finished(self, future):
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            done = self._completed + self._failed
+            return {
+                "hashing_workers": float(self.max_workers),
+                "hashing_queue_limit": float(self.queue_limit),
+                "hashing_in_flight": float(self._in_flight),
+                "hashing_completed": float(self._completed),
+                "hashing_failed": float(self._failed),
+                "hashing_rejected": float(self._rejected),
+                "hashing_pool_restarts": float(self._restarts),
+                "hashing_avg_seconds": self._total_seconds / done if done else 0.0,
+                "hashing_max_seconds": self._max_seconds,
+            }
+
+
+hashing_pool = HashingPool(HASH_POOL_SIZE, HASH_QUEUE_LIMIT, HASH_TIMEOUT)
@@ -0,0 +1,337 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+
+import redis
+from taskio_cache import invalidate_tags
+
+from app.dependencies.redis_client import redis_client, async_redis_client
+
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 300))
+USER_CACHE_LOCAL_TTL = float(os.getenv("USER_CACHE_LOCAL_TTL", 5))
+USER_CACHE_LOCAL_SIZE = int(os.getenv("USER_CACHE_LOCAL_SIZE", 10000))
+
+# Bumped by every invalidation; a user loaded before one is not stored
+_GENERATION_KEY = "user:gen"
+
+# KEYS: the generation key, then the keys to store
+# ARGV: the generation seen before loading, the ttl, then one payload per key
+_STORE = """
+if (redis.call('GET', KEYS[1]) or '') ~= ARGV[1] then
+    return 0
+end
+for i = 2, #KEYS do
+    redis.call('SET', KEYS[i], ARGV[i + 1], 'EX', ARGV[2])
+end
+return 1
+"""
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """The public fields of a user; the password hash is never cached."""
+
+    id: str
+    email: str
+    name: str
+    surname: str
+    img_url: str | None
+
+    @classmethod
+    def from_model(cls, user):
+        return cls(
+            id=str(user.id),
+            email=user.email,
+            name=user.name,
+            surname=user.surname,
+            img_url=user.img_url,
+        )
+
+
+def _id_key(user_id):
+    # One key per user whatever the case or format of the id asked for
+    try:
+        user_id = uuid.UUID(str(user_id))
+    except ValueError:
+        pass
+    return f"user:id:{user_id}"
+
+
+def _email_key(email):
+    return f"user:email:{email}"
+
+
+class _LocalLRU:
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._items.pop(key, None)
+
+
+class UserCache:
+    """Two-tier read-through cache of users keyed by id and by email.
+
+    An in-process LRU sits in front of Redis. The local TTL is kept short
+    because an invalidation only clears the local tier of the process that
+    made the write; other workers see it once their entry expires. Missing
+    users are not cached.
+
+    Every invalidation bumps one generation counter, which readers fetch
+    with the values they look up. Users loaded after a miss are stored only
+    if it has not moved since, so a load racing an update cannot put the
+    user back as it was for the whole TTL.
+    """
+
+    def __init__(self, local_size, local_ttl, ttl):
+        self.ttl = ttl
+        self._local = _LocalLRU(local_size, local_ttl)
+        self._lock = threading.Lock()
+        self._counters = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "stale_loads": 0,
+            "redis_errors": 0,
+        }
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _remember(self, user):
+        self._local.set(_id_key(user.id), user)
+        self._local.set(_email_key(user.email), user)
+
+    def _store_args(self, generation, users):
+        keys, payloads = [_GENERATION_KEY], []
+        for user in users:
+            payload = json.dumps(asdict(user))
+            keys += [_id_key(user.id), _email_key(user.email)]
+            payloads += [payload, payload]
+        return [_STORE, len(keys), *keys, generation, self.ttl, *payloads]
+
+    def _stored(self, stored, users):
+        if not stored:
+            self._count("stale_loads")
+            return
+        for user in users:
+            self._remember(user)
+
+    def _store(self, generation, *users):
+        """Stores ``users`` unless an invalidation bumped ``generation`` since it was read.
+
+        ``generation`` is None if Redis could not be read; the users are
+        then only kept locally, as storing them would fail too.
+        """
+        stored = True
+        if generation is not None:
+            try:
+                stored = redis_client.eval(*self._store_args(generation, users))
+            except redis.RedisError:
+                self._count("redis_errors")
+        self._stored(stored, users)
+
+    async def _astore(self, generation, *users):
+        stored = True
+        if generation is not None:
+            try:
+                stored = await async_redis_client.eval(*self._store_args(generation, users))
+            except redis.RedisError:
+                self._count("redis_errors")
+        self._stored(stored, users)
+
+    def get(self, key, loader):
+        user = self._local.get(key)
+        if user is not None:
+            self._count("local_hits")
+            return user
+
+        try:
+            raw, generation = redis_client.mget(key, _GENERATION_KEY)
+            generation = generation or ""
+        except redis.RedisError:
+            self._count("redis_errors")
+            raw = generation = None
+        if raw:
+            self._count("redis_hits")
+            user = CachedUser(**json.loads(raw))
+            self._remember(user)
+            return user
+
+        self._count("misses")
+        model = loader()
+        if model is None:
+            return None
+        user = CachedUser.from_model(model)
+        self._store(generation, user)
+        return user
+
+    async def aget(self, key, loader):
+        user = self._local.get(key)
+        if user is not None:
+            self._count("local_hits")
+            return user
+
+        try:
+            raw, generation = await async_redis_client.mget(key, _GENERATION_KEY)
+            generation = generation or ""
+        except redis.RedisError:
+            self._count("redis_errors")
+            raw = generation = None
+        if raw:
+            self._count("redis_hits")
+            user = CachedUser(**json.loads(raw))
+            self._remember(user)
+            return user
+
+        self._count("misses")
+        model = await loader()
+        if model is None:
+            return None
+        user = CachedUser.from_model(model)
+        await self._astore(generation, user)
+        return user
+
+    def _split_local(self, user_ids):
+        found, missing = {}, []
+        for user_id in user_ids:
+            user = self._local.get(_id_key(user_id))
+            if user is not None:
+                self._count("local_hits")
+                found[user_id] = user
+            else:
+                missing.append(user_id)
+        return found, missing
+
+    def _merge_redis(self, found, missing, raws):
+        still_missing = []
+        for user_id, raw in zip(missing, raws):
+            if raw:
+                self._count("redis_hits")
+                user = CachedUser(**json.loads(raw))
+                self._remember(user)
+                found[user_id] = user
+            else:
+                self._count("misses")
+                still_missing.append(user_id)
+        return still_missing
+
+    def get_many(self, user_ids, loader):
+        """Looks up many ids with one MGET and one ``loader(missing_ids)`` call.
+
+        Returns a dict of id -> CachedUser for the ids that exist.
+        """
+        found, missing = self._split_local(user_ids)
+        if not missing:
+            return found
+
+        try:
+            *raws, generation = redis_client.mget(
+                [_id_key(user_id) for user_id in missing] + [_GENERATION_KEY]
+            )
+            generation = generation or ""
+        except redis.RedisError:
+            self._count("redis_errors")
+            raws, generation = [None] * len(missing), None
+        missing = self._merge_redis(found, missing, raws)
+        if not missing:
+            return found
+
+        loaded = [CachedUser.from_model(model) for model in loader(missing)]
+        if loaded:
+            self._store(generation, *loaded)
+        for user in loaded:
+            found[user.id] = user
+        return found
+
+    async def aget_many(self, user_ids, loader):
+        found, missing = self._split_local(user_ids)
+        if not missing:
+            return found
+
+        try:
+            *raws, generation = await async_redis_client.mget(
+                [_id_key(user_id) for user_id in missing] + [_GENERATION_KEY]
+            )
+            generation = generation or ""
+        except redis.RedisError:
+            self._count("redis_errors")
+            raws, generation = [None] * len(missing), None
+        missing = self._merge_redis(found, missing, raws)
+        if not missing:
+            return found
+
+        loaded = [CachedUser.from_model(model) for model in await loader(missing)]
+        if loaded:
+            await self._astore(generation, *loaded)
+        for user in loaded:
+            found[user.id] = user
+        return found
+
+    def get_by_id(self, user_id, loader):
+        return self.get(_id_key(user_id), loader)
+
+    def get_by_email(self, email, loader):
+        return self.get(_email_key(email), loader)
+
+    async def aget_by_id(self, user_id, loader):
+        return await self.aget(_id_key(user_id), loader)
+
+    async def aget_by_email(self, email, loader):
+        return await self.aget(_email_key(email), loader)
+
+    def invalidate(self, user_id, email):
+        keys = (_id_key(user_id), _email_key(email))
+        self._local.delete(*keys)
+        try:
+            with redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(*keys)
+                pipe.incr(_GENERATION_KEY)
+                pipe.execute()
+            # The pm service caches project member lists showing the user
+            invalidate_tags(redis_client, f"user:{user_id}")
+        except redis.RedisError:
+            self._count("redis_errors")
+        self._count("invalidations")
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["local_hits"] + counters["redis_hits"] + counters["misses"]
+        hits = counters["local_hits"] + counters["redis_hits"]
+        stats = {f"user_cache_{name}": float(value) for name, value in counters.items()}
+        stats["user_cache_hit_ratio"] = hits / lookups if lookups else 0.0
+        return stats
+
+
+user_cache = UserCache(USER_CACHE_LOCAL_SIZE, USER_CACHE_LOCAL_TTL, USER_CACHE_TTL)
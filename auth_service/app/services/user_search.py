@@ -0,0 +1,194 @@
+import base64
+import json
+import threading
+import uuid
+
+from sqlalchemy import Double, and_, cast, func, literal_column, or_, select
+
+from app.database import engine
+from app.models.models import User
+
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+
+# Must stay identical to the expression of ix_users_full_name_trgm (migration
+# 0004) or Postgres won't use the index
+_full_name = User.name.op("||")(literal_column("' '")).op("||")(User.surname)
+
+
+def _encode_token(query, score, user_id):
+    raw = json.dumps([query, score, str(user_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_token(query, token):
+    try:
+        token_query, score, user_id = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid page token")
+    if token_query != query:
+        raise ValueError("Page token belongs to another query")
+    return float(score), user_id
+
+
+def _page_size(page_size):
+    if not page_size or page_size < 0:
+        return SEARCH_PAGE_SIZE
+    return min(page_size, SEARCH_MAX_PAGE_SIZE)
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children = {}
+        self.ids = set()
+
+
+class PrefixTrie:
+    """Maps every prefix of the indexed terms to the ids of their users."""
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def insert(self, term, user_id):
+        node = self._root
+        for ch in term:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.ids.add(user_id)
+
+    def remove(self, term, user_id):
+        node = self._root
+        for ch in term:
+            node = node.children.get(ch)
+            if node is None:
+                return
+            node.ids.discard(user_id)
+
+    def search(self, prefix):
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return set()
+        return node.ids
+
+
+class UserSearch:
+    """User search backed by pg_trgm on Postgres.
+
+    Results are ranked by trigram similarity to the full name or the email
+    and paged with a keyset token over (score, id), so deep pages cost the
+    same as the first one. Other dialects (SQLite in tests) fall back to an
+    in-memory prefix trie over names and emails that is built on first use
+    and kept current by the write paths of AuthService.
+    """
+
+    def __init__(self, bind):
+        self.use_trigram = bind.dialect.name == "postgresql"
+        self._lock = threading.Lock()
+        self._trie = None
+        self._users = {}
+        self._terms = {}
+
+    def search(self, db, query, page_size=0, page_token=""):
+        """Returns ``(users, next_page_token)``; the token is "" on the last page."""
+        query = query.strip().lower()
+        page_size = _page_size(page_size)
+        after = _decode_token(query, page_token) if page_token else None
+
+        if self.use_trigram:
+            rows = self._search_trigram(db, query, page_size, after)
+        else:
+            rows = self._search_trie(db, query, page_size, after)
+
+        if len(rows) <= page_size:
+            return [user for user, _ in rows], ""
+
+        rows = rows[:page_size]
+        last_user, last_score = rows[-1]
+        return [user for user, _ in rows], _encode_token(query, last_score, last_user.id)
+
+    def _search_trigram(self, db, query, page_size, after):
+        pattern = f"%{query}%"
+        # similarity() is real; as double precision the score survives the
+        # round trip through the token exactly, which the keyset needs
+        score = cast(
+            func.greatest(func.similarity(_full_name, query), func.similarity(User.email, query)),
+            Double,
+        ).label("score")
+
+        stmt = (
+            select(User, score)
+            .where(or_(_full_name.ilike(pattern), User.email.ilike(pattern)))
+            .order_by(score.desc(), User.id)
+            .limit(page_size + 1)
+        )
+        if after is not None:
+            last_score, last_id = after
+            last_id = uuid.UUID(last_id)
+            stmt = stmt.where(
+                or_(score < last_score, and_(score == last_score, User.id > last_id))
+            )
+
+        return [(user, float(s)) for user, s in db.execute(stmt).all()]
+
+    def _search_trie(self, db, query, page_size, after):
+        with self._lock:
+            if self._trie is None:
+                self._build(db)
+
+            ranked = []
+            for user_id in self._trie.search(query) if query else list(self._users):
+                best = max(
+                    (len(query) / len(term) for term in self._terms[user_id] if term.startswith(query)),
+                    default=0.0,
+                )
+                ranked.append((-best, user_id))
+            ranked.sort()
+
+            if after is not None:
+                last_score, last_id = after
+                ranked = [r for r in ranked if r > (-last_score, last_id)]
+
+            return [(self._users[user_id], -neg) for neg, user_id in ranked[:page_size + 1]]
+
+    def _build(self, db):
+        self._trie = PrefixTrie()
+        for user in db.scalars(select(User)).all():
+            self._index(user)
+
+    @staticmethod
+    def _user_terms(user):
+        name = (user.name or "").lower()
+        surname = (user.surname or "").lower()
+        return {t for t in (name, surname, f"{name} {surname}", (user.email or "").lower()) if t}
+
+    def _index(self, user):
+        user_id = str(user.id)
+        terms = self._user_terms(user)
+        for term in terms:
+            self._trie.insert(term, user_id)
+        self._terms[user_id] = terms
+        self._users[user_id] = user
+
+    def _remove(self, user_id):
+        for term in self._terms.pop(user_id, ()):
+            self._trie.remove(term, user_id)
+        self._users.pop(user_id, None)
+
+    def index_user(self, user):
+        if self.use_trigram or self._trie is None:
+            return
+        with self._lock:
+            self._remove(str(user.id))
+            self._index(user)
+
+    def remove_user(self, user_id):
+        if self.use_trigram or self._trie is None:
+            return
+        with self._lock:
+            self._remove(str(user_id))
+
+
+user_search = UserSearch(engine)
@@ -0,0 +1,64 @@
+"""Measures per-hash latency of password hash settings on this host.
+
+Defaults to the configured policy; pass several values to compare them:
+
+    python -m bench.hashing --scheme bcrypt --rounds 10 11 12 13
+"""
+import argparse
+import statistics
+import time
+
+from app.services.hashing import (
+    ARGON2_MEMORY_COST,
+    ARGON2_PARALLELISM,
+    ARGON2_TIME_COST,
+    BCRYPT_ROUNDS,
+    PASSWORD_SCHEME,
+    build_context,
+)
+
+
+def benchmark(context, samples):
+    password = "benchmark-password"
+    hashed = context.hash(password)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.verify(password, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return statistics.median(timings), p99, timings[-1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default=PASSWORD_SCHEME)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[BCRYPT_ROUNDS])
+    parser.add_argument("--memory-cost", type=int, nargs="+", default=[ARGON2_MEMORY_COST])
+    parser.add_argument("--time-cost", type=int, nargs="+", default=[ARGON2_TIME_COST])
+    parser.add_argument("--parallelism", type=int, default=ARGON2_PARALLELISM)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.scheme == "bcrypt":
+        settings = [(f"bcrypt rounds={r}", build_context("bcrypt", bcrypt_rounds=r)) for r in args.rounds]
+    else:
+        settings = [
+            (
+                f"argon2 m={m} t={t} p={args.parallelism}",
+                build_context(
+                    "argon2",
+                    argon2_memory_cost=m,
+                    argon2_time_cost=t,
+                    argon2_parallelism=args.parallelism,
+                ),
+            )
+            for m in args.memory_cost
+            for t in args.time_cost
+        ]
+
+    print(f"{'setting':<36}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for label, context in settings:
+        p50, p99, worst = benchmark(context, args.samples)
+        print(f"{label:<36}{p50:>10.1f}{p99:>10.1f}{worst:>10.1f}")
@@ -0,0 +1,71 @@
+"""Times SearchUsers queries against the configured database.
+
+With --seed, synthetic users are inserted first (Postgres only) under
+emails unique to the run, and deleted again once it is done.
+
+    python -m bench.user_search --seed 1000000 --queries jo kova anna12
+"""
+import argparse
+import statistics
+import time
+import uuid
+
+from sqlalchemy import text
+
+from app.database import SessionLocal, engine
+from app.services.user_search import SEARCH_PAGE_SIZE, user_search
+
+_SEED_USERS = """
+INSERT INTO users (id, name, surname, email, password, created_at)
+SELECT gen_random_uuid(),
+       (ARRAY['John', 'Anna', 'Mykhailo', 'Olena', 'Peter', 'Maria', 'Ivan', 'Sofia'])[1 + i % 8] || i,
+       (ARRAY['Smith', 'Kovalenko', 'Johnson', 'Shevchenko', 'Brown', 'Bondar'])[1 + i % 6] || (i / 7),
+       :prefix || i || '@example.com',
+       '',
+       now()
+FROM generate_series(1, :count) AS i
+"""
+
+_DELETE_USERS = "DELETE FROM users WHERE email LIKE :prefix || '%@example.com'"
+
+
+def run(queries, pages, samples):
+    print(f"{'query':<16}{'page':>6}{'p50 ms':>10}{'max ms':>10}{'rows':>6}")
+    db = SessionLocal()
+    try:
+        for query in queries:
+            token = ""
+            for page in range(1, pages + 1):
+                timings = []
+                for _ in range(samples):
+                    started = time.perf_counter()
+                    users, next_token = user_search.search(db, query, SEARCH_PAGE_SIZE, token)
+                    timings.append((time.perf_counter() - started) * 1000)
+                print(f"{query:<16}{page:>6}{statistics.median(timings):>10.1f}{max(timings):>10.1f}{len(users):>6}")
+                if not next_token:
+                    break
+                token = next_token
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--seed", type=int, default=0, help="insert N synthetic users first")
+    parser.add_argument("--queries", nargs="+", default=["jo", "kova", "anna12"])
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--samples", type=int, default=10)
+    args = parser.parse_args()
+
+    prefix = f"bench-{uuid.uuid4().hex[:8]}-"
+    try:
+        if args.seed:
+            started = time.perf_counter()
+            with engine.begin() as conn:
+                conn.execute(text(_SEED_USERS), {"count": args.seed, "prefix": prefix})
+            print(f"seeded {args.seed} users in {time.perf_counter() - started:.1f}s")
+        run(args.queries, args.pages, args.samples)
+    finally:
+        if args.seed:
+            with engine.begin() as conn:
+                conn.execute(text(_DELETE_USERS), {"prefix": prefix})
@@ -0,0 +1,28 @@
+"""Redis caching shared by the Task.io services.
+
+``readthrough`` holds ``ReadThroughCache``: single-flight rebuilds behind
+a Redis lease, probabilistic early refresh and jittered TTLs for the
+values the services cache per project. ``codecs`` turns those values into
+the bytes stored in Redis (JSON, orjson or msgpack, optionally zstd
+compressed) and ``codec_bench`` compares them. ``local`` holds the
+in-process ``LocalCache`` (L1) in front of Redis and the
+``InvalidationListener`` keeping it coherent, ``tags`` the tag-based
+invalidation of cached keys and ``batch`` the pipeline sending the cache
+writes of a unit of work in one round trip.
+"""
+from taskio_cache.codecs import make_codec
+from taskio_cache.local import InvalidationListener, LocalCache
+from taskio_cache.readthrough import ReadThroughCache, jittered_ttl
+from taskio_cache.tags import invalidate_tags
+
+__version__ = "1.5.0"
+
+__all__ = [
+    "InvalidationListener",
+    "LocalCache",
+    "ReadThroughCache",
+    "invalidate_tags",
+    "jittered_ttl",
+    "make_codec",
+    "__version__",
+]
@@ -0,0 +1,112 @@
+"""Redis writes of one unit of work, sent in a single round trip.
+
+A service call that writes to the database then updates the cache with
+one command per key pays a network round trip per command on the path
+of the response. A ``Batch`` collects those commands on one pipeline,
+without MULTI/EXEC, and sends them when the unit of work is done.
+``ReadThroughCache.batch`` makes one current for a block of code, so the
+cache writes inside it are queued rather than sent.
+
+Scripts are queued as ``EVAL`` with their source: a pipeline holding
+registered scripts (``EVALSHA``) first asks the server whether it knows
+them, an extra round trip. Redis keeps the compiled scripts either way.
+
+With ``CACHE_FLUSH_BACKGROUND=1`` batches are sent by a daemon thread,
+in the order they were flushed, and the caller does not wait. The keys
+the caller itself wrote or invalidated are dropped from its L1 right
+away, but other readers, and keys invalidated by tag, see the write only
+once the batch is sent, usually within a millisecond. Off by default:
+it gives up read-your-writes across replicas for a shorter response.
+"""
+import logging
+import os
+import queue
+import threading
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+CACHE_FLUSH_BACKGROUND = os.getenv("CACHE_FLUSH_BACKGROUND", "0") == "1"
+
+
+class Batch:
+    """Commands queued on ``pipe``; ``flush`` sends them.
+
+    ``then(callback)`` calls ``callback`` with the reply of the command
+    queued last, once the batch has been sent.
+    """
+
+    def __init__(self, client):
+        self.pipe = client.pipeline(transaction=False)
+        # index of a command in the pipeline -> callbacks of its reply
+        self._callbacks = {}
+
+    def __len__(self):
+        return len(self.pipe)
+
+    def eval(self, script, keys, args):
+        """Queues ``script``, see the module docstring."""
+        self.pipe.eval(script, len(keys), *keys, *args)
+        return self
+
+    def then(self, callback):
+        self._callbacks.setdefault(len(self.pipe) - 1, []).append(callback)
+        return self
+
+    def send(self):
+        """Sends the queued commands; raises ``redis.RedisError``."""
+        if not len(self.pipe):
+            return
+        replies = self.pipe.execute()
+        for index, callbacks in self._callbacks.items():
+            for callback in callbacks:
+                callback(replies[index])
+
+    def flush(self, on_error=None, background=CACHE_FLUSH_BACKGROUND):
+        """Sends the queued commands, in the background if ``background``.
+
+        Redis errors are logged and reported to ``on_error()``.
+        """
+        if not len(self.pipe):
+            return
+        if background:
+            _flusher().put(self, on_error)
+            return
+        _send(self, on_error)
+
+
+def _send(batch, on_error):
+    try:
+        batch.send()
+    except redis.RedisError as e:
+        logger.warning("[CACHE] Batch of %d commands failed: %s", len(batch), e)
+        if on_error is not None:
+            on_error()
+
+
+class _Flusher:
+    """Daemon thread sending batches one at a time, in order."""
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        threading.Thread(target=self._run, name="cache-flusher", daemon=True).start()
+
+    def put(self, batch, on_error):
+        self._queue.put((batch, on_error))
+
+    def _run(self):
+        while True:
+            _send(*self._queue.get())
+
+
+_flusher_lock = threading.Lock()
+_flusher_instance = None
+
+
+def _flusher() -> _Flusher:
+    global _flusher_instance
+    with _flusher_lock:
+        if _flusher_instance is None:
+            _flusher_instance = _Flusher()
+        return _flusher_instance
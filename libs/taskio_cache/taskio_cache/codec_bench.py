@@ -0,0 +1,63 @@
+"""Compares the cache codecs on task lists shaped like the cached ones.
+
+For each codec, with and without compression above ``--min-bytes``:
+payload size and encode/decode time per list, best of five runs. Codecs
+whose optional dependency is missing are skipped.
+
+    python -m taskio_cache.codec_bench --tasks 10 100 1000
+"""
+import argparse
+import timeit
+import uuid
+
+from taskio_cache.codecs import CODECS, make_codec
+
+
+def _tasks(count) -> list[dict]:
+    project_id = str(uuid.uuid4())
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "title": f"Task {i}",
+            "description": "Lorem ipsum dolor sit amet " * (i % 4),
+            "priority": i % 5,
+            "type": "bug" if i % 3 else "feature",
+            "status": "in progress" if i % 2 else "to do",
+            "assigned_to": str(uuid.uuid4()) if i % 2 else None,
+            "epic_id": None,
+            "sprint_id": None,
+            "project_id": project_id,
+            "start_date": "2026-01-05",
+            "end_date": "2026-02-13",
+        }
+        for i in range(count)
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--min-bytes", type=int, default=1024, help="compression threshold")
+    args = parser.parse_args()
+
+    codecs = []
+    for name in CODECS:
+        for min_bytes in (0, args.min_bytes):
+            try:
+                codecs.append(make_codec(name, min_bytes))
+            except ImportError as e:
+                print(f"skipping {name}{'+zstd' if min_bytes else ''}: {e}")
+
+    print(f"{'tasks':>6}  {'codec':<14}{'bytes':>10}{'encode us':>12}{'decode us':>12}")
+    for count in args.tasks:
+        tasks = _tasks(count)
+        number = max(1, 20000 // count)
+        for codec in codecs:
+            data = codec.encode(tasks)
+            assert codec.decode(data) == tasks
+            encode = min(timeit.repeat(lambda: codec.encode(tasks), number=number, repeat=5))
+            decode = min(timeit.repeat(lambda: codec.decode(data), number=number, repeat=5))
+            print(
+                f"{count:>6}  {codec.name:<14}{len(data):>10}"
+                f"{encode / number * 1e6:>12.1f}{decode / number * 1e6:>12.1f}"
+            )
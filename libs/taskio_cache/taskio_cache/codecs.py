@@ -0,0 +1,125 @@
+"""Serialization of cached values to bytes.
+
+A codec has a ``name`` and ``encode``/``decode`` between a value and
+bytes. ``ReadThroughCache`` stores the name next to each value, so values
+written with another codec, for example during a rolling deploy that
+changes ``CACHE_CODEC``, read as misses instead of failing to decode.
+
+* ``json``: the standard library, always available
+* ``orjson``: the same JSON, encoded and decoded several times faster
+* ``msgpack``: binary, smaller than JSON for the short strings and
+  integers the services cache
+
+Any of them can be wrapped in ``Compressed``, which zstd-compresses
+payloads of at least ``CACHE_COMPRESS_MIN_BYTES``; smaller ones are not
+worth the CPU. orjson, msgpack and zstandard are optional, installed with
+the ``orjson``, ``msgpack`` and ``zstd`` extras of this package;
+``codec_bench`` compares them.
+"""
+import json
+import os
+import threading
+
+CACHE_CODEC = os.getenv("CACHE_CODEC", "json")
+# 0 disables compression
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", 0))
+CACHE_COMPRESS_LEVEL = int(os.getenv("CACHE_COMPRESS_LEVEL", 3))
+
+
+def _require(module, extra):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise ImportError(f"{module} is not installed, pip install taskio-cache[{extra}]") from None
+
+
+class JsonCodec:
+    name = "json"
+
+    def encode(self, value) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes):
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        self._orjson = _require("orjson", "orjson")
+
+    def encode(self, value) -> bytes:
+        return self._orjson.dumps(value)
+
+    def decode(self, data: bytes):
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec:
+    name = "msgpack"
+
+    def __init__(self):
+        self._msgpack = _require("msgpack", "msgpack")
+
+    def encode(self, value) -> bytes:
+        return self._msgpack.packb(value)
+
+    def decode(self, data: bytes):
+        return self._msgpack.unpackb(data)
+
+
+class Compressed:
+    """``codec`` with payloads of at least ``min_bytes`` zstd-compressed.
+
+    Each payload starts with one byte telling whether the rest is
+    compressed, so the threshold can change without invalidating values.
+    """
+
+    _PLAIN = b"\x00"
+    _ZSTD = b"\x01"
+
+    def __init__(self, codec, min_bytes, level=CACHE_COMPRESS_LEVEL):
+        self._zstd = _require("zstandard", "zstd")
+        self.codec = codec
+        self.name = f"{codec.name}+zstd"
+        self.min_bytes = min_bytes
+        self.level = level
+        # zstandard (de)compressors must not be shared between threads
+        self._local = threading.local()
+
+    def _compressor(self):
+        if not hasattr(self._local, "compressor"):
+            self._local.compressor = self._zstd.ZstdCompressor(level=self.level)
+            self._local.decompressor = self._zstd.ZstdDecompressor()
+        return self._local.compressor, self._local.decompressor
+
+    def encode(self, value) -> bytes:
+        data = self.codec.encode(value)
+        if len(data) < self.min_bytes:
+            return self._PLAIN + data
+        return self._ZSTD + self._compressor()[0].compress(data)
+
+    def decode(self, data: bytes):
+        if data[:1] == self._ZSTD:
+            return self.codec.decode(self._compressor()[1].decompress(data[1:]))
+        return self.codec.decode(data[1:])
+
+
+CODECS = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgpack": MsgpackCodec,
+}
+
+
+def make_codec(name=CACHE_CODEC, compress_min_bytes=CACHE_COMPRESS_MIN_BYTES):
+    """The codec called ``name``, compressed if ``compress_min_bytes`` is set."""
+    try:
+        codec = CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown cache codec {name!r}, one of {', '.join(CODECS)}") from None
+    if compress_min_bytes > 0:
+        return Compressed(codec, compress_min_bytes)
+    return codec
+
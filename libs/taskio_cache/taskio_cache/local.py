@@ -0,0 +1,205 @@
+"""In-process cache (L1) in front of the Redis caches.
+
+A Redis hit still costs a round trip and a decode. ``LocalCache`` keeps
+the hottest values in process memory, bounded by ``CACHE_L1_BYTES`` of
+their encoded size rather than by a number of entries, as one task list
+can weigh as much as a thousand projects.
+
+Eviction is LRU, with TinyLFU admission (Einziger et al., ACM TOS 2017):
+a count-min sketch estimates how often each key was asked for recently,
+and a new key only displaces the least recently used ones if it was
+asked for more often than them. A scan over many one-off keys therefore
+cannot flush the hot ones. The sketch halves its counters every
+``10 * width`` increments, so past popularity fades.
+
+Coherence: every write to a cached key publishes the key on
+``CACHE_CHANNEL`` (see ``ReadThroughCache.invalidate``), and the
+``InvalidationListener`` of every process drops it from its L1, within
+the pub/sub latency. Like ``LookupCache``, the L1 counts invalidations,
+and a value read before the last one is not stored, so a read racing a
+write cannot put back what the write replaced. Messages published while
+the listener is reconnecting are lost, so it clears the whole L1 every
+time it subscribes, and no entry lives longer than ``CACHE_L1_TTL``
+seconds either way.
+
+Values are shared by every caller that reads them: treat them as
+read-only.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+CACHE_CHANNEL = os.getenv("CACHE_CHANNEL", "cache_invalidations")
+# 0 disables the L1
+CACHE_L1_BYTES = int(os.getenv("CACHE_L1_BYTES", 64 * 1024 * 1024))
+CACHE_L1_TTL = float(os.getenv("CACHE_L1_TTL", 60))
+
+_SKETCH_DEPTH = 4
+_SKETCH_MAX = 15
+# Odd multipliers spreading one hash over the sketch rows
+_SKETCH_SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+_HALVE = bytes(count >> 1 for count in range(256))
+
+
+class _FrequencySketch:
+    """Count-min sketch of recent key frequencies, 4-bit saturating counters."""
+
+    def __init__(self, width):
+        self.width = 1 << max(4, (width - 1).bit_length())
+        self._mask = self.width - 1
+        self._rows = [bytearray(self.width) for _ in range(_SKETCH_DEPTH)]
+        self._additions = 0
+        self._reset_at = 10 * self.width
+
+    def _indexes(self, key):
+        h = hash(key)
+        return [((h ^ (h >> 16)) * seed >> 8) & self._mask for seed in _SKETCH_SEEDS]
+
+    def frequency(self, key) -> int:
+        return min(row[i] for row, i in zip(self._rows, self._indexes(key)))
+
+    def increment(self, key):
+        for row, i in zip(self._rows, self._indexes(key)):
+            if row[i] < _SKETCH_MAX:
+                row[i] += 1
+        self._additions += 1
+        if self._additions >= self._reset_at:
+            for row in self._rows:
+                row[:] = row.translate(_HALVE)
+            self._additions //= 2
+
+
+class LocalCache:
+    """Bytes-bounded LRU with TinyLFU admission, safe to share between threads."""
+
+    def __init__(self, max_bytes=CACHE_L1_BYTES, ttl=CACHE_L1_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (value, size, expires_at), least recently used first
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # Sized for entries of ~1 KiB, the smaller values cached
+        self._sketch = _FrequencySketch(max(1024, max_bytes // 1024))
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a read that raced one is not stored
+        self.generation = 0
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "rejections": 0,
+            "invalidations": 0,
+        }
+
+    def get(self, key):
+        """The value at ``key``, None if it is not cached."""
+        with self._lock:
+            self._sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= time.time():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry[0]
+
+    def put(self, key, value, size, expires_at=None, generation=None) -> bool:
+        """Stores ``value`` as ``size`` bytes until ``expires_at`` at the latest.
+
+        ``generation`` is ``self.generation`` read before ``value`` was;
+        if anything was invalidated since, the value is not stored. Returns
+        whether it was.
+        """
+        expires_at = min(expires_at or float("inf"), time.time() + self.ttl)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            if size > self.max_bytes:
+                self._counters["rejections"] += 1
+                return False
+            if key in self._entries:
+                self._remove(key)
+
+            victims, freed = [], 0
+            candidates = iter(self._entries)
+            while self._bytes - freed + size > self.max_bytes:
+                victim = next(candidates)
+                if self._sketch.frequency(victim) >= self._sketch.frequency(key):
+                    self._counters["rejections"] += 1
+                    return False
+                victims.append(victim)
+                freed += self._entries[victim][1]
+
+            for victim in victims:
+                self._remove(victim)
+                self._counters["evictions"] += 1
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            return True
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key)[1]
+
+    def invalidate(self, *keys):
+        """Drops ``keys``, every key if none are given."""
+        with self._lock:
+            self.generation += 1
+            self._counters["invalidations"] += 1
+            if not keys:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+
+    def stats(self, prefix="l1") -> dict[str, float]:
+        with self._lock:
+            stats = {f"{prefix}_{name}": float(count) for name, count in self._counters.items()}
+            stats[f"{prefix}_bytes"] = float(self._bytes)
+            stats[f"{prefix}_entries"] = float(len(self._entries))
+        return stats
+
+
+class InvalidationListener:
+    """Applies the keys published on ``channel`` to a ``LocalCache``, in a daemon thread.
+
+    ``client`` must decode responses. Start it in the process that serves
+    requests, after any fork.
+    """
+
+    def __init__(self, client, local, channel=CACHE_CHANNEL, retry_delay=1.0):
+        self.client = client
+        self.local = local
+        self.channel = channel
+        self.retry_delay = retry_delay
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="cache-listener", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                self.local.invalidate()
+                for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.local.invalidate(*message["data"].split("\n"))
+            except redis.RedisError as e:
+                logger.warning("[CACHE] Invalidation channel lost (%s), retrying", e)
+                time.sleep(self.retry_delay)
+            finally:
+                pubsub.close()
@@ -0,0 +1,472 @@
+"""Read-through caching with stampede protection.
+
+The services used to ``GET`` a key and, on a miss, load it from Postgres
+and ``SETEX`` it. When a hot key expired, every request in flight missed
+at once and each one ran the same query. ``ReadThroughCache`` prevents
+that in three ways:
+
+* Single flight: on a miss, only the caller that takes the
+  ``<key>:lease`` (``SET NX PX``) runs the loader. The others poll for the
+  value and fall back to loading it themselves only after
+  ``CACHE_LEASE_WAIT`` seconds.
+* Early refresh (XFetch, Vattani et al., VLDB 2015): every value is stored
+  with the time its load took and when it expires. A reader refreshes it
+  before expiry with a probability that grows as expiry nears and with the
+  load time, so the refresh usually happens while the old value is still
+  served. A reader that decides to refresh but does not get the lease
+  keeps serving the current value.
+* Jittered TTLs: each write shortens the TTL by up to ``CACHE_TTL_JITTER``
+  of itself, so keys written together do not expire together.
+
+A rebuild must not store what it loaded before a write landed, or the
+write would be undone for a whole TTL. The rebuilding caller bumps the
+key's ``<key>:gen`` before loading, and stores its value only if the
+generation is still the one it got. ``set`` and ``invalidate_tags`` bump
+it too.
+
+With a ``LocalCache`` (``local``), values read from Redis are also kept
+in process memory and served from there until a write publishes their
+key; every write through this class publishes the keys it changed.
+Values can be stored with tags (see ``tags``), for writes to drop with
+``invalidate_tags``. Inside ``batch()``, the writes are queued and sent
+in one round trip at the end of the block (see ``batch``).
+
+Values are stored as ``<expires_at>:<load seconds>:<codec>:<payload>``,
+the payload encoded by one of ``codecs``, so the clients must not decode
+responses (``decode_responses=False``). A value in any other format or
+written with another codec reads as a miss. Redis errors also read as
+misses and are counted; the loader then answers from the database.
+"""
+import asyncio
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import redis
+
+from taskio_cache.batch import Batch
+from taskio_cache.codecs import make_codec
+from taskio_cache import tags as cache_tags
+from taskio_cache.local import CACHE_CHANNEL
+
+CACHE_TTL_JITTER = float(os.getenv("CACHE_TTL_JITTER", 0.1))
+# Higher refreshes earlier; 1.0 is the value the XFetch paper recommends
+CACHE_XFETCH_BETA = float(os.getenv("CACHE_XFETCH_BETA", 1.0))
+CACHE_LEASE_MS = int(os.getenv("CACHE_LEASE_MS", 5000))
+CACHE_LEASE_WAIT = float(os.getenv("CACHE_LEASE_WAIT", 2.0))
+_POLL_INTERVAL = 0.02
+
+# Deletes the lease only if it is still ours, it may have expired and
+# been taken by another caller
+_RELEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# KEYS: the key, its generation key
+# ARGV: the generation seen before loading, the value, its ttl
+_STORE = """
+if redis.call('GET', KEYS[2]) ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+
+def jittered_ttl(ttl, jitter=CACHE_TTL_JITTER) -> int:
+    """``ttl`` seconds shortened by a random fraction of at most ``jitter``."""
+    return max(1, round(ttl * (1 - random.uniform(0, jitter))))
+
+
+def _lease_key(key) -> str:
+    return f"{key}:lease"
+
+
+def _gen_key(key) -> str:
+    return f"{key}:gen"
+
+
+def _encode(codec, value, load_seconds, expires_at) -> bytes:
+    return f"{expires_at:.3f}:{load_seconds:.4f}:{codec.name}:".encode() + codec.encode(value)
+
+
+def _decode(codec, raw):
+    """(value, load seconds, expires_at) of a stored value, None if it is not one."""
+    if not raw or not isinstance(raw, bytes):
+        return None
+    try:
+        expires_at, load_seconds, name, payload = raw.split(b":", 3)
+        if name.decode() != codec.name:
+            return None
+        return codec.decode(payload), float(load_seconds), float(expires_at)
+    except Exception:
+        # Whatever the codec raises on a payload it did not write
+        return None
+
+
+class ReadThroughCache:
+    """Values cached in Redis, loaded through a caller-supplied loader.
+
+    ``get`` and ``set`` use ``client``; ``aget`` and ``aset`` use
+    ``async_client``, for the grpc.aio server mode; both must return
+    bytes. ``codec`` defaults to the one ``CACHE_CODEC`` and
+    ``CACHE_COMPRESS_MIN_BYTES`` configure. A loader returning None is
+    not cached, so a missing row is looked up again next time.
+
+    ``tags`` of ``get`` and ``set`` are registered with the value; for
+    ``get`` they may be a function of the loaded value. Keys written
+    other than through ``set`` or ``invalidate_tags``, such as the task
+    list hashes, must be passed to ``invalidate`` so that the L1s drop
+    them.
+    """
+
+    def __init__(
+        self,
+        client,
+        async_client=None,
+        beta=CACHE_XFETCH_BETA,
+        lease_ms=CACHE_LEASE_MS,
+        lease_wait=CACHE_LEASE_WAIT,
+        codec=None,
+        local=None,
+        channel=CACHE_CHANNEL,
+    ):
+        self.client = client
+        self.async_client = async_client
+        self.beta = beta
+        self.lease_ms = lease_ms
+        self.lease_wait = lease_wait
+        self.codec = codec or make_codec()
+        self.local = local
+        self.channel = channel
+        self._batch = ContextVar(f"cache_batch_{id(self)}", default=None)
+        self._release = client.register_script(_RELEASE)
+        self._async_release = async_client.register_script(_RELEASE) if async_client else None
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "early_refreshes": 0,
+            "loads": 0,
+            "lease_waits": 0,
+            "lease_timeouts": 0,
+            "stale_loads": 0,
+            "redis_errors": 0,
+        }
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def stats(self, prefix="cache") -> dict[str, float]:
+        with self._lock:
+            stats = {f"{prefix}_{name}": float(count) for name, count in self._counters.items()}
+        if self.local is not None:
+            stats.update(self.local.stats(f"{prefix}_l1"))
+        return stats
+
+    def _refresh_early(self, load_seconds, expires_at) -> bool:
+        # -log(u) for u in (0, 1] is exponentially distributed, so most
+        # readers look only slightly ahead and a few look much further
+        ahead = -load_seconds * self.beta * math.log(1.0 - random.random())
+        return time.time() + ahead >= expires_at
+
+    def _timed_load(self, loader):
+        started = time.perf_counter()
+        value = loader()
+        self._count("loads")
+        return value, time.perf_counter() - started
+
+    # Sync
+
+    def acquire(self, key):
+        """Takes the rebuild lease of ``key``; returns its token, or None if it is held."""
+        token = uuid.uuid4().hex
+        if self.client.set(_lease_key(key), token, nx=True, px=self.lease_ms):
+            return token
+        return None
+
+    def release(self, key, token):
+        try:
+            self._release(keys=[_lease_key(key)], args=[token])
+        except redis.RedisError:
+            # Left to expire after lease_ms
+            self._count("redis_errors")
+
+    def _announce(self, keys) -> str:
+        """Drops ``keys`` from this process's L1; returns the message telling the others."""
+        if self.local is not None:
+            self.local.invalidate(*keys)
+        return "\n".join(keys)
+
+    @contextmanager
+    def batch(self):
+        """Queues the ``set``, ``invalidate`` and ``invalidate_tags`` inside on one ``Batch``.
+
+        The batch is flushed at the end of the block, also if it raises,
+        as the cache writes follow database writes that already happened.
+        A nested block joins the outer one. Yields the batch, for other
+        commands of the same unit of work.
+        """
+        batch = self._batch.get()
+        if batch is not None:
+            yield batch
+            return
+        batch = Batch(self.client)
+        token = self._batch.set(batch)
+        try:
+            yield batch
+        finally:
+            self._batch.reset(token)
+            batch.flush(on_error=lambda: self._count("redis_errors"))
+
+    def invalidate(self, *keys, pipe=None):
+        """Tells every L1 that ``keys`` changed; queued on ``pipe`` if given."""
+        message = self._announce(keys)
+        batch = self._batch.get()
+        if pipe is None and batch is not None:
+            pipe = batch.pipe
+        if pipe is not None:
+            pipe.publish(self.channel, message)
+            return
+        try:
+            self.client.publish(self.channel, message)
+        except redis.RedisError:
+            self._count("redis_errors")
+
+    def invalidate_tags(self, *tags):
+        """Drops every key registered under ``tags``, from Redis and every L1."""
+        batch = self._batch.get()
+        if batch is not None and tags:
+            cache_tags.queue_invalidate(batch, *tags, channel=self.channel).then(self._dropped)
+            return
+        try:
+            keys = cache_tags.invalidate_tags(self.client, *tags, channel=self.channel)
+        except redis.RedisError:
+            self._count("redis_errors")
+            return
+        self._dropped(keys)
+
+    def _dropped(self, keys):
+        keys = cache_tags.decoded(keys)
+        if keys and self.local is not None:
+            self.local.invalidate(*keys)
+
+    def _queue_generation(self, pipe, key, ttl):
+        """Queues the bump of ``key``'s generation, kept for ``ttl`` seconds."""
+        pipe.incr(_gen_key(key))
+        pipe.expire(_gen_key(key), ttl)
+
+    def _queue_set(self, pipe, key, ttl, value, load_seconds, tags, generation=None):
+        """Queues the write of ``value``; if ``generation`` is given, only while it is current."""
+        ttl = jittered_ttl(ttl)
+        raw = _encode(self.codec, value, load_seconds, time.time() + ttl)
+        if generation is None:
+            pipe.set(key, raw, ex=ttl)
+            # A rebuild in flight read the value this one replaces
+            self._queue_generation(pipe, key, ttl)
+        else:
+            pipe.eval(_STORE, 2, key, _gen_key(key), generation, raw, ttl)
+        cache_tags.register(pipe, key, ttl, tags(value) if callable(tags) else tags)
+        pipe.publish(self.channel, self._announce([key]))
+
+    def set(self, key, ttl, value, load_seconds=0.0, tags=()):
+        """Writes ``value`` through to the cache; use it after a write."""
+        batch = self._batch.get()
+        if batch is not None:
+            self._queue_set(batch.pipe, key, ttl, value, load_seconds, tags)
+            return
+        pipe = self.client.pipeline(transaction=False)
+        self._queue_set(pipe, key, ttl, value, load_seconds, tags)
+        try:
+            pipe.execute()
+        except redis.RedisError:
+            self._count("redis_errors")
+
+    def _read(self, key):
+        generation = None
+        if self.local is not None:
+            entry = self.local.get(key)
+            if entry is not None:
+                return entry
+            generation = self.local.generation
+        try:
+            raw = self.client.get(key)
+        except redis.RedisError:
+            self._count("redis_errors")
+            return None
+        return self._decoded(key, raw, generation)
+
+    def _decoded(self, key, raw, generation):
+        entry = _decode(self.codec, raw)
+        if entry is not None and self.local is not None:
+            self.local.put(key, entry, len(raw), entry[2], generation)
+        return entry
+
+    def _stored(self, replies):
+        if not replies[0]:
+            self._count("stale_loads")
+
+    def _rebuild(self, key, ttl, loader, token, tags):
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            self._queue_generation(pipe, key, ttl)
+            try:
+                generation = pipe.execute()[0]
+            except redis.RedisError:
+                self._count("redis_errors")
+                return self._timed_load(loader)[0]
+            value, load_seconds = self._timed_load(loader)
+            if value is not None:
+                pipe = self.client.pipeline(transaction=False)
+                self._queue_set(pipe, key, ttl, value, load_seconds, tags, generation)
+                try:
+                    self._stored(pipe.execute())
+                except redis.RedisError:
+                    self._count("redis_errors")
+            return value
+        finally:
+            self.release(key, token)
+
+    def get(self, key, ttl, loader, tags=()):
+        """The value at ``key``, loaded with ``loader()`` and cached for ``ttl`` seconds if missing."""
+        entry = self._read(key)
+        if entry is not None:
+            value, load_seconds, expires_at = entry
+            if self._refresh_early(load_seconds, expires_at):
+                try:
+                    token = self.acquire(key)
+                except redis.RedisError:
+                    self._count("redis_errors")
+                    token = None
+                if token is not None:
+                    self._count("early_refreshes")
+                    return self._rebuild(key, ttl, loader, token, tags)
+            self._count("hits")
+            return value
+
+        self._count("misses")
+        try:
+            token = self.acquire(key)
+        except redis.RedisError:
+            self._count("redis_errors")
+            return self._timed_load(loader)[0]
+        if token is not None:
+            return self._rebuild(key, ttl, loader, token, tags)
+
+        self._count("lease_waits")
+        deadline = time.monotonic() + self.lease_wait
+        while time.monotonic() < deadline:
+            time.sleep(_POLL_INTERVAL)
+            entry = self._read(key)
+            if entry is not None:
+                return entry[0]
+        self._count("lease_timeouts")
+        return self._timed_load(loader)[0]
+
+    # Async, same flow as above
+
+    async def aacquire(self, key):
+        token = uuid.uuid4().hex
+        if await self.async_client.set(_lease_key(key), token, nx=True, px=self.lease_ms):
+            return token
+        return None
+
+    async def arelease(self, key, token):
+        try:
+            await self._async_release(keys=[_lease_key(key)], args=[token])
+        except redis.RedisError:
+            self._count("redis_errors")
+
+    async def aset(self, key, ttl, value, load_seconds=0.0, tags=()):
+        pipe = self.async_client.pipeline(transaction=False)
+        self._queue_set(pipe, key, ttl, value, load_seconds, tags)
+        try:
+            await pipe.execute()
+        except redis.RedisError:
+            self._count("redis_errors")
+
+    async def _aread(self, key):
+        generation = None
+        if self.local is not None:
+            entry = self.local.get(key)
+            if entry is not None:
+                return entry
+            generation = self.local.generation
+        try:
+            raw = await self.async_client.get(key)
+        except redis.RedisError:
+            self._count("redis_errors")
+            return None
+        return self._decoded(key, raw, generation)
+
+    async def _atimed_load(self, loader):
+        started = time.perf_counter()
+        value = await loader()
+        self._count("loads")
+        return value, time.perf_counter() - started
+
+    async def _arebuild(self, key, ttl, loader, token, tags):
+        try:
+            pipe = self.async_client.pipeline(transaction=False)
+            self._queue_generation(pipe, key, ttl)
+            try:
+                generation = (await pipe.execute())[0]
+            except redis.RedisError:
+                self._count("redis_errors")
+                return (await self._atimed_load(loader))[0]
+            value, load_seconds = await self._atimed_load(loader)
+            if value is not None:
+                pipe = self.async_client.pipeline(transaction=False)
+                self._queue_set(pipe, key, ttl, value, load_seconds, tags, generation)
+                try:
+                    self._stored(await pipe.execute())
+                except redis.RedisError:
+                    self._count("redis_errors")
+            return value
+        finally:
+            await self.arelease(key, token)
+
+    async def aget(self, key, ttl, loader, tags=()):
+        """get for coroutine ``loader`` functions."""
+        entry = await self._aread(key)
+        if entry is not None:
+            value, load_seconds, expires_at = entry
+            if self._refresh_early(load_seconds, expires_at):
+                try:
+                    token = await self.aacquire(key)
+                except redis.RedisError:
+                    self._count("redis_errors")
+                    token = None
+                if token is not None:
+                    self._count("early_refreshes")
+                    return await self._arebuild(key, ttl, loader, token, tags)
+            self._count("hits")
+            return value
+
+        self._count("misses")
+        try:
+            token = await self.aacquire(key)
+        except redis.RedisError:
+            self._count("redis_errors")
+            return (await self._atimed_load(loader))[0]
+        if token is not None:
+            return await self._arebuild(key, ttl, loader, token, tags)
+
+        self._count("lease_waits")
+        deadline = time.monotonic() + self.lease_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_POLL_INTERVAL)
+            entry = await self._aread(key)
+            if entry is not None:
+                return entry[0]
+        self._count("lease_timeouts")
+        return (await self._atimed_load(loader))[0]
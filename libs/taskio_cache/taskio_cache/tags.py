@@ -0,0 +1,80 @@
+"""Tag-based invalidation of cached keys.
+
+Every cached value registers the tags of what it was built from: its key
+is added to the Redis set ``tag:<tag>`` when it is stored. A write then
+invalidates by tag instead of listing the keys it may have made stale,
+and ``invalidate_tags`` drops every key of the given tags in one script
+call: it deletes them, bumps the ``<key>:gen`` of those that have one so
+a rebuild already in flight does not store what it read before the
+write, and publishes them on ``CACHE_CHANNEL`` for the L1s.
+
+The tags the services use:
+
+* ``project:<id>``: everything cached about a project
+* ``tasks:<project id>``: task lists and listing pages holding its tasks
+* ``sprints:<project id>``, ``epics:<project id>``: its sprint and epic lists
+* ``sprint:<id>``, ``epic:<id>``: task lists and listing pages of a
+  sprint or epic, including empty ones
+* ``user:<id>``: project member lists showing the user
+
+A tag set lives as long as the longest-lived key registered in it.
+Members whose key has expired meanwhile are harmless: deleting them is a
+no-op, or drops a newer value of the key one load early.
+"""
+from taskio_cache.local import CACHE_CHANNEL
+
+# KEYS: tag sets; ARGV: the invalidation channel.
+# The keys are read from the sets, so this needs a single Redis node.
+_INVALIDATE = """
+local dropped, seen = {}, {}
+for i = 1, #KEYS do
+    for _, key in ipairs(redis.call('SMEMBERS', KEYS[i])) do
+        if not seen[key] then
+            seen[key] = true
+            dropped[#dropped + 1] = key
+            redis.call('DEL', key)
+            if redis.call('EXISTS', key .. ':gen') == 1 then
+                redis.call('INCR', key .. ':gen')
+            end
+        end
+    end
+    redis.call('DEL', KEYS[i])
+end
+if #dropped > 0 then
+    redis.call('PUBLISH', ARGV[1], table.concat(dropped, '\\n'))
+end
+return dropped
+"""
+
+
+def tag_key(tag) -> str:
+    return f"tag:{tag}"
+
+
+def register(pipe, key, ttl, tags):
+    """Queues on ``pipe`` the registration of ``key``, cached for ``ttl`` seconds, under ``tags``."""
+    for tag in tags:
+        name = tag_key(tag)
+        pipe.sadd(name, key)
+        # NX sets the first expiry, GT only ever extends it
+        pipe.expire(name, ttl, nx=True)
+        pipe.expire(name, ttl, gt=True)
+
+
+def decoded(keys) -> list[str]:
+    return [key.decode() if isinstance(key, bytes) else key for key in keys]
+
+
+def invalidate_tags(client, *tags, channel=CACHE_CHANNEL) -> list[str]:
+    """Drops every key registered under ``tags``; returns them."""
+    if not tags:
+        return []
+    dropped = client.register_script(_INVALIDATE)(
+        keys=[tag_key(tag) for tag in tags], args=[channel]
+    )
+    return decoded(dropped)
+
+
+def queue_invalidate(batch, *tags, channel=CACHE_CHANNEL):
+    """Queues ``invalidate_tags`` on a ``Batch``; returns it, its reply is the dropped keys."""
+    return batch.eval(_INVALIDATE, [tag_key(tag) for tag in tags], [channel])
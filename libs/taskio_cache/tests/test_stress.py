@@ -0,0 +1,93 @@
+"""Counts the loads that concurrent readers of one hot key cause.
+
+The database is simulated by a load that sleeps. Two scenarios, each
+must cost a single load per miss with ReadThroughCache:
+
+* cold miss: many threads read a missing key at the same moment; the
+  old get/SETEX pattern loads once per reader there
+* expiry: the readers read the key in a loop while it expires every TTL;
+  each TTL period counts as one miss
+"""
+import json
+import threading
+import time
+
+import fakeredis
+import pytest
+
+from taskio_cache.readthrough import ReadThroughCache
+
+KEY = "taskio_cache:stress"
+READERS = 20
+LOAD_SECONDS = 0.1
+
+
+class _Database:
+    def __init__(self, load_seconds):
+        self.load_seconds = load_seconds
+        self.loads = 0
+        self._lock = threading.Lock()
+
+    def load(self):
+        with self._lock:
+            self.loads += 1
+        time.sleep(self.load_seconds)
+        return {"loaded_at": time.time()}
+
+
+def _naive_get(client, ttl, db):
+    raw = client.get(KEY)
+    if raw:
+        return json.loads(raw)
+    value = db.load()
+    client.setex(KEY, ttl, json.dumps(value))
+    return value
+
+
+def _run(readers, read):
+    start = threading.Barrier(readers)
+
+    def reader():
+        start.wait()
+        read()
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer(version=7))
+
+
+def test_cold_miss_loads_once(client):
+    db = _Database(LOAD_SECONDS)
+    cache = ReadThroughCache(client)
+    _run(READERS, lambda: cache.get(KEY, 2, db.load))
+    assert db.loads == 1
+
+
+def test_cold_miss_without_cache_loads_per_reader(client):
+    # The stampede the cache prevents, so that the test above means something
+    db = _Database(LOAD_SECONDS)
+    _run(READERS, lambda: _naive_get(client, 2, db))
+    assert db.loads > 1
+
+
+def test_expiry_loads_once_per_ttl(client):
+    ttl, seconds = 1, 3
+    db = _Database(LOAD_SECONDS / 2)
+    cache = ReadThroughCache(client)
+    deadline = time.monotonic() + seconds
+
+    def read_until_deadline():
+        while time.monotonic() < deadline:
+            cache.get(KEY, ttl, db.load)
+            time.sleep(0.005)
+
+    _run(READERS // 2, read_until_deadline)
+    # The first load, one per expiry, and room for one early refresh
+    assert db.loads <= seconds // ttl + 2
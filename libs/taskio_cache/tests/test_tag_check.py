@@ -0,0 +1,187 @@
+"""Random writes invalidating by tag never leave a stale read.
+
+A small in-memory model of projects, members, sprints, epics and tasks
+is cached through ReadThroughCache (with an L1) under the keys and tags
+the services use, see ``values``. Each step writes to the model at random
+and invalidates the tags the matching service write invalidates, then
+reads most cached values back: each must equal the one computed from the
+model. The first stale read fails the test with the writes that led to it.
+"""
+import random
+
+import fakeredis
+import pytest
+
+from taskio_cache.local import LocalCache
+from taskio_cache.readthrough import ReadThroughCache
+
+STEPS = 300
+TTL = 300
+
+
+class _Model:
+    """The database: a few projects, users, sprints, epics and tasks."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.projects = {p: f"project {p}" for p in range(3)}
+        self.users = {u: f"user {u}" for u in range(6)}
+        self.members = {p: set(rng.sample(sorted(self.users), 3)) for p in self.projects}
+        self.sprints = {}
+        self.epics = {}
+        # task -> [project, sprint, epic, title]
+        self.tasks = {}
+        self._next_id = 0
+        for p in self.projects:
+            for _ in range(6):
+                self.tasks[self._id()] = [p, None, None, "task"]
+
+    def _id(self):
+        self._next_id += 1
+        return self._next_id
+
+    # Cached values, as the services' loaders compute them; None is not cached
+
+    def values(self):
+        """key -> (loader, tags) of every value a reader may ask for."""
+        values = {}
+        for p in range(4):
+            values[f"project:{p}"] = (lambda p=p: self.projects.get(p), (f"project:{p}",))
+            values[f"project_users:{p}"] = (
+                lambda p=p: sorted([u, self.users[u]] for u in self.members.get(p, ())) or None,
+                lambda users, p=p: (f"project:{p}", *(f"user:{u}" for u, _ in users)),
+            )
+            for kind, entities in (("sprints", self.sprints), ("epics", self.epics)):
+                values[f"project_{kind}:{p}"] = (
+                    lambda p=p, entities=entities: sorted(e for e, ep in entities.items() if ep == p),
+                    (f"project:{p}", f"{kind}:{p}"),
+                )
+            values[f"project_task_map:{p}"] = (
+                lambda p=p: self._tasks(lambda t: t[0] == p),
+                (f"project:{p}", f"tasks:{p}"),
+            )
+        for kind, index, entities in (("sprint", 1, self.sprints), ("epic", 2, self.epics)):
+            for e in list(entities) + [self._next_id + 1]:
+                values[f"{kind}_task_map:{e}"] = (
+                    lambda e=e, index=index: self._tasks(lambda t: t[index] == e),
+                    lambda tasks, kind=kind, e=e: (
+                        f"{kind}:{e}",
+                        *(tag for task in tasks for tag in (f"project:{task[1]}", f"tasks:{task[1]}")),
+                    ),
+                )
+        return values
+
+    def _tasks(self, where):
+        return sorted([task_id, *task] for task_id, task in self.tasks.items() if where(task))
+
+    # Writes; each returns the tags the matching service write invalidates
+
+    def rename_project(self, p):
+        if p in self.projects:
+            self.projects[p] += "'"
+        return (f"project:{p}",)
+
+    def rename_user(self, u):
+        self.users[u] += "'"
+        return (f"user:{u}",)
+
+    def set_members(self, p):
+        if p in self.projects:
+            self.members[p] = set(self.rng.sample(sorted(self.users), self.rng.randint(1, 4)))
+        return (f"project:{p}",)
+
+    def delete_project(self, p):
+        self.projects.pop(p, None)
+        self.members.pop(p, None)
+        for entities in (self.sprints, self.epics):
+            for e in [e for e, ep in entities.items() if ep == p]:
+                del entities[e]
+        for task_id in [t for t, task in self.tasks.items() if task[0] == p]:
+            del self.tasks[task_id]
+        return (f"project:{p}",)
+
+    def _assign(self, kind, index, entities, e, p):
+        """Gives ``e`` (new, or existing and cleared) some free tasks of ``p``."""
+        for task in self.tasks.values():
+            if task[index] == e:
+                task[index] = None
+        free = [task for task in self.tasks.values() if task[0] == p and task[index] is None]
+        for task in self.rng.sample(free, min(len(free), self.rng.randint(0, 3))):
+            task[index] = e
+        entities[e] = p
+        return (f"{kind}s:{p}", f"{kind}:{e}", f"tasks:{p}")
+
+    def save_group(self, kind):
+        index, entities = (1, self.sprints) if kind == "sprint" else (2, self.epics)
+        p = self.rng.choice(sorted(self.projects) or [0])
+        if p not in self.projects:
+            return ()
+        if entities and self.rng.random() < 0.5:
+            e = self.rng.choice(sorted(entities))
+            old_p = entities[e]
+            return self._assign(kind, index, entities, e, old_p) + (f"{kind}s:{old_p}",)
+        return self._assign(kind, index, entities, self._id(), p)
+
+    def delete_group(self, kind):
+        index, entities = (1, self.sprints) if kind == "sprint" else (2, self.epics)
+        if not entities:
+            return ()
+        e = self.rng.choice(sorted(entities))
+        p = entities.pop(e)
+        for task in self.tasks.values():
+            if task[index] == e:
+                task[index] = None
+        return (f"{kind}s:{p}", f"{kind}:{e}", f"tasks:{p}")
+
+    def rename_task(self):
+        task = self.tasks[self.rng.choice(sorted(self.tasks))] if self.tasks else None
+        if task is None:
+            return ()
+        task[3] += "'"
+        return (f"tasks:{task[0]}",)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_no_stale_read(seed):
+    rng = random.Random(seed)
+    model = _Model(rng)
+    client = fakeredis.FakeRedis(server=fakeredis.FakeServer(version=7))
+    cache = ReadThroughCache(client, local=LocalCache(1 << 20))
+
+    writes = {
+        "rename project": lambda: model.rename_project(rng.randrange(4)),
+        "rename user": lambda: model.rename_user(rng.randrange(6)),
+        "set members": lambda: model.set_members(rng.randrange(4)),
+        "delete project": lambda: model.delete_project(rng.randrange(4)),
+        "save sprint": lambda: model.save_group("sprint"),
+        "save epic": lambda: model.save_group("epic"),
+        "delete sprint": lambda: model.delete_group("sprint"),
+        "delete epic": lambda: model.delete_group("epic"),
+        "rename task": model.rename_task,
+    }
+    history = []
+    for step in range(STEPS):
+        name = rng.choice(sorted(writes))
+        tags = writes[name]()
+        history.append(f"{name}: {tags}")
+        if tags:
+            cache.invalidate_tags(*tags)
+        # Half the time the L1 is dropped so that values come from Redis
+        if rng.random() < 0.5:
+            cache.local.invalidate()
+
+        # Reading most values after every write keeps them cached when the
+        # next one lands, and a stale one is caught before it is replaced
+        for key, (loader, tags) in sorted(model.values().items()):
+            if rng.random() < 0.2:
+                continue
+            expected = loader()
+            got = cache.get(key, TTL, loader, tags=tags)
+            assert got == expected, (
+                f"stale read of {key} after step {step}, last writes:\n  " + "\n  ".join(history[-10:])
+            )
+
+    stats = cache.stats()
+    # Both tiers were exercised, not only the loaders
+    assert stats["cache_l1_hits"] > 0
+    assert stats["cache_hits"] > stats["cache_l1_hits"]
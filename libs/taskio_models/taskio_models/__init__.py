@@ -0,0 +1,13 @@
+"""Schema shared by the Task.io services.
+
+``tables`` holds the table definitions, the single source of truth for
+columns and indexes (Alembic migrations are generated against
+``metadata``). ``orm`` maps all of them; services import only ``tables``
+and declare slim mappers for what they read. ``pool`` builds the
+instrumented engines, ``lookup`` caches the reference tables.
+"""
+from taskio_models.tables import metadata
+
+__version__ = "1.4.0"
+
+__all__ = ["metadata", "__version__"]
@@ -0,0 +1,159 @@
+"""In-process name <-> id maps of the reference tables.
+
+Statuses, task types, roles and project types are a few rows each and
+change only when they are seeded, yet every write used to look them up by
+name. ``LookupCache`` loads each table once per process and answers from
+memory.
+
+Whoever changes one of these tables calls ``publish_invalidation`` after
+the commit. Every process running a ``LookupListener`` then marks that
+table stale, and the next lookup reloads it. A name missing from a loaded
+map also triggers one reload, so a row added by a process that did not
+publish is still found.
+"""
+import logging
+import os
+import threading
+import time
+
+import redis
+from sqlalchemy import select
+from sqlalchemy.exc import NoResultFound, SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+LOOKUP_CHANNEL = os.getenv("LOOKUP_CHANNEL", "lookup_invalidations")
+
+
+class _Entry:
+    def __init__(self, table):
+        self.table = table
+        # (by_name, by_id) of the last load, None while stale
+        self.maps = None
+        # Bumped by every invalidation; a load that raced one is not kept
+        self.generation = 0
+        self.version = 0
+
+
+class LookupCache:
+    """Name <-> id maps of some reference tables, loaded through ``engine``."""
+
+    def __init__(self, engine, *tables):
+        self.engine = engine
+        self._entries = {table.name: _Entry(table) for table in tables}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._loads = 0
+        self._invalidations = 0
+
+    def _load(self, entry):
+        with self._lock:
+            generation = entry.generation
+        with self.engine.connect() as conn:
+            rows = conn.execute(select(entry.table.c.id, entry.table.c.name)).all()
+        maps = ({row.name: row.id for row in rows}, {row.id: row.name for row in rows})
+        with self._lock:
+            self._loads += 1
+            if entry.generation == generation:
+                entry.maps = maps
+                entry.version += 1
+        return maps
+
+    def _maps(self, table_name, reload=False):
+        entry = self._entries[table_name]
+        maps = entry.maps
+        if maps is None or reload:
+            return self._load(entry)
+        with self._lock:
+            self._hits += 1
+        return maps
+
+    def _lookup(self, table_name, index, key):
+        value = self._maps(table_name)[index].get(key)
+        if value is None:
+            value = self._maps(table_name, reload=True)[index].get(key)
+        if value is None:
+            raise NoResultFound(f"No row in {table_name} for {key!r}")
+        return value
+
+    def id_of(self, table_name, name):
+        """Id of the row called ``name``; raises ``NoResultFound`` like ``Query.one``."""
+        return self._lookup(table_name, 0, name)
+
+    def name_of(self, table_name, id):
+        return self._lookup(table_name, 1, id)
+
+    def preload(self):
+        """Loads every table now; one that fails is loaded on first use instead."""
+        for entry in self._entries.values():
+            try:
+                self._load(entry)
+            except SQLAlchemyError as e:
+                logger.warning("[LOOKUP] Could not preload %s (%s)", entry.table.name, e)
+
+    def invalidate(self, *table_names):
+        """Marks the given tables stale, all of them if none are given.
+
+        Names of tables this cache does not hold are ignored.
+        """
+        with self._lock:
+            for name in table_names or tuple(self._entries):
+                entry = self._entries.get(name)
+                if entry is None:
+                    continue
+                entry.maps = None
+                entry.generation += 1
+                self._invalidations += 1
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            stats = {
+                "lookup_hits": float(self._hits),
+                "lookup_loads": float(self._loads),
+                "lookup_invalidations": float(self._invalidations),
+            }
+            for name, entry in self._entries.items():
+                stats[f"lookup_{name}_version"] = float(entry.version)
+        return stats
+
+
+def publish_invalidation(client, *table_names):
+    """Tells every ``LookupListener`` that these tables changed."""
+    for name in table_names:
+        client.publish(LOOKUP_CHANNEL, name)
+
+
+class LookupListener:
+    """Applies published invalidations to a ``LookupCache``, in a daemon thread.
+
+    Messages published while the subscription is down are lost, so the
+    whole cache is invalidated every time the listener (re)subscribes.
+    Start it in the process that serves requests, after any fork.
+    """
+
+    def __init__(self, client, cache, channel=LOOKUP_CHANNEL, retry_delay=1.0):
+        self.client = client
+        self.cache = cache
+        self.channel = channel
+        self.retry_delay = retry_delay
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="lookup-listener", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                self.cache.invalidate()
+                for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.cache.invalidate(message["data"])
+            except redis.RedisError as e:
+                logger.warning("[LOOKUP] Invalidation channel lost (%s), retrying", e)
+                time.sleep(self.retry_delay)
+            finally:
+                pubsub.close()
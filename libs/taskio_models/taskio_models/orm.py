@@ -0,0 +1,100 @@
+"""Every table mapped, with all relationships.
+
+For scripts and tools that touch the whole schema. Services map only the
+tables they read in their own ``app/models/models.py``. Relationships load
+lazily; callers that need related rows ask for them with ``joinedload`` or
+``selectinload``.
+"""
+from sqlalchemy.orm import declarative_base, relationship
+
+from taskio_models import tables
+
+Base = declarative_base(metadata=tables.metadata)
+
+
+class User(Base):
+    __table__ = tables.users
+
+    assigned_tasks = relationship("Task", back_populates="assignee", cascade="all, delete-orphan")
+    project_links = relationship("ProjectUser", back_populates="user", cascade="all, delete-orphan")
+
+
+class ProjectType(Base):
+    __table__ = tables.project_types
+
+    projects = relationship("Project", back_populates="type", cascade="all, delete-orphan")
+
+
+class Project(Base):
+    __table__ = tables.projects
+
+    type = relationship("ProjectType", back_populates="projects")
+    users = relationship("ProjectUser", back_populates="project", cascade="all, delete-orphan")
+    epics = relationship("Epic", back_populates="project", cascade="all, delete-orphan")
+    sprints = relationship("Sprint", back_populates="project", cascade="all, delete-orphan")
+    pages = relationship("Page", back_populates="project", cascade="all, delete-orphan")
+    notifications = relationship("Notification", back_populates="project", cascade="all, delete-orphan")
+    tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
+
+
+class Role(Base):
+    __table__ = tables.roles
+
+    project_users = relationship("ProjectUser", back_populates="role", cascade="all, delete-orphan")
+
+
+class ProjectUser(Base):
+    __table__ = tables.project_users
+
+    user = relationship("User", back_populates="project_links")
+    project = relationship("Project", back_populates="users")
+    role = relationship("Role", back_populates="project_users")
+
+
+class Epic(Base):
+    __table__ = tables.epics
+
+    project = relationship("Project", back_populates="epics")
+    tasks = relationship("Task", back_populates="epic", cascade="all, delete-orphan")
+
+
+class Sprint(Base):
+    __table__ = tables.sprints
+
+    project = relationship("Project", back_populates="sprints")
+    tasks = relationship("Task", back_populates="sprint", cascade="all, delete-orphan")
+
+
+class Task(Base):
+    __table__ = tables.tasks
+
+    project = relationship("Project", back_populates="tasks")
+    assignee = relationship("User", back_populates="assigned_tasks")
+    epic = relationship("Epic", back_populates="tasks")
+    sprint = relationship("Sprint", back_populates="tasks")
+    status = relationship("Status", back_populates="tasks")
+    type = relationship("TaskType", back_populates="tasks")
+
+
+class TaskType(Base):
+    __table__ = tables.task_types
+
+    tasks = relationship("Task", back_populates="type", cascade="all, delete-orphan")
+
+
+class Status(Base):
+    __table__ = tables.statuses
+
+    tasks = relationship("Task", back_populates="status", cascade="all, delete-orphan")
+
+
+class Page(Base):
+    __table__ = tables.pages
+
+    project = relationship("Project", back_populates="pages")
+
+
+class Notification(Base):
+    __table__ = tables.notifications
+
+    project = relationship("Project", back_populates="notifications")
@@ -0,0 +1,163 @@
+"""Connection pools for the service engines.
+
+Every service builds its engines with ``pooled_engine`` and
+``pooled_async_engine`` so the pools are sized and instrumented the same
+way. Settings come from the environment:
+
+* ``DB_POOL_SIZE`` - persistent connections per engine, defaults to
+  ``GRPC_MAX_WORKERS`` so every server thread can hold one
+* ``DB_MAX_OVERFLOW``, ``DB_POOL_TIMEOUT`` (seconds to wait for a
+  connection), ``DB_POOL_RECYCLE`` (seconds), ``DB_POOL_PRE_PING``
+* ``DB_STATEMENT_TIMEOUT_MS`` - server-side statement timeout, 0 disables
+* ``DB_PGBOUNCER`` - set when a transaction-pooling PgBouncer sits in front
+  of Postgres: server-side prepared statements are turned off and the
+  statement timeout is applied per transaction instead of per session
+"""
+import os
+import threading
+import time
+import uuid
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", os.getenv("GRPC_MAX_WORKERS", 10)))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 5))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 30000))
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+
+# Upper bounds, in seconds, of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolMetrics:
+    """Checkout wait times of one engine, as a cumulative histogram.
+
+    A checkout that has to open a new connection counts the connect time
+    too, so a cold or overflowing pool shows up here as well as a full one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = [0] * len(WAIT_BUCKETS)
+        self._count = 0
+        self._sum = 0.0
+        self._timeouts = 0
+
+    def observe(self, seconds):
+        with self._lock:
+            self._count += 1
+            self._sum += seconds
+            for i, bound in enumerate(WAIT_BUCKETS):
+                if seconds <= bound:
+                    self._buckets[i] += 1
+
+    def timed_out(self):
+        with self._lock:
+            self._timeouts += 1
+
+    def stats(self, pool, prefix) -> dict[str, float]:
+        with self._lock:
+            stats = {
+                f"{prefix}_wait_count": float(self._count),
+                f"{prefix}_wait_seconds_sum": self._sum,
+                f"{prefix}_timeouts": float(self._timeouts),
+            }
+            for bound, count in zip(WAIT_BUCKETS, self._buckets):
+                stats[f"{prefix}_wait_le_{bound:g}"] = float(count)
+        if isinstance(pool, QueuePool):
+            stats.update({
+                f"{prefix}_size": float(pool.size()),
+                f"{prefix}_checked_out": float(pool.checkedout()),
+                f"{prefix}_checked_in": float(pool.checkedin()),
+                f"{prefix}_overflow": float(max(pool.overflow(), 0)),
+            })
+        return stats
+
+
+def _timed(pool_class, metrics):
+    # A subclass per engine: Pool.recreate() (engine.dispose) instantiates
+    # self.__class__, so the metrics survive pool replacement after fork
+    class TimedPool(pool_class):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                return super()._do_get()
+            except PoolTimeoutError:
+                metrics.timed_out()
+                raise
+            finally:
+                metrics.observe(time.perf_counter() - started)
+
+    TimedPool.__name__ = f"Timed{pool_class.__name__}"
+    return TimedPool
+
+
+def _pool_kwargs(url, pool_class, metrics):
+    if make_url(url).get_backend_name() != "postgresql":
+        return {}
+    return {
+        "poolclass": _timed(pool_class, metrics),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def _set_local_statement_timeout(engine):
+    # PgBouncer in transaction mode hands each transaction a different server
+    # connection, so a session-level setting would not stick
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {DB_STATEMENT_TIMEOUT_MS}")
+
+
+def pooled_engine(url):
+    metrics = PoolMetrics()
+    kwargs = _pool_kwargs(url, QueuePool, metrics)
+    if kwargs and DB_STATEMENT_TIMEOUT_MS and not DB_PGBOUNCER:
+        kwargs["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+
+    engine = create_engine(url, **kwargs)
+    if kwargs and DB_STATEMENT_TIMEOUT_MS and DB_PGBOUNCER:
+        _set_local_statement_timeout(engine)
+    engine.pool_metrics = metrics
+    return engine
+
+
+def pooled_async_engine(url):
+    metrics = PoolMetrics()
+    kwargs = _pool_kwargs(url, AsyncAdaptedQueuePool, metrics)
+    if kwargs and DB_PGBOUNCER:
+        # asyncpg prepares every statement; PgBouncer can't route a named
+        # prepared statement back to the server connection that holds it
+        kwargs["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    elif kwargs and DB_STATEMENT_TIMEOUT_MS:
+        kwargs["connect_args"] = {"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}}
+
+    engine = create_async_engine(url, **kwargs)
+    if kwargs and DB_STATEMENT_TIMEOUT_MS and DB_PGBOUNCER:
+        _set_local_statement_timeout(engine.sync_engine)
+    engine.sync_engine.pool_metrics = metrics
+    return engine
+
+
+def pool_stats(engine, async_engine) -> dict[str, float]:
+    """Pool gauges and checkout wait histograms of both engines of a service."""
+    sync_engine = async_engine.sync_engine
+    return {
+        **engine.pool_metrics.stats(engine.pool, "db_pool"),
+        **sync_engine.pool_metrics.stats(sync_engine.pool, "db_async_pool"),
+    }
@@ -0,0 +1,182 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Column, String, Text, Date, DateTime, SmallInteger,
+    ForeignKey, Table, Boolean, Index, MetaData, literal_column
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+metadata = MetaData()
+
+
+def _now():
+    return datetime.now(timezone.utc).astimezone()
+
+
+def _id():
+    return Column("id", UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+
+def _created_at():
+    return Column("created_at", DateTime, default=_now, nullable=False)
+
+
+def _updated_at():
+    return Column("updated_at", DateTime, onupdate=_now)
+
+
+users = Table(
+    "users",
+    metadata,
+    _id(),
+    Column("name", String(255), nullable=False),
+    Column("surname", String(255), nullable=False),
+    Column("email", String(255), nullable=False, unique=True, index=True),
+    Column("password", String(255), nullable=False),
+    Column("img_url", String(255), nullable=True),
+    _created_at(),
+    _updated_at(),
+)
+
+# SearchUsers ranks by trigram similarity to the full name or the email; the
+# expression must stay identical to the one the auth service queries on
+Index(
+    "ix_users_full_name_trgm",
+    (users.c.name.op("||")(literal_column("' '")).op("||")(users.c.surname)).label("full_name"),
+    postgresql_using="gin",
+    postgresql_ops={"full_name": "gin_trgm_ops"},
+)
+Index(
+    "ix_users_email_trgm",
+    users.c.email,
+    postgresql_using="gin",
+    postgresql_ops={"email": "gin_trgm_ops"},
+)
+
+project_types = Table(
+    "project_types",
+    metadata,
+    _id(),
+    Column("name", String(255), nullable=False, unique=True),
+)
+
+projects = Table(
+    "projects",
+    metadata,
+    _id(),
+    Column("name", String(255), nullable=False),
+    Column("description", String(255)),
+    Column("color", String(255), nullable=False),
+    Column("img_url", String(255)),
+    Column("type_id", UUID(as_uuid=True), ForeignKey("project_types.id", ondelete="CASCADE"), nullable=False),
+    _created_at(),
+    _updated_at(),
+)
+
+roles = Table(
+    "roles",
+    metadata,
+    _id(),
+    Column("name", String(255), nullable=False, unique=True),
+)
+
+project_users = Table(
+    "project_users",
+    metadata,
+    Column("user_id", UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # user_id lookups use the primary key, project_id ones need their own index
+    Column("project_id", UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True, index=True),
+    Column("role_id", UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False),
+    Column("assigned_at", DateTime, default=_now, nullable=False),
+)
+
+epics = Table(
+    "epics",
+    metadata,
+    _id(),
+    Column("name", String(255), nullable=False),
+    Column("description", String(255)),
+    Column("priority", SmallInteger, nullable=False),
+    Column("start_date", Date),
+    Column("end_date", Date),
+    Column("project_id", UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True),
+    _created_at(),
+    _updated_at(),
+)
+
+sprints = Table(
+    "sprints",
+    metadata,
+    _id(),
+    Column("name", String(255), nullable=False),
+    Column("description", String(255)),
+    Column("start_date", Date),
+    Column("end_date", Date),
+    Column("is_started", Boolean, default=False),
+    Column("project_id", UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+    _created_at(),
+    _updated_at(),
+    # Sprints of a project, ordered or aggregated by start date
+    Index("ix_sprints_project_id_start_date", "project_id", "start_date"),
+)
+
+task_types = Table(
+    "task_types",
+    metadata,
+    _id(),
+    Column("name", String, unique=True),
+)
+
+statuses = Table(
+    "statuses",
+    metadata,
+    _id(),
+    Column("name", String, unique=True),
+)
+
+tasks = Table(
+    "tasks",
+    metadata,
+    _id(),
+    Column("title", String(255), nullable=False),
+    Column("description", String(255)),
+    Column("priority", SmallInteger),
+    Column("type_id", UUID(as_uuid=True), ForeignKey("task_types.id", ondelete="CASCADE"), nullable=False),
+    Column("assigned_to", UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), index=True),
+    Column("epic_id", UUID(as_uuid=True), ForeignKey("epics.id", ondelete="SET NULL"), index=True),
+    Column("sprint_id", UUID(as_uuid=True), ForeignKey("sprints.id", ondelete="SET NULL")),
+    Column("project_id", UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+    Column("status_id", UUID(as_uuid=True), ForeignKey("statuses.id", ondelete="CASCADE"), nullable=False, index=True),
+    Column("start_date", Date),
+    Column("end_date", Date),
+    _created_at(),
+    _updated_at(),
+    # Project task listings in the default (created_at, id) order, keyset paged
+    Index("ix_tasks_project_id_created_at_id", "project_id", "created_at", "id"),
+    # The same filtered by status, also project boards and the per-status analytics
+    Index("ix_tasks_project_id_status_id_created_at_id", "project_id", "status_id", "created_at", "id"),
+    # Sprint boards, sprint timelines and tasks-per-sprint ordered by title
+    Index("ix_tasks_sprint_id_title", "sprint_id", "title"),
+)
+
+pages = Table(
+    "pages",
+    metadata,
+    _id(),
+    Column("title", String(255), nullable=False),
+    Column("content", Text, nullable=False),
+    Column("project_id", UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+    _created_at(),
+    _updated_at(),
+)
+
+notifications = Table(
+    "notifications",
+    metadata,
+    _id(),
+    Column("title", String(255), nullable=False),
+    Column("content", Text, nullable=False),
+    Column("project_id", UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+    Column("date", DateTime, default=_now, nullable=False),
+)
@@ -0,0 +1,13 @@
+"""Running the Task.io gRPC services.
+
+``launcher`` holds ``run``, which starts a service's server in one
+process or in several pre-forked worker processes sharing its port, and
+stops it gracefully on SIGTERM. ``options`` holds ``SERVER_OPTIONS``,
+the channel arguments every service server is built with.
+"""
+from taskio_server.launcher import run
+from taskio_server.options import SERVER_OPTIONS
+
+__version__ = "1.1.0"
+
+__all__ = ["SERVER_OPTIONS", "run", "__version__"]
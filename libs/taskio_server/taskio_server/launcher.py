@@ -0,0 +1,93 @@
+"""Starts a gRPC service in one process or several pre-forked ones.
+
+Settings come from the environment:
+
+* ``GRPC_SERVER_MODE`` - ``threads`` (grpc.server on a thread pool) or
+  ``aio`` (grpc.aio.server)
+* ``GRPC_WORKERS`` - server processes; above 1 they are forked from a
+  parent that only forwards SIGTERM and SIGINT to them, and all bind the
+  same port (the servers must set ``grpc.so_reuseport``)
+* ``GRPC_GRACE_PERIOD`` - seconds in-flight calls get to finish once
+  SIGTERM stops the server from accepting new ones
+"""
+import asyncio
+import functools
+import multiprocessing
+import os
+import signal
+
+GRPC_SERVER_MODE = os.getenv("GRPC_SERVER_MODE", "threads")
+GRPC_WORKERS = int(os.getenv("GRPC_WORKERS", "1"))
+GRPC_GRACE_PERIOD = float(os.getenv("GRPC_GRACE_PERIOD", "10"))
+
+
+async def _run_aio(name, port, serve_aio):
+    server = serve_aio()
+    print(f"Starting {name} (grpc.aio) on port {port}, pid {os.getpid()}...")
+    await server.start()
+
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(
+        signal.SIGTERM, lambda: asyncio.ensure_future(server.stop(GRPC_GRACE_PERIOD))
+    )
+    await server.wait_for_termination()
+
+
+def _run_server(name, port, serve, serve_aio, on_start):
+    if on_start is not None:
+        on_start()
+
+    if GRPC_SERVER_MODE == "aio":
+        asyncio.run(_run_aio(name, port, serve_aio))
+        return
+
+    server = serve()
+    print(f"Starting {name} on port {port}, pid {os.getpid()}...")
+    server.start()
+    # Stop accepting new calls and let in-flight ones finish
+    signal.signal(signal.SIGTERM, lambda signum, frame: server.stop(GRPC_GRACE_PERIOD))
+    server.wait_for_termination()
+
+
+def _run_worker(engines, run_server):
+    # Connections inherited from the parent must not be shared, every worker
+    # opens its own through a fresh pool
+    for engine in engines:
+        engine.dispose(close=False)
+    run_server()
+
+
+def _run_workers(count, name, run_worker):
+    # Workers are forked before any gRPC object exists in this process,
+    # gRPC does not survive a fork once its threads are running
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=run_worker, name=f"{name}-{i}") for i in range(count)]
+    for worker in workers:
+        worker.start()
+
+    def _forward(signum, frame):
+        for worker in workers:
+            if worker.is_alive():
+                os.kill(worker.pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, _forward)
+    signal.signal(signal.SIGINT, _forward)
+
+    for worker in workers:
+        worker.join()
+
+
+def run(name, port, serve, serve_aio, engines=(), on_start=None):
+    """Runs the service until it is stopped.
+
+    ``serve()`` and ``serve_aio()`` build the server, bound but not
+    started, for each mode; ``port`` is only reported. ``engines`` are the
+    SQLAlchemy engines (the sync engine of an async one) to dispose of in
+    every forked worker. ``on_start()`` runs in every server process before
+    its server is built, for what must not cross a fork, such as threads.
+    """
+    run_server = functools.partial(_run_server, name, port, serve, serve_aio, on_start)
+    if GRPC_WORKERS > 1:
+        _run_workers(GRPC_WORKERS, name, functools.partial(_run_worker, engines, run_server))
+    else:
+        run_server()
@@ -0,0 +1,20 @@
+"""Channel arguments every gRPC service server is built with.
+
+* ``GRPC_MIN_PING_INTERVAL_MS`` - the shortest interval between keepalive
+  pings, on a connection without calls, the server tolerates; keep it
+  below the gateway's ``GRPC_KEEPALIVE_TIME_MS``
+"""
+import os
+
+GRPC_MIN_PING_INTERVAL_MS = int(os.getenv("GRPC_MIN_PING_INTERVAL_MS", "10000"))
+
+SERVER_OPTIONS = [
+    # Lets the worker processes started by the launcher bind the same port
+    ("grpc.so_reuseport", 1),
+    # The gateway pings its pooled channels even when idle. With the
+    # defaults a server allows one such ping every 5 minutes and answers
+    # more with GOAWAY too_many_pings, so idle channels kept reconnecting.
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_ping_interval_without_data_ms", GRPC_MIN_PING_INTERVAL_MS),
+    ("grpc.http2.max_ping_strikes", 2),
+]
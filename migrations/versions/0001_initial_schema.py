@@ -0,0 +1,161 @@
+"""Initial schema
+
+Matches the models as they were before migrations existed. Databases that
+already have some of these tables keep them; only the missing ones are
+created.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _uuid_pk():
+    return sa.Column("id", UUID(as_uuid=True), primary_key=True)
+
+
+def _fk(column, target, ondelete, **kw):
+    return sa.Column(column, UUID(as_uuid=True), sa.ForeignKey(target, ondelete=ondelete), **kw)
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        sa.Column("updated_at", sa.DateTime),
+    ]
+
+
+TABLES = [
+    (
+        "users",
+        lambda: [
+            _uuid_pk(),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("surname", sa.String(255), nullable=False),
+            sa.Column("email", sa.String(255), nullable=False),
+            sa.Column("password", sa.String(255), nullable=False),
+            sa.Column("img_url", sa.String(255)),
+            *_timestamps(),
+        ],
+    ),
+    (
+        "project_types",
+        lambda: [_uuid_pk(), sa.Column("name", sa.String(255), nullable=False, unique=True)],
+    ),
+    (
+        "projects",
+        lambda: [
+            _uuid_pk(),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("description", sa.String(255)),
+            sa.Column("color", sa.String(255), nullable=False),
+            sa.Column("img_url", sa.String(255)),
+            _fk("type_id", "project_types.id", "CASCADE", nullable=False),
+            *_timestamps(),
+        ],
+    ),
+    (
+        "roles",
+        lambda: [_uuid_pk(), sa.Column("name", sa.String(255), nullable=False, unique=True)],
+    ),
+    (
+        "project_users",
+        lambda: [
+            _fk("user_id", "users.id", "CASCADE", primary_key=True),
+            _fk("project_id", "projects.id", "CASCADE", primary_key=True),
+            _fk("role_id", "roles.id", "CASCADE", nullable=False),
+            sa.Column("assigned_at", sa.DateTime, nullable=False),
+        ],
+    ),
+    (
+        "epics",
+        lambda: [
+            _uuid_pk(),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("description", sa.String(255)),
+            sa.Column("priority", sa.SmallInteger, nullable=False),
+            sa.Column("start_date", sa.Date),
+            sa.Column("end_date", sa.Date),
+            _fk("project_id", "projects.id", "CASCADE", nullable=False),
+            *_timestamps(),
+        ],
+    ),
+    (
+        "sprints",
+        lambda: [
+            _uuid_pk(),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("description", sa.String(255)),
+            sa.Column("start_date", sa.Date),
+            sa.Column("end_date", sa.Date),
+            sa.Column("is_started", sa.Boolean),
+            _fk("project_id", "projects.id", "CASCADE", nullable=False),
+            *_timestamps(),
+        ],
+    ),
+    ("task_types", lambda: [_uuid_pk(), sa.Column("name", sa.String, unique=True)]),
+    ("statuses", lambda: [_uuid_pk(), sa.Column("name", sa.String, unique=True)]),
+    (
+        "tasks",
+        lambda: [
+            _uuid_pk(),
+            sa.Column("title", sa.String(255), nullable=False),
+            sa.Column("description", sa.String(255)),
+            sa.Column("priority", sa.SmallInteger),
+            _fk("type_id", "task_types.id", "CASCADE", nullable=False),
+            _fk("assigned_to", "users.id", "SET NULL"),
+            _fk("epic_id", "epics.id", "SET NULL"),
+            _fk("sprint_id", "sprints.id", "SET NULL"),
+            _fk("project_id", "projects.id", "CASCADE", nullable=False),
+            _fk("status_id", "statuses.id", "CASCADE", nullable=False),
+            sa.Column("start_date", sa.Date),
+            sa.Column("end_date", sa.Date),
+            *_timestamps(),
+        ],
+    ),
+    (
+        "pages",
+        lambda: [
+            _uuid_pk(),
+            sa.Column("title", sa.String(255), nullable=False),
+            sa.Column("content", sa.Text, nullable=False),
+            _fk("project_id", "projects.id", "CASCADE", nullable=False),
+            *_timestamps(),
+        ],
+    ),
+    (
+        "notifications",
+        lambda: [
+            _uuid_pk(),
+            sa.Column("title", sa.String(255), nullable=False),
+            sa.Column("content", sa.Text, nullable=False),
+            _fk("project_id", "projects.id", "CASCADE", nullable=False),
+            sa.Column("date", sa.DateTime, nullable=False),
+        ],
+    ),
+]
+
+
+def upgrade():
+    if op.get_context().as_sql:
+        existing = set()
+    else:
+        existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for name, columns in TABLES:
+        if name not in existing:
+            op.create_table(name, *columns())
+    op.create_index("ix_users_email", "users", ["email"], unique=True, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_users_email", table_name="users")
+    for name, _ in reversed(TABLES):
+        op.drop_table(name)
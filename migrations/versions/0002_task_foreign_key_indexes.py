@@ -0,0 +1,59 @@
+"""Indexes for the task, sprint, epic and membership lookups
+
+Each index backs a hot query:
+
+* ix_tasks_project_id_status_id - GetProjectTasks and the per-status
+  analytics (completed by user, progress by day)
+* ix_tasks_sprint_id_title - GetSprintTasks, the timeline joins on sprints
+  and tasks-status-in-sprints, which orders by (sprint_id, title)
+* ix_tasks_epic_id - GetEpicTasks
+* ix_tasks_assigned_to - the "mine" timelines and SET NULL on user delete
+* ix_tasks_status_id - CASCADE on status delete
+* ix_project_users_project_id - project members; user_id lookups already
+  use the (user_id, project_id) primary key
+* ix_sprints_project_id_start_date - project sprints ordered by start date
+  and the progress-by-day start lookup
+* ix_epics_project_id - GetProjectEpics
+
+Indexes are built CONCURRENTLY so the tables stay writable.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_tasks_project_id_status_id", "tasks", ["project_id", "status_id"]),
+    ("ix_tasks_sprint_id_title", "tasks", ["sprint_id", "title"]),
+    ("ix_tasks_epic_id", "tasks", ["epic_id"]),
+    ("ix_tasks_assigned_to", "tasks", ["assigned_to"]),
+    ("ix_tasks_status_id", "tasks", ["status_id"]),
+    ("ix_project_users_project_id", "project_users", ["project_id"]),
+    ("ix_sprints_project_id_start_date", "sprints", ["project_id", "start_date"]),
+    ("ix_epics_project_id", "epics", ["project_id"]),
+]
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
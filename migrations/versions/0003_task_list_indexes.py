@@ -0,0 +1,65 @@
+"""Indexes for the keyset-paged task listings
+
+ListTasks pages through a project's tasks in (created_at, id) order,
+optionally filtered by status:
+
+* ix_tasks_project_id_created_at_id - the default listing, each page is a
+  range scan starting right after the last (created_at, id) seen
+* ix_tasks_project_id_status_id_created_at_id - the same filtered by
+  status; it also serves every (project_id, status_id) lookup, so it
+  replaces ix_tasks_project_id_status_id
+
+The new indexes are built before the old one is dropped, all CONCURRENTLY.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_tasks_project_id_created_at_id", "tasks", ["project_id", "created_at", "id"]),
+    (
+        "ix_tasks_project_id_status_id_created_at_id",
+        "tasks",
+        ["project_id", "status_id", "created_at", "id"],
+    ),
+]
+
+REPLACED = [
+    ("ix_tasks_project_id_status_id", "tasks", ["project_id", "status_id"]),
+]
+
+
+def _create(indexes):
+    for name, table, columns in indexes:
+        op.create_index(
+            name,
+            table,
+            columns,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def _drop(indexes):
+    for name, table, _ in reversed(indexes):
+        op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        _create(INDEXES)
+        _drop(REPLACED)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        _create(REPLACED)
+        _drop(INDEXES)
@@ -0,0 +1,45 @@
+"""Trigram indexes for SearchUsers
+
+SearchUsers matches a substring of the full name or the email with ILIKE
+and ranks by pg_trgm similarity, so both need a GIN trigram index:
+
+* ix_users_full_name_trgm - on name || ' ' || surname, the expression the
+  auth service queries on
+* ix_users_email_trgm - on email
+
+The pg_trgm extension is created first. Indexes are built CONCURRENTLY so
+the users table stays writable.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_users_full_name_trgm", "users", "((name || ' ') || surname) gin_trgm_ops"),
+    ("ix_users_email_trgm", "users", "email gin_trgm_ops"),
+]
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, expression in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({expression})"
+            )
+
+
+def downgrade():
+    # The extension is left in place, other objects may depend on it
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
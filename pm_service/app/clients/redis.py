@@ -1,10 +1,16 @@
 import os
 import redis
+import redis.asyncio
+from taskio_cache import LocalCache, ReadThroughCache
+from taskio_cache.local import CACHE_L1_BYTES
 
 REDIS_URL = os.getenv("REDIS_URL")
 
 if REDIS_URL:
     redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+    async_redis_client = redis.asyncio.from_url(REDIS_URL, decode_responses=True)
+    binary_redis_client = redis.from_url(REDIS_URL)
+    async_binary_redis_client = redis.asyncio.from_url(REDIS_URL)
 else:
     REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
@@ -15,8 +21,26 @@ else:
         db=REDIS_DB,
         decode_responses=True
     )
+    async_redis_client = redis.asyncio.Redis(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=REDIS_DB,
+        decode_responses=True
+    )
+    binary_redis_client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB)
+    async_binary_redis_client = redis.asyncio.Redis(host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB)
 
 PROJECT_TTL = int(os.getenv("PROJECT_TTL", 3600))
 USERS_TTL   = int(os.getenv("USERS_TTL",   300))
 SPRINTS_TTL = int(os.getenv("SPRINTS_TTL",   1800))
 EPICS_TTL   = int(os.getenv("EPICS_TTL",   1800))
+
+# Single-flight, early-refreshing read-through cache; its values are
+# CACHE_CODEC bytes, hence the clients that leave responses undecoded.
+# The L1 in front of it is kept coherent by the InvalidationListener
+# started in main.
+cache = ReadThroughCache(
+    binary_redis_client,
+    async_binary_redis_client,
+    local=LocalCache() if CACHE_L1_BYTES else None,
+)
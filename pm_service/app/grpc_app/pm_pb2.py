@@ -24,13 +24,15 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x08pm.proto\x12\x07project\"$\n\x08UserRole\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04role\x18\x02 \x01(\t\"\x89\x01\n\x14\x43reateProjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\r\n\x05\x63olor\x18\x03 \x01(\t\x12\x0f\n\x07img_url\x18\x04 \x01(\t\x12\x0c\n\x04type\x18\x05 \x01(\t\x12 \n\x05users\x18\x06 \x03(\x0b\x32\x11.project.UserRole\"n\n\x0fProjectResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05\x63olor\x18\x04 \x01(\t\x12\x0f\n\x07img_url\x18\x05 \x01(\t\x12\x0c\n\x04type\x18\x06 \x01(\t\"\'\n\x11GetProjectRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"b\n\x14UpdateProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05\x63olor\x18\x04 \x01(\t\x12\x0c\n\x04type\x18\x05 \x01(\t\"6\n\x17UpdateProjectImgRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07img_url\x18\x02 \x01(\t\"I\n\x19UpdateProjectUsersRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12 \n\x05users\x18\x02 \x03(\x0b\x32\x11.project.UserRole\"J\n\x1aUpdateProjectUsersResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12 \n\x05users\x18\x02 \x03(\x0b\x32\x11.project.UserRole\"\"\n\x14\x44\x65leteProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\"8\n\x15\x44\x65leteProjectResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\")\n\x16GetUserProjectsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"B\n\x14UserProjectsResponse\x12*\n\x08projects\x18\x01 \x03(\x0b\x32\x18.project.ProjectResponse\"h\n\x08UserInfo\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07surname\x18\x04 \x01(\t\x12\x0f\n\x07img_url\x18\x05 \x01(\t\x12\x0c\n\x04role\x18\x06 \x01(\t\",\n\x16GetProjectUsersRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"8\n\x14ProjectUsersResponse\x12 \n\x05users\x18\x01 \x03(\x0b\x32\x11.project.UserInfo\"\x1e\n\x10GetSprintRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x8d\x01\n\x0eSprintResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x12\n\nstart_date\x18\x04 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\t\x12\x12\n\nis_started\x18\x06 \x01(\x08\x12\x12\n\nproject_id\x18\x07 \x01(\t\".\n\x18GetProjectSprintsRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"B\n\x16ProjectSprintsResponse\x12(\n\x07sprints\x18\x01 \x03(\x0b\x32\x17.project.SprintResponse\"\x95\x01\n\x13\x43reateSprintRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\x12\x12\n\nis_started\x18\x05 \x01(\x08\x12\x12\n\nproject_id\x18\x06 \x01(\t\x12\r\n\x05tasks\x18\x07 \x03(\t\"\xa1\x01\n\x13UpdateSprintRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x12\n\nstart_date\x18\x04 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\t\x12\x12\n\nis_started\x18\x06 \x01(\x08\x12\x12\n\nproject_id\x18\x07 \x01(\t\x12\r\n\x05tasks\x18\x08 \x03(\t\"!\n\x13\x44\x65leteSprintRequest\x12\n\n\x02id\x18\x01 \x01(\t\"7\n\x14\x44\x65leteSprintResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1c\n\x0eGetEpicRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x89\x01\n\x0c\x45picResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12\x12\n\nstart_date\x18\x05 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x06 \x01(\t\x12\x12\n\nproject_id\x18\x07 \x01(\t\",\n\x16GetProjectEpicsRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"<\n\x14ProjectEpicsResponse\x12$\n\x05\x65pics\x18\x01 \x03(\x0b\x32\x15.project.EpicResponse\"\x91\x01\n\x11\x43reateEpicRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x10\n\x08priority\x18\x03 \x01(\x05\x12\x12\n\nstart_date\x18\x04 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\t\x12\x12\n\nproject_id\x18\x06 \x01(\t\x12\r\n\x05tasks\x18\x07 \x03(\t\"\x9d\x01\n\x11UpdateEpicRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12\x12\n\nstart_date\x18\x05 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x06 \x01(\t\x12\x12\n\nproject_id\x18\x07 \x01(\t\x12\r\n\x05tasks\x18\x08 \x03(\t\"\x1f\n\x11\x44\x65leteEpicRequest\x12\n\n\x02id\x18\x01 \x01(\t\"5\n\x12\x44\x65leteEpicResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t2\xd9\n\n\x0eProjectService\x12H\n\rCreateProject\x12\x1d.project.CreateProjectRequest\x1a\x18.project.ProjectResponse\x12\x42\n\nGetProject\x12\x1a.project.GetProjectRequest\x1a\x18.project.ProjectResponse\x12H\n\rUpdateProject\x12\x1d.project.UpdateProjectRequest\x1a\x18.project.ProjectResponse\x12N\n\x10UpdateProjectImg\x12 .project.UpdateProjectImgRequest\x1a\x18.project.ProjectResponse\x12]\n\x12UpdateProjectUsers\x12\".project.UpdateProjectUsersRequest\x1a#.project.UpdateProjectUsersResponse\x12N\n\rDeleteProject\x12\x1d.project.DeleteProjectRequest\x1a\x1e.project.DeleteProjectResponse\x12Q\n\x0fGetUserProjects\x12\x1f.project.GetUserProjectsRequest\x1a\x1d.project.UserProjectsResponse\x12Q\n\x0fGetProjectUsers\x12\x1f.project.GetProjectUsersRequest\x1a\x1d.project.ProjectUsersResponse\x12?\n\tGetSprint\x12\x19.project.GetSprintRequest\x1a\x17.project.SprintResponse\x12W\n\x11GetProjectSprints\x12!.project.GetProjectSprintsRequest\x1a\x1f.project.ProjectSprintsResponse\x12\x45\n\x0c\x43reateSprint\x12\x1c.project.CreateSprintRequest\x1a\x17.project.SprintResponse\x12\x45\n\x0cUpdateSprint\x12\x1c.project.UpdateSprintRequest\x1a\x17.project.SprintResponse\x12K\n\x0c\x44\x65leteSprint\x12\x1c.project.DeleteSprintRequest\x1a\x1d.project.DeleteSprintResponse\x12\x39\n\x07GetEpic\x12\x17.project.GetEpicRequest\x1a\x15.project.EpicResponse\x12Q\n\x0fGetProjectEpics\x12\x1f.project.GetProjectEpicsRequest\x1a\x1d.project.ProjectEpicsResponse\x12?\n\nCreateEpic\x12\x1a.project.CreateEpicRequest\x1a\x15.project.EpicResponse\x12?\n\nUpdateEpic\x12\x1a.project.UpdateEpicRequest\x1a\x15.project.EpicResponse\x12\x45\n\nDeleteEpic\x12\x1a.project.DeleteEpicRequest\x1a\x1b.project.DeleteEpicResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x08pm.proto\x12\x07project\"$\n\x08UserRole\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04role\x18\x02 \x01(\t\"\x89\x01\n\x14\x43reateProjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\r\n\x05\x63olor\x18\x03 \x01(\t\x12\x0f\n\x07img_url\x18\x04 \x01(\t\x12\x0c\n\x04type\x18\x05 \x01(\t\x12 \n\x05users\x18\x06 \x03(\x0b\x32\x11.project.UserRole\"n\n\x0fProjectResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05\x63olor\x18\x04 \x01(\t\x12\x0f\n\x07img_url\x18\x05 \x01(\t\x12\x0c\n\x04type\x18\x06 \x01(\t\"\'\n\x11GetProjectRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"b\n\x14UpdateProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05\x63olor\x18\x04 \x01(\t\x12\x0c\n\x04type\x18\x05 \x01(\t\"6\n\x17UpdateProjectImgRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07img_url\x18\x02 \x01(\t\"I\n\x19UpdateProjectUsersRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12 \n\x05users\x18\x02 \x03(\x0b\x32\x11.project.UserRole\"J\n\x1aUpdateProjectUsersResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12 \n\x05users\x18\x02 \x03(\x0b\x32\x11.project.UserRole\"\"\n\x14\x44\x65leteProjectRequest\x12\n\n\x02id\x18\x01 \x01(\t\"8\n\x15\x44\x65leteProjectResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\")\n\x16GetUserProjectsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"B\n\x14UserProjectsResponse\x12*\n\x08projects\x18\x01 \x03(\x0b\x32\x18.project.ProjectResponse\"h\n\x08UserInfo\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07surname\x18\x04 \x01(\t\x12\x0f\n\x07img_url\x18\x05 \x01(\t\x12\x0c\n\x04role\x18\x06 \x01(\t\",\n\x16GetProjectUsersRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"8\n\x14ProjectUsersResponse\x12 \n\x05users\x18\x01 \x03(\x0b\x32\x11.project.UserInfo\"\x1e\n\x10GetSprintRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x8d\x01\n\x0eSprintResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x12\n\nstart_date\x18\x04 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\t\x12\x12\n\nis_started\x18\x06 \x01(\x08\x12\x12\n\nproject_id\x18\x07 \x01(\t\".\n\x18GetProjectSprintsRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"B\n\x16ProjectSprintsResponse\x12(\n\x07sprints\x18\x01 \x03(\x0b\x32\x17.project.SprintResponse\"\x95\x01\n\x13\x43reateSprintRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x12\n\nstart_date\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x04 \x01(\t\x12\x12\n\nis_started\x18\x05 \x01(\x08\x12\x12\n\nproject_id\x18\x06 \x01(\t\x12\r\n\x05tasks\x18\x07 \x03(\t\"\xa1\x01\n\x13UpdateSprintRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x12\n\nstart_date\x18\x04 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\t\x12\x12\n\nis_started\x18\x06 \x01(\x08\x12\x12\n\nproject_id\x18\x07 \x01(\t\x12\r\n\x05tasks\x18\x08 \x03(\t\"!\n\x13\x44\x65leteSprintRequest\x12\n\n\x02id\x18\x01 \x01(\t\"7\n\x14\x44\x65leteSprintResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1c\n\x0eGetEpicRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x89\x01\n\x0c\x45picResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12\x12\n\nstart_date\x18\x05 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x06 \x01(\t\x12\x12\n\nproject_id\x18\x07 \x01(\t\",\n\x16GetProjectEpicsRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"<\n\x14ProjectEpicsResponse\x12$\n\x05\x65pics\x18\x01 \x03(\x0b\x32\x15.project.EpicResponse\"\x91\x01\n\x11\x43reateEpicRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x10\n\x08priority\x18\x03 \x01(\x05\x12\x12\n\nstart_date\x18\x04 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x05 \x01(\t\x12\x12\n\nproject_id\x18\x06 \x01(\t\x12\r\n\x05tasks\x18\x07 \x03(\t\"\x9d\x01\n\x11UpdateEpicRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\x05\x12\x12\n\nstart_date\x18\x05 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x06 \x01(\t\x12\x12\n\nproject_id\x18\x07 \x01(\t\x12\r\n\x05tasks\x18\x08 \x03(\t\"\x1f\n\x11\x44\x65leteEpicRequest\x12\n\n\x02id\x18\x01 \x01(\t\"5\n\x12\x44\x65leteEpicResponse\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x10\n\x0eMetricsRequest\"v\n\x0fMetricsResponse\x12\x34\n\x06values\x18\x01 \x03(\x0b\x32$.project.MetricsResponse.ValuesEntry\x1a-\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x32\x9a\x0b\n\x0eProjectService\x12H\n\rCreateProject\x12\x1d.project.CreateProjectRequest\x1a\x18.project.ProjectResponse\x12\x42\n\nGetProject\x12\x1a.project.GetProjectRequest\x1a\x18.project.ProjectResponse\x12H\n\rUpdateProject\x12\x1d.project.UpdateProjectRequest\x1a\x18.project.ProjectResponse\x12N\n\x10UpdateProjectImg\x12 .project.UpdateProjectImgRequest\x1a\x18.project.ProjectResponse\x12]\n\x12UpdateProjectUsers\x12\".project.UpdateProjectUsersRequest\x1a#.project.UpdateProjectUsersResponse\x12N\n\rDeleteProject\x12\x1d.project.DeleteProjectRequest\x1a\x1e.project.DeleteProjectResponse\x12Q\n\x0fGetUserProjects\x12\x1f.project.GetUserProjectsRequest\x1a\x1d.project.UserProjectsResponse\x12Q\n\x0fGetProjectUsers\x12\x1f.project.GetProjectUsersRequest\x1a\x1d.project.ProjectUsersResponse\x12?\n\tGetSprint\x12\x19.project.GetSprintRequest\x1a\x17.project.SprintResponse\x12W\n\x11GetProjectSprints\x12!.project.GetProjectSprintsRequest\x1a\x1f.project.ProjectSprintsResponse\x12\x45\n\x0c\x43reateSprint\x12\x1c.project.CreateSprintRequest\x1a\x17.project.SprintResponse\x12\x45\n\x0cUpdateSprint\x12\x1c.project.UpdateSprintRequest\x1a\x17.project.SprintResponse\x12K\n\x0c\x44\x65leteSprint\x12\x1c.project.DeleteSprintRequest\x1a\x1d.project.DeleteSprintResponse\x12\x39\n\x07GetEpic\x12\x17.project.GetEpicRequest\x1a\x15.project.EpicResponse\x12Q\n\x0fGetProjectEpics\x12\x1f.project.GetProjectEpicsRequest\x1a\x1d.project.ProjectEpicsResponse\x12?\n\nCreateEpic\x12\x1a.project.CreateEpicRequest\x1a\x15.project.EpicResponse\x12?\n\nUpdateEpic\x12\x1a.project.UpdateEpicRequest\x1a\x15.project.EpicResponse\x12\x45\n\nDeleteEpic\x12\x1a.project.DeleteEpicRequest\x1a\x1b.project.DeleteEpicResponse\x12?\n\nGetMetrics\x12\x17.project.MetricsRequest\x1a\x18.project.MetricsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'pm_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_METRICSRESPONSE_VALUESENTRY']._loaded_options = None
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_options = b'8\001'
   _globals['_USERROLE']._serialized_start=21
   _globals['_USERROLE']._serialized_end=57
   _globals['_CREATEPROJECTREQUEST']._serialized_start=60
@@ -93,6 +95,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_DELETEEPICREQUEST']._serialized_end=2391
   _globals['_DELETEEPICRESPONSE']._serialized_start=2393
   _globals['_DELETEEPICRESPONSE']._serialized_end=2446
-  _globals['_PROJECTSERVICE']._serialized_start=2449
-  _globals['_PROJECTSERVICE']._serialized_end=3818
+  _globals['_METRICSREQUEST']._serialized_start=2448
+  _globals['_METRICSREQUEST']._serialized_end=2464
+  _globals['_METRICSRESPONSE']._serialized_start=2466
+  _globals['_METRICSRESPONSE']._serialized_end=2584
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_start=2539
+  _globals['_METRICSRESPONSE_VALUESENTRY']._serialized_end=2584
+  _globals['_PROJECTSERVICE']._serialized_start=2587
+  _globals['_PROJECTSERVICE']._serialized_end=4021
 # @@protoc_insertion_point(module_scope)
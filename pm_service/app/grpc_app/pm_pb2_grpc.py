@@ -124,6 +124,11 @@ class ProjectServiceStub(object):
                 request_serializer=pm__pb2.DeleteEpicRequest.SerializeToString,
                 response_deserializer=pm__pb2.DeleteEpicResponse.FromString,
                 _registered_method=True)
+        self.GetMetrics = channel.unary_unary(
+                '/project.ProjectService/GetMetrics',
+                request_serializer=pm__pb2.MetricsRequest.SerializeToString,
+                response_deserializer=pm__pb2.MetricsResponse.FromString,
+                _registered_method=True)
 
 
 class ProjectServiceServicer(object):
@@ -237,6 +242,12 @@ class ProjectServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetMetrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ProjectServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -330,6 +341,11 @@ def add_ProjectServiceServicer_to_server(servicer, server):
                     request_deserializer=pm__pb2.DeleteEpicRequest.FromString,
                     response_serializer=pm__pb2.DeleteEpicResponse.SerializeToString,
             ),
+            'GetMetrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMetrics,
+                    request_deserializer=pm__pb2.MetricsRequest.FromString,
+                    response_serializer=pm__pb2.MetricsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'project.ProjectService', rpc_method_handlers)
@@ -826,3 +842,30 @@ class ProjectService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetMetrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/project.ProjectService/GetMetrics',
+            pm__pb2.MetricsRequest.SerializeToString,
+            pm__pb2.MetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
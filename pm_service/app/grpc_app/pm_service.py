@@ -1,12 +1,64 @@
 from concurrent import futures
+import os
 import grpc
+from taskio_server import SERVER_OPTIONS
 
-from app.services.project import ProjectService
-from app.services.epic import EpicService
-from app.services.sprint import SprintService
+from app.clients.redis import cache
+from app.database import db_stats, unit_of_work
+from app.services.project import ProjectService, AsyncProjectService
+from app.services.epic import EpicService, AsyncEpicService
+from app.services.sprint import SprintService, AsyncSprintService
 from . import pm_pb2
 from . import pm_pb2_grpc
 
+GRPC_MAX_WORKERS = int(os.getenv("GRPC_MAX_WORKERS", "10"))
+
+
+def _project_response(project):
+    return pm_pb2.ProjectResponse(
+        id=project["id"],
+        name=project["name"],
+        description=project["description"],
+        color=project["color"],
+        img_url=project["img_url"],
+        type=project["type"],
+    )
+
+
+def _user_info(item):
+    return pm_pb2.UserInfo(
+        user_id=item["user_id"],
+        email=item["email"],
+        name=item["name"],
+        surname=item["surname"],
+        img_url=item["img_url"],
+        role=item["role"]
+    )
+
+
+def _sprint_response(sprint):
+    return pm_pb2.SprintResponse(
+        id=sprint["id"],
+        name=sprint["name"],
+        description=sprint["description"],
+        start_date=sprint["start_date"],
+        end_date=sprint["end_date"],
+        is_started=sprint["is_started"],
+        project_id=sprint["project_id"],
+    )
+
+
+def _epic_response(epic):
+    return pm_pb2.EpicResponse(
+        id=epic["id"],
+        name=epic["name"],
+        description=epic["description"],
+        priority=epic["priority"],
+        start_date=epic["start_date"],
+        end_date=epic["end_date"],
+        project_id=epic["project_id"],
+    )
+
 
 class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
     def __init__(self):
@@ -14,6 +66,7 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
         self.epic_service = EpicService()
         self.sprint_service = SprintService()
 
+    @unit_of_work
     def CreateProject(self, request, context):
 
         project = self.project_service.create_project(
@@ -25,37 +78,25 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
             users=request.users,
         )
         if project:
-            return pm_pb2.ProjectResponse(
-                id=project["id"],
-                name=project["name"],
-                description=project["description"],
-                color=project["color"],
-                img_url=project["img_url"],
-                type=project["type"],
-            )
+            return _project_response(project)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Project creation failed")
             return pm_pb2.ProjectResponse()
 
+    @unit_of_work
     def GetProject(self, request, context):
 
         project = self.project_service.get_project(request.project_id)
 
         if project:
-            return pm_pb2.ProjectResponse(
-                id=project["id"],
-                name=project["name"],
-                description=project["description"],
-                color=project["color"],
-                img_url=project["img_url"],
-                type=project["type"],
-            )
+            return _project_response(project)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Project reading failed")
             return pm_pb2.ProjectResponse()
 
+    @unit_of_work
     def UpdateProject(self, request, context):
 
         project = self.project_service.update_project(project_id=request.id, name=request.name,
@@ -63,37 +104,25 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
                                                       type_project=request.type)
 
         if project:
-            return pm_pb2.ProjectResponse(
-                id=project["id"],
-                name=project["name"],
-                description=project["description"],
-                color=project["color"],
-                img_url=project["img_url"],
-                type=project["type"],
-            )
+            return _project_response(project)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Project update failed")
             return pm_pb2.ProjectResponse()
 
+    @unit_of_work
     def UpdateProjectImg(self, request, context):
 
         project = self.project_service.update_project_img(project_id=request.id, img_url=request.img_url)
 
         if project:
-            return pm_pb2.ProjectResponse(
-                id=project["id"],
-                name=project["name"],
-                description=project["description"],
-                color=project["color"],
-                img_url=project["img_url"],
-                type=project["type"],
-            )
+            return _project_response(project)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Project update failed")
             return pm_pb2.ProjectResponse()
 
+    @unit_of_work
     def UpdateProjectUsers(self, request, context):
 
         users = [{"id": u.id, "role": u.role} for u in request.users]
@@ -116,6 +145,7 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
             context.set_details("Project users update failed")
             return pm_pb2.UpdateProjectUsersResponse()
 
+    @unit_of_work
     def DeleteProject(self, request, context):
 
         res = self.project_service.delete_project(project_id=request.id)
@@ -130,6 +160,7 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
             context.set_details("Project deleting was failed")
             return pm_pb2.DeleteProjectResponse()
 
+    @unit_of_work
     def GetUserProjects(self, request, context):
 
         res = self.project_service.get_user_projects(user_id=request.user_id)
@@ -138,17 +169,7 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
             print(res, flush=True)
 
             return pm_pb2.UserProjectsResponse(
-                projects=[
-                    pm_pb2.ProjectResponse(
-                        id=item["id"],
-                        name=item["name"],
-                        description=item["description"],
-                        color=item["color"],
-                        img_url=item["img_url"],
-                        type=item["type"],
-                    )
-                    for item in res
-                ]
+                projects=[_project_response(item) for item in res]
             )
         elif not res:
             return pm_pb2.UserProjectsResponse()
@@ -157,70 +178,45 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
             context.set_details("Project not found")
             return pm_pb2.UserProjectsResponse()
 
+    @unit_of_work
     def GetProjectUsers(self, request, context):
 
         res = self.project_service.get_project_users(project_id=request.project_id)
 
         if res:
             return pm_pb2.ProjectUsersResponse(
-                users=[
-                    pm_pb2.UserInfo(
-                        user_id=item["user_id"],
-                        email=item["email"],
-                        name=item["name"],
-                        surname=item["surname"],
-                        img_url=item["img_url"],
-                        role=item["role"]
-                    )
-                    for item in res
-                ]
+                users=[_user_info(item) for item in res]
             )
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Project not found")
             return pm_pb2.ProjectUsersResponse()
 
+    @unit_of_work
     def GetSprint(self, request, context):
 
         sprint = self.sprint_service.get_sprint(id=request.id)
 
         if sprint:
-            return pm_pb2.SprintResponse(
-                id=sprint["id"],
-                name=sprint["name"],
-                description=sprint["description"],
-                start_date=sprint["start_date"],
-                end_date=sprint["end_date"],
-                is_started=sprint["is_started"],
-                project_id=sprint["project_id"],
-            )
+            return _sprint_response(sprint)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Sprint reading failed")
             return pm_pb2.SprintResponse()
 
+    @unit_of_work
     def GetProjectSprints(self, request, context):
 
         try:
             project_sprints = self.sprint_service.get_project_sprints(project_id=request.project_id)
 
             return pm_pb2.ProjectSprintsResponse(
-                sprints=[
-                    pm_pb2.SprintResponse(
-                        id=sprint["id"],
-                        name=sprint["name"],
-                        description=sprint["description"],
-                        start_date=sprint["start_date"],
-                        end_date=sprint["end_date"],
-                        is_started=sprint["is_started"],
-                        project_id=sprint["project_id"],
-                    )
-                    for sprint in project_sprints
-                ]
+                sprints=[_sprint_response(sprint) for sprint in project_sprints]
             )
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Project sprints reading failed: {e}")
 
+    @unit_of_work
     def CreateSprint(self, request, context):
         sprint = self.sprint_service.create_sprint(
             name=request.name,
@@ -233,20 +229,13 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
         )
 
         if sprint:
-            return pm_pb2.SprintResponse(
-                id=sprint["id"],
-                name=sprint["name"],
-                description=sprint["description"],
-                start_date=sprint["start_date"],
-                end_date=sprint["end_date"],
-                is_started=sprint["is_started"],
-                project_id=sprint["project_id"],
-            )
+            return _sprint_response(sprint)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Sprint creating failed")
             return pm_pb2.SprintResponse()
 
+    @unit_of_work
     def UpdateSprint(self, request, context):
         sprint = self.sprint_service.update_sprint(
             id=request.id,
@@ -260,20 +249,13 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
         )
 
         if sprint:
-            return pm_pb2.SprintResponse(
-                id=sprint["id"],
-                name=sprint["name"],
-                description=sprint["description"],
-                start_date=sprint["start_date"],
-                end_date=sprint["end_date"],
-                is_started=sprint["is_started"],
-                project_id=sprint["project_id"],
-            )
+            return _sprint_response(sprint)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Sprint updating failed")
             return pm_pb2.SprintResponse()
 
+    @unit_of_work
     def DeleteSprint(self, request, context):
         res = self.sprint_service.delete_sprint(id=request.id)
 
@@ -286,45 +268,29 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
             context.set_details("Sprint deleting failed")
             return pm_pb2.DeleteSprintResponse()
 
+    @unit_of_work
     def GetEpic(self, request, context):
         epic = self.epic_service.get_epic(id=request.id)
 
         if epic:
-            return pm_pb2.EpicResponse(
-                id=epic["id"],
-                name=epic["name"],
-                description=epic["description"],
-                priority=epic["priority"],
-                start_date=epic["start_date"],
-                end_date=epic["end_date"],
-                project_id=epic["project_id"],
-            )
+            return _epic_response(epic)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Epic reading failed")
             return pm_pb2.EpicResponse()
 
+    @unit_of_work
     def GetProjectEpics(self, request, context):
         try:
             project_epics = self.epic_service.get_project_epics(project_id=request.project_id)
 
             return pm_pb2.ProjectEpicsResponse(
-                epics=[
-                    pm_pb2.EpicResponse(
-                        id=epic["id"],
-                        name=epic["name"],
-                        description=epic["description"],
-                        priority=epic["priority"],
-                        start_date=epic["start_date"],
-                        end_date=epic["end_date"],
-                        project_id=epic["project_id"],
-                    )
-                    for epic in project_epics
-                ]
+                epics=[_epic_response(epic) for epic in project_epics]
             )
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Project epics reading failed: {e}")
 
+    @unit_of_work
     def CreateEpic(self, request, context):
         epic = self.epic_service.create_epic(
             name=request.name,
@@ -337,20 +303,13 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
         )
 
         if epic:
-            return pm_pb2.EpicResponse(
-                id=epic["id"],
-                name=epic["name"],
-                description=epic["description"],
-                priority=epic["priority"],
-                start_date=epic["start_date"],
-                end_date=epic["end_date"],
-                project_id=epic["project_id"],
-            )
+            return _epic_response(epic)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Epic creating failed")
             return pm_pb2.EpicResponse()
 
+    @unit_of_work
     def UpdateEpic(self, request, context):
         epic = self.epic_service.update_epic(
             id=request.id,
@@ -364,20 +323,13 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
         )
 
         if epic:
-            return pm_pb2.EpicResponse(
-                id=epic["id"],
-                name=epic["name"],
-                description=epic["description"],
-                priority=epic["priority"],
-                start_date=epic["start_date"],
-                end_date=epic["end_date"],
-                project_id=epic["project_id"],
-            )
+            return _epic_response(epic)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Epic updating failed")
             return pm_pb2.EpicResponse()
 
+    @unit_of_work
     def DeleteEpic(self, request, context):
         res = self.epic_service.delete_epic(id=request.id)
 
@@ -390,9 +342,91 @@ class PmServicer(pm_pb2_grpc.ProjectServiceServicer):
             context.set_details("Epic deleting failed")
             return pm_pb2.DeleteEpicResponse()
 
+    def GetMetrics(self, request, context):
+        return pm_pb2.MetricsResponse(values={**db_stats(), **cache.stats()})
+
+
+class AsyncPmServicer(PmServicer):
+    """Servicer for the grpc.aio server.
+
+    Reads are served on the event loop; the write RPCs are inherited from
+    PmServicer and run in the server's migration thread pool.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.async_project_service = AsyncProjectService()
+        self.async_epic_service = AsyncEpicService()
+        self.async_sprint_service = AsyncSprintService()
+
+    async def GetProject(self, request, context):
+        try:
+            project = await self.async_project_service.get_project(request.project_id)
+        except ValueError:
+            await context.abort(grpc.StatusCode.UNKNOWN, "Project reading failed")
+        return _project_response(project)
+
+    async def GetUserProjects(self, request, context):
+        res = await self.async_project_service.get_user_projects(user_id=request.user_id)
+        return pm_pb2.UserProjectsResponse(projects=[_project_response(item) for item in res])
+
+    async def GetProjectUsers(self, request, context):
+        res = await self.async_project_service.get_project_users(project_id=request.project_id)
+
+        if not res:
+            await context.abort(grpc.StatusCode.UNKNOWN, "Project not found")
+        return pm_pb2.ProjectUsersResponse(users=[_user_info(item) for item in res])
+
+    async def GetSprint(self, request, context):
+        try:
+            sprint = await self.async_sprint_service.get_sprint(id=request.id)
+        except ValueError:
+            await context.abort(grpc.StatusCode.UNKNOWN, "Sprint reading failed")
+        return _sprint_response(sprint)
+
+    async def GetProjectSprints(self, request, context):
+        try:
+            project_sprints = await self.async_sprint_service.get_project_sprints(
+                project_id=request.project_id
+            )
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Project sprints reading failed: {e}")
+        return pm_pb2.ProjectSprintsResponse(
+            sprints=[_sprint_response(sprint) for sprint in project_sprints]
+        )
+
+    async def GetEpic(self, request, context):
+        try:
+            epic = await self.async_epic_service.get_epic(id=request.id)
+        except ValueError:
+            await context.abort(grpc.StatusCode.UNKNOWN, "Epic reading failed")
+        return _epic_response(epic)
+
+    async def GetProjectEpics(self, request, context):
+        try:
+            project_epics = await self.async_epic_service.get_project_epics(
+                project_id=request.project_id
+            )
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Project epics reading failed: {e}")
+        return pm_pb2.ProjectEpicsResponse(epics=[_epic_response(epic) for epic in project_epics])
+
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=GRPC_MAX_WORKERS), options=SERVER_OPTIONS
+    )
     pm_pb2_grpc.add_ProjectServiceServicer_to_server(PmServicer(), server)
     server.add_insecure_port('[::]:50052')
     return server
+
+
+def serve_aio():
+    # Sync handlers (the write RPCs) are run in the migration thread pool
+    server = grpc.aio.server(
+        migration_thread_pool=futures.ThreadPoolExecutor(max_workers=GRPC_MAX_WORKERS),
+        options=SERVER_OPTIONS,
+    )
+    pm_pb2_grpc.add_ProjectServiceServicer_to_server(AsyncPmServicer(), server)
+    server.add_insecure_port('[::]:50052')
+    return server
@@ -1,11 +1,10 @@
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import func, select
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal, on_commit, session_scope
 from app.models.models import Epic, Task, Project
 from datetime import date, datetime
-from app.clients.redis import redis_client, EPICS_TTL
+from app.clients.redis import cache, EPICS_TTL
 import uuid
-import json
 
 
 def _to_uuid_or_none(v):
@@ -46,36 +45,48 @@ def _parse_date(v) -> date | None:
     raise ValueError(f"Incorrect date format: {v}. Waiting for dd.mm.yyyy")
 
 
+def _load_epic(db, id) -> dict | None:
+    epic = db.get(Epic, id)
+    if epic is None:
+        return None
+    return _serialize_epic(epic)
+
+
+def _load_project_epics(db, project_id) -> list[dict]:
+    epics = db.query(Epic).where(Epic.project_id == project_id).all()
+    return [_serialize_epic(e) for e in epics]
+
+
+def _write_tags(epic, project_id, moved=True) -> tuple:
+    """Cache tags made stale by a write to ``epic``; ``moved`` if tasks joined or left it."""
+    tags = (f"epics:{project_id}", f"epic:{epic.id}")
+    if moved:
+        tags += (f"tasks:{project_id}",)
+    return tags
+
+
 class EpicService:
     def get_epic(self, id):
-        db = SessionLocal()
-        try:
-            epic = db.get(Epic, id)
+        with session_scope() as db:
+            epic = _load_epic(db, id)
             if epic is None:
                 raise ValueError(f"Epic ({id}) not found")
-            return _serialize_epic(epic)
-        finally:
-            db.close()
+            return epic
 
     def get_project_epics(self, project_id):
-        cache_key = f"project_epics:{project_id}"
-        raw = redis_client.get(cache_key)
-        if raw:
-            return json.loads(raw)
+        def load():
+            with session_scope() as db:
+                return _load_project_epics(db, project_id)
 
-        db = SessionLocal()
-        try:
-            epics = db.query(Epic).where(Epic.project_id == project_id).all()
-
-            payload = [_serialize_epic(e) for e in epics]
-            redis_client.setex(cache_key, EPICS_TTL, json.dumps(payload))
-            return payload
-        finally:
-            db.close()
+        return cache.get(
+            f"project_epics:{project_id}",
+            EPICS_TTL,
+            load,
+            tags=(f"project:{project_id}", f"epics:{project_id}"),
+        )
 
     def create_epic(self, name, description, priority, start_date, end_date, project_id, tasks):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             sd = _parse_date(start_date)
             ed = _parse_date(end_date)
 
@@ -110,19 +121,14 @@ class EpicService:
                     if t.project_id == project_id and t.epic_id is None:
                         t.epic_id = epic.id
 
-            db.commit()
-            db.refresh(epic)
+            db.flush()
 
-            redis_client.delete(f"project_epics:{project_id}")
-            redis_client.delete(f"epic_tasks:{epic.id}")
+            on_commit(db, cache.invalidate_tags, *_write_tags(epic, project_id, moved=bool(task_ids)))
 
             return _serialize_epic(epic)
-        finally:
-            db.close()
 
     def update_epic(self, id, name, description, priority, start_date, end_date, project_id, tasks):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             epic = db.get(Epic, id)
 
             if epic is None:
@@ -139,6 +145,7 @@ class EpicService:
             if db.get(Project, project_id) is None:
                 raise ValueError(f"Project ({project_id}) not found")
 
+            old_project_id = epic.project_id
             epic.name = name
             epic.description = description
             epic.priority = priority
@@ -165,22 +172,19 @@ class EpicService:
                     if t.project_id == project_id and t.epic_id is None:
                         t.epic_id = epic.id
 
-            db.commit()
-            db.refresh(epic)
+            db.flush()
 
-            redis_client.delete(f"project_epics:{project_id}")
-            redis_client.delete(f"epic_tasks:{epic.id}")
+            on_commit(
+                db,
+                cache.invalidate_tags,
+                *_write_tags(epic, old_project_id),
+                *_write_tags(epic, project_id),
+            )
 
             return _serialize_epic(epic)
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
 
     def delete_epic(self, id):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             epic = db.get(Epic, id)
 
             if epic is None:
@@ -189,15 +193,28 @@ class EpicService:
             project_id = epic.project_id
 
             db.delete(epic)
-            db.commit()
 
-            redis_client.delete(f"project_epics:{project_id}")
-            redis_client.delete(f"epic_tasks:{id}")
-            redis_client.delete(f"project_tasks:{project_id}")
+            on_commit(db, cache.invalidate_tags, *_write_tags(epic, project_id))
 
             return True
-        except:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+
+
+class AsyncEpicService:
+    async def get_epic(self, id):
+        async with AsyncSessionLocal() as db:
+            epic = await db.run_sync(_load_epic, _to_uuid_or_none(id))
+        if epic is None:
+            raise ValueError(f"Epic ({id}) not found")
+        return epic
+
+    async def get_project_epics(self, project_id):
+        async def load():
+            async with AsyncSessionLocal() as db:
+                return await db.run_sync(_load_project_epics, _to_uuid_or_none(project_id))
+
+        return await cache.aget(
+            f"project_epics:{project_id}",
+            EPICS_TTL,
+            load,
+            tags=(f"project:{project_id}", f"epics:{project_id}"),
+        )
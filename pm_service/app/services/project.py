@@ -1,52 +1,99 @@
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import func
-from app.database import SessionLocal
-from app.models.models import User, Project, ProjectType, ProjectUser, Role
+from app.database import AsyncSessionLocal, lookups, on_commit, session_scope
+from app.models.models import Project, ProjectType, ProjectUser, Role
 from sqlalchemy.orm import joinedload
-from app.clients.redis import redis_client, PROJECT_TTL, USERS_TTL
-import json
+from app.clients.redis import redis_client, cache, PROJECT_TTL, USERS_TTL
+from taskio_models.lookup import publish_invalidation
+import uuid
+
+
+def _to_uuid_or_none(v):
+    if v in (None, "", 0):
+        return None
+    if isinstance(v, uuid.UUID):
+        return v
+    return uuid.UUID(str(v))
+
+
+def _serialize_project(p: Project) -> dict:
+    return {
+        "id": str(p.id),
+        "name": p.name,
+        "description": p.description,
+        "color": p.color,
+        "img_url": p.img_url,
+        "type": p.type.name
+    }
+
+
+def _load_project(db, project_id) -> dict | None:
+    project = db.get(Project, project_id, options=[joinedload(Project.type)])
+    if project is None:
+        return None
+    return _serialize_project(project)
+
+
+def _users_tags(project_id):
+    """Cache tags of a project's member list, a function of the list."""
+    return lambda users: (f"project:{project_id}", *(f"user:{u['user_id']}" for u in users))
+
+
+def _load_project_users(db, project_id) -> list[dict]:
+    pu = (
+        db.query(ProjectUser)
+        .options(joinedload(ProjectUser.user), joinedload(ProjectUser.role))
+        .filter(ProjectUser.project_id == project_id)
+        .all()
+    )
+
+    return [
+        {
+            "user_id": str(u.user.id),
+            "email": u.user.email,
+            "name": u.user.name,
+            "surname": u.user.surname,
+            "img_url": u.user.img_url,
+            "role": u.role.name
+        }
+        for u in pu
+    ]
+
+
+def _load_user_projects(db, user_id) -> list[dict]:
+    projects = (
+        db.query(Project)
+        .join(ProjectUser, Project.id == ProjectUser.project_id)
+        .filter(ProjectUser.user_id == user_id)
+        .options(joinedload(Project.type))
+        .all()
+    )
+
+    return [_serialize_project(p) for p in projects]
 
 
 class ProjectService:
     def init_types_and_roles(self):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             project_types =['pet-project', 'software', 'bugtracking',
                             'devops', 'project managment', 'marketing',
                             'finance', 'science', 'event organization']
             roles = ['observer', 'assignee', 'manager', 'owner']
 
-            for type in project_types:
-                type_model = ProjectType(name=type)
-                db.add(type_model)
-                db.commit()
+            db.add_all(ProjectType(name=type) for type in project_types)
+            db.add_all(Role(name=role) for role in roles)
 
-            for role in roles:
-                role_model = Role(name=role)
-                db.add(role_model)
-                db.commit()
-        finally:
-            db.close()
+            on_commit(db, lookups.invalidate, "project_types", "roles")
+            on_commit(db, publish_invalidation, redis_client, "project_types", "roles")
 
     def get_type(self, type_name):
-        db = SessionLocal()
-        try:
-            type_model = db.query(ProjectType).filter(ProjectType.name == type_name).first()
-            return type_model.id
-        finally:
-            db.close()
+        return lookups.id_of("project_types", type_name)
 
     def get_role(self, role_name):
-        db = SessionLocal()
-        try:
-            role = db.query(Role).filter(Role.name == role_name).first()
-            return role.id
-        finally:
-            db.close()
+        return lookups.id_of("roles", role_name)
 
     def write_users_to_project(self, project_id, users):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             for user in users:
 
                 role_id = self.get_role(user.role)
@@ -58,36 +105,28 @@ class ProjectService:
                 )
 
                 db.add(project_user)
-                db.commit()
-        finally:
-            db.close()
 
     def create_project(self, name, description, color, img_url, type_project, users):
-        db = SessionLocal()
-        try:
-            type_model = db.query(ProjectType).filter_by(name=type_project).one()
-
+        with session_scope() as db:
             project = Project(
                 name=name,
                 description=description,
                 color=color,
                 img_url=img_url,
-                type_id=type_model.id
+                type_id=self.get_type(type_project)
             )
             db.add(project)
             db.flush()
 
             for u in users:
-                role = db.query(Role).filter_by(name=u.role).one()
                 pu = ProjectUser(
                     user_id=u.id,
                     project_id=project.id,
-                    role_id=role.id
+                    role_id=self.get_role(u.role)
                 )
                 db.add(pu)
 
-            db.commit()
-            db.refresh(project)
+            db.flush()
 
             project_res = {
                 "id": str(project.id),
@@ -95,56 +134,27 @@ class ProjectService:
                 "description": project.description,
                 "color": project.color,
                 "img_url": project.img_url,
-                "type": type_model.name,
+                "type": type_project,
             }
 
             return project_res
-        except:
-            db.rollback()
-            raise
-        finally:
-            db.close()
 
     def get_project(self, project_id):
+        def load():
+            with session_scope() as db:
+                return _load_project(db, project_id)
 
-        cache_key = f"project:{project_id}"
-        raw = redis_client.get(cache_key)
-        if raw:
-            return json.loads(raw)
-
-        db = SessionLocal()
-        try:
-            project = db.get(Project, project_id)
+        project_res = cache.get(
+            f"project:{project_id}", PROJECT_TTL, load, tags=(f"project:{project_id}",)
+        )
 
-            if project is None:
-                raise ValueError(f"Project ({project_id}) not found")
+        if project_res is None:
+            raise ValueError(f"Project ({project_id}) not found")
 
-            project = (
-                db.query(Project)
-                .options(
-                    joinedload(Project.type)
-                )
-                .get(project.id)
-            )
-
-            project_res = {
-                "id": str(project.id),
-                "name": project.name,
-                "description": project.description,
-                "color": project.color,
-                "img_url": project.img_url,
-                "type": project.type.name,
-            }
-
-            redis_client.setex(cache_key, PROJECT_TTL, json.dumps(project_res))
-
-            return project_res
-        finally:
-            db.close()
+        return project_res
 
     def update_project(self, project_id, name, description, color, type_project):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             project = db.get(Project, project_id)
 
             if project is None:
@@ -154,12 +164,9 @@ class ProjectService:
             project.description = description
             project.color = color
 
-            type_model = db.query(ProjectType).filter_by(name=type_project).one()
-
-            project.type_id = type_model.id
+            project.type_id = self.get_type(type_project)
 
-            db.commit()
-            db.refresh(project)
+            db.flush()
 
             project_res = {
                 "id": str(project.id),
@@ -167,39 +174,30 @@ class ProjectService:
                 "description": project.description,
                 "color": project.color,
                 "img_url": project.img_url,
-                "type": type_model.name,
+                "type": type_project,
             }
 
-            cache_key = f"project:{project_id}"
-            redis_client.setex(cache_key, PROJECT_TTL, json.dumps(project_res))
+            on_commit(
+                db,
+                cache.set,
+                f"project:{project_id}",
+                PROJECT_TTL,
+                project_res,
+                tags=(f"project:{project_id}",),
+            )
 
             return project_res
-        except:
-            db.rollback()
-            raise
-        finally:
-            db.close()
 
     def update_project_img(self, project_id, img_url):
-        db = SessionLocal()
-        try:
-            project = db.get(Project, project_id)
+        with session_scope() as db:
+            project = db.get(Project, project_id, options=[joinedload(Project.type)])
 
             if project is None:
                 raise ValueError(f"Project ({project_id}) not found")
 
             project.img_url = img_url
 
-            db.commit()
-            db.refresh(project)
-
-            project = (
-                db.query(Project)
-                .options(
-                    joinedload(Project.type)
-                )
-                .get(project.id)
-            )
+            db.flush()
 
             project_res = {
                 "id": str(project.id),
@@ -210,19 +208,19 @@ class ProjectService:
                 "type": project.type.name,
             }
 
-            cache_key = f"project:{project_id}"
-            redis_client.setex(cache_key, PROJECT_TTL, json.dumps(project_res))
+            on_commit(
+                db,
+                cache.set,
+                f"project:{project_id}",
+                PROJECT_TTL,
+                project_res,
+                tags=(f"project:{project_id}",),
+            )
 
             return project_res
-        except:
-            db.rollback()
-            raise
-        finally:
-            db.close()
 
     def update_project_users(self, project_id, users):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             project = db.get(Project, project_id)
             if project is None:
                 raise ValueError(f"Project ({project_id}) not found")
@@ -231,10 +229,8 @@ class ProjectService:
 
             if not users:
                 db.delete(project)
-                db.commit()
 
-                redis_client.delete(f"project:{project_id}")
-                redis_client.delete(f"project_users:{project_id}")
+                on_commit(db, cache.invalidate_tags, f"project:{project_id}")
 
                 return {
                     "project_id": "",
@@ -242,139 +238,100 @@ class ProjectService:
                 }
 
             for u in users:
-                role = db.query(Role).filter_by(name=u["role"]).one()
                 pu = ProjectUser(
                     user_id=u["id"],
                     project_id=project.id,
-                    role_id=role.id
+                    role_id=self.get_role(u["role"])
                 )
                 db.add(pu)
 
-            db.commit()
+            db.flush()
 
-            project = (
-                db.query(Project)
-                .options(
-                    joinedload(Project.users).joinedload(ProjectUser.role),
-                    joinedload(Project.users).joinedload(ProjectUser.user)
-                )
-                .get(project.id)
-            )
-            db.refresh(project)
+            # Read back through the same unit of work, before its commit
+            project_users = _load_project_users(db, project.id)
 
             payload = {
                 "project_id": str(project.id),
                 "users": [
                     {
-                        "user_id": str(pu.user_id),
-                        "role": pu.role.name
+                        "user_id": pu["user_id"],
+                        "role": pu["role"]
                     }
-                    for pu in project.users
+                    for pu in project_users
                 ]
             }
 
-            redis_payload = [
-                {
-                    "user_id": str(pu.user.id),
-                    "email": pu.user.email,
-                    "name": pu.user.name,
-                    "surname": pu.user.surname,
-                    "img_url": pu.user.img_url or "",
-                    "role": pu.role.name
-                }
-                for pu in project.users
-            ]
+            redis_payload = [{**pu, "img_url": pu["img_url"] or ""} for pu in project_users]
 
-            cache_key = f"project_users:{project_id}"
-            redis_client.setex(cache_key, USERS_TTL, json.dumps(redis_payload))
+            on_commit(
+                db,
+                cache.set,
+                f"project_users:{project_id}",
+                USERS_TTL,
+                redis_payload,
+                tags=_users_tags(project_id),
+            )
             return payload
-        except:
-            db.rollback()
-            raise
-        finally:
-            db.close()
 
     def delete_project(self, project_id):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             project = db.get(Project, project_id)
 
             if project is None:
                 raise ValueError(f"Project ({project_id}) not found")
 
             db.delete(project)
-            db.commit()
 
-            redis_client.delete(f"project:{project_id}")
-            redis_client.delete(f"project_users:{project_id}")
-            redis_client.delete(f"project_tasks:{project_id}")
-            redis_client.delete(f"project_epics:{project_id}")
-            redis_client.delete(f"project_sprints:{project_id}")
+            on_commit(db, cache.invalidate_tags, f"project:{project_id}")
 
             return True
-        except:
-            db.rollback()
-            raise
-        finally:
-            db.close()
 
     def get_project_users(self, project_id):
-        cache_key = f"project_users:{project_id}"
-        raw = redis_client.get(cache_key)
-        if raw:
-            return json.loads(raw)
-
-        db = SessionLocal()
-        try:
-            pu = db.query(ProjectUser).filter(ProjectUser.project_id == project_id).all()
-
-            if not pu:
-                return []
-
-            res = []
-
-            for u in pu:
-                user = db.get(User, u.user_id)
-                role = db.get(Role, u.role_id)
-                item = {
-                    "user_id": str(user.id),
-                    "email": user.email,
-                    "name": user.name,
-                    "surname": user.surname,
-                    "img_url": user.img_url,
-                    "role": role.name
-                }
+        def load():
+            with session_scope() as db:
+                # An empty list is not cached, like a missing project
+                return _load_project_users(db, project_id) or None
 
-                res.append(item)
+        return cache.get(
+            f"project_users:{project_id}", USERS_TTL, load, tags=_users_tags(project_id)
+        ) or []
 
-            redis_client.setex(cache_key, USERS_TTL, json.dumps(res))
+    def get_user_projects(self, user_id):
+        with session_scope() as db:
+            return _load_user_projects(db, user_id)
 
-            return res
-        finally:
-            db.close()
 
-    def get_user_projects(self, user_id):
-        db = SessionLocal()
-        try:
-            projects = (
-                db.query(Project)
-                .join(ProjectUser, Project.id == ProjectUser.project_id)
-                .filter(ProjectUser.user_id == user_id)
-                .options(joinedload(Project.type))
-                .all()
-            )
+class AsyncProjectService:
+    """Read side of ProjectService for the grpc.aio server mode.
 
-            return [
-                {
-                    "id": str(p.id),
-                    "name": p.name,
-                    "description": p.description,
-                    "color": p.color,
-                    "img_url": p.img_url,
-                    "type": p.type.name
-                }
-                for p in projects
-            ]
-        finally:
-            db.close()
+    The loaders above are shared with the sync service and run through
+    ``AsyncSession.run_sync``.
+    """
+
+    async def get_project(self, project_id):
+        async def load():
+            async with AsyncSessionLocal() as db:
+                return await db.run_sync(_load_project, _to_uuid_or_none(project_id))
+
+        project_res = await cache.aget(
+            f"project:{project_id}", PROJECT_TTL, load, tags=(f"project:{project_id}",)
+        )
+
+        if project_res is None:
+            raise ValueError(f"Project ({project_id}) not found")
+
+        return project_res
+
+    async def get_project_users(self, project_id):
+        async def load():
+            async with AsyncSessionLocal() as db:
+                return await db.run_sync(_load_project_users, _to_uuid_or_none(project_id)) or None
+
+        return await cache.aget(
+            f"project_users:{project_id}", USERS_TTL, load, tags=_users_tags(project_id)
+        ) or []
+
+    async def get_user_projects(self, user_id):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(_load_user_projects, _to_uuid_or_none(user_id))
 
@@ -1,11 +1,10 @@
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import select
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal, on_commit, session_scope
 from app.models.models import Sprint, Task, Project
 from datetime import date, datetime
-from app.clients.redis import redis_client, SPRINTS_TTL
+from app.clients.redis import cache, SPRINTS_TTL
 import uuid
-import json
 
 
 def _to_uuid_or_none(v):
@@ -46,36 +45,48 @@ def _parse_date(v) -> date | None:
     raise ValueError(f"Incorrect date format: {v}. Waiting for dd.mm.yyyy")
 
 
+def _load_sprint(db, id) -> dict | None:
+    sprint = db.get(Sprint, id)
+    if sprint is None:
+        return None
+    return _serialize_sprint(sprint)
+
+
+def _load_project_sprints(db, project_id) -> list[dict]:
+    sprints = db.query(Sprint).where(Sprint.project_id == project_id).all()
+    return [_serialize_sprint(s) for s in sprints]
+
+
+def _write_tags(sprint, project_id, moved=True) -> tuple:
+    """Cache tags made stale by a write to ``sprint``; ``moved`` if tasks joined or left it."""
+    tags = (f"sprints:{project_id}", f"sprint:{sprint.id}")
+    if moved:
+        tags += (f"tasks:{project_id}",)
+    return tags
+
+
 class SprintService:
     def get_sprint(self, id):
-        db = SessionLocal()
-        try:
-            sprint = db.get(Sprint, id)
+        with session_scope() as db:
+            sprint = _load_sprint(db, id)
             if sprint is None:
                 raise ValueError(f"Sprint ({id}) not found")
-            return _serialize_sprint(sprint)
-        finally:
-            db.close()
+            return sprint
 
     def get_project_sprints(self, project_id):
-        cache_key = f"project_sprints:{project_id}"
-        raw = redis_client.get(cache_key)
-        if raw:
-            return json.loads(raw)
+        def load():
+            with session_scope() as db:
+                return _load_project_sprints(db, project_id)
 
-        db = SessionLocal()
-        try:
-            sprints = db.query(Sprint).where(Sprint.project_id == project_id).all()
-
-            payload = [_serialize_sprint(s) for s in sprints]
-            redis_client.setex(cache_key, SPRINTS_TTL, json.dumps(payload))
-            return payload
-        finally:
-            db.close()
+        return cache.get(
+            f"project_sprints:{project_id}",
+            SPRINTS_TTL,
+            load,
+            tags=(f"project:{project_id}", f"sprints:{project_id}"),
+        )
 
     def create_sprint(self, name, description, start_date, end_date, is_started, project_id, tasks):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             sd = _parse_date(start_date)
             ed = _parse_date(end_date)
 
@@ -110,19 +121,14 @@ class SprintService:
                     if t.project_id == project_id and t.sprint_id is None:
                         t.sprint_id = sprint.id
 
-            db.commit()
-            db.refresh(sprint)
+            db.flush()
 
-            redis_client.delete(f"project_sprints:{project_id}")
-            redis_client.delete(f"sprint_tasks:{sprint.id}")
+            on_commit(db, cache.invalidate_tags, *_write_tags(sprint, project_id, moved=bool(task_ids)))
 
             return _serialize_sprint(sprint)
-        finally:
-            db.close()
 
     def update_sprint(self, id, name, description, start_date, end_date, is_started, project_id, tasks):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             sprint = db.get(Sprint, id)
 
             if sprint is None:
@@ -156,6 +162,7 @@ class SprintService:
                         f"Cannot start sprint ({id}). Running sprint already exists in project ({project_id})"
                     )
 
+            old_project_id = sprint.project_id
             sprint.name = name
             sprint.description = description
             sprint.start_date = sd
@@ -182,22 +189,19 @@ class SprintService:
                     if t.project_id == project_id and t.sprint_id is None:
                         t.sprint_id = sprint.id
 
-            db.commit()
-            db.refresh(sprint)
+            db.flush()
 
-            redis_client.delete(f"project_sprints:{project_id}")
-            redis_client.delete(f"sprint_tasks:{sprint.id}")
+            on_commit(
+                db,
+                cache.invalidate_tags,
+                *_write_tags(sprint, old_project_id),
+                *_write_tags(sprint, project_id),
+            )
 
             return _serialize_sprint(sprint)
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
 
     def delete_sprint(self, id):
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             sprint = db.get(Sprint, id)
 
             if sprint is None:
@@ -206,15 +210,28 @@ class SprintService:
             project_id = sprint.project_id
 
             db.delete(sprint)
-            db.commit()
 
-            redis_client.delete(f"project_sprints:{project_id}")
-            redis_client.delete(f"sprint_tasks:{id}")
-            redis_client.delete(f"project_tasks:{project_id}")
+            on_commit(db, cache.invalidate_tags, *_write_tags(sprint, project_id))
 
             return True
-        except:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+
+
+class AsyncSprintService:
+    async def get_sprint(self, id):
+        async with AsyncSessionLocal() as db:
+            sprint = await db.run_sync(_load_sprint, _to_uuid_or_none(id))
+        if sprint is None:
+            raise ValueError(f"Sprint ({id}) not found")
+        return sprint
+
+    async def get_project_sprints(self, project_id):
+        async def load():
+            async with AsyncSessionLocal() as db:
+                return await db.run_sync(_load_project_sprints, _to_uuid_or_none(project_id))
+
+        return await cache.aget(
+            f"project_sprints:{project_id}",
+            SPRINTS_TTL,
+            load,
+            tags=(f"project:{project_id}", f"sprints:{project_id}"),
+        )
@@ -1,10 +1,97 @@
 from concurrent import futures
+import os
 import grpc
+from taskio_server import SERVER_OPTIONS
 
-from app.services.task import TaskService
+from app.clients.redis import cache
+from app.database import db_stats
+from app.services.task import TaskService, AsyncTaskService
 from . import task_pb2
 from . import task_pb2_grpc
 
+GRPC_MAX_WORKERS = int(os.getenv("GRPC_MAX_WORKERS", "10"))
+
+
+def _task_response(task):
+    return task_pb2.TaskResponse(
+        id=task["id"],
+        title=task["title"],
+        description=task["description"],
+        priority=task["priority"],
+        type=task["type"],
+        status=task["status"],
+        assigned_to=task["assigned_to"],
+        epic_id=task["epic_id"],
+        sprint_id=task["sprint_id"],
+        project_id=task["project_id"],
+        start_date=task["start_date"],
+        end_date=task["end_date"],
+    )
+
+
+def _create_task_args(request):
+    return dict(
+        title=request.title,
+        description=request.description,
+        priority=request.priority,
+        type=request.type,
+        assigned_to=request.assigned_to,
+        epic_id=request.epic_id,
+        sprint_id=request.sprint_id,
+        project_id=request.project_id,
+        start_date=request.start_date,
+        end_date=request.end_date,
+    )
+
+
+def _update_task_args(request):
+    return dict(
+        _create_task_args(request),
+        id=request.id,
+        status=request.status,
+    )
+
+
+def _list_tasks_args(request):
+    scopes = [
+        (scope, scope_id)
+        for scope, scope_id in (
+            ("project", request.project_id),
+            ("sprint", request.sprint_id),
+            ("epic", request.epic_id),
+        )
+        if scope_id
+    ]
+    if len(scopes) != 1:
+        raise ValueError("Exactly one of project_id, sprint_id or epic_id is required")
+    scope, scope_id = scopes[0]
+    return {
+        "scope": scope,
+        "scope_id": scope_id,
+        "statuses": list(request.statuses),
+        "types": list(request.types),
+        "assigned_to": list(request.assigned_to),
+        "min_priority": request.min_priority,
+        "max_priority": request.max_priority,
+        "date_from": request.date_from,
+        "date_to": request.date_to,
+        "sort": request.sort,
+        "descending": request.descending,
+        "page_size": request.page_size,
+        "page_token": request.page_token,
+    }
+
+
+def _batch_response(results):
+    resp = task_pb2.BatchTasksResponse()
+    for index, (task, error) in enumerate(results):
+        result = resp.results.add(index=index)
+        if task is not None:
+            result.task.CopyFrom(_task_response(task))
+        else:
+            result.error = error
+    return resp
+
 
 class TaskServicer(task_pb2_grpc.TaskServiceServicer):
     def __init__(self):
@@ -15,20 +102,7 @@ class TaskServicer(task_pb2_grpc.TaskServiceServicer):
         task = self.task_service.get_task(request.id)
 
         if task:
-            return task_pb2.TaskResponse(
-                id=task["id"],
-                title=task["title"],
-                description=task["description"],
-                priority=task["priority"],
-                type=task["type"],
-                status=task["status"],
-                assigned_to=task["assigned_to"],
-                epic_id=task["epic_id"],
-                sprint_id=task["sprint_id"],
-                project_id=task["project_id"],
-                start_date=task["start_date"],
-                end_date=task["end_date"],
-            )
+            return _task_response(task)
         else:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details("Task reading failed")
@@ -38,52 +112,34 @@ class TaskServicer(task_pb2_grpc.TaskServiceServicer):
         try:
             project_tasks = self.task_service.get_project_tasks(request.project_id)
 
-            return task_pb2.TasksResponse(
-                tasks=[
-                    task_pb2.TaskResponse(
-                        id=task["id"],
-                        title=task["title"],
-                        description=task["description"],
-                        priority=task["priority"],
-                        type=task["type"],
-                        status=task["status"],
-                        assigned_to=task["assigned_to"],
-                        epic_id=task["epic_id"],
-                        sprint_id=task["sprint_id"],
-                        project_id=task["project_id"],
-                        start_date=task["start_date"],
-                        end_date=task["end_date"],
-                    )
-                    for task in project_tasks
-                ]
-            )
+            # Already serialized by the cache, parsed in C rather than built here
+            return task_pb2.TasksResponse.FromString(project_tasks)
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Project tasks reading failed: {e}")
 
+    def StreamProjectTasks(self, request, context):
+        try:
+            for tasks in self.task_service.stream_project_tasks(request.project_id, request.chunk_size):
+                yield task_pb2.TasksResponse(tasks=[_task_response(task) for task in tasks])
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+    def ListTasks(self, request, context):
+        try:
+            return task_pb2.ListTasksResponse.FromString(
+                self.task_service.list_tasks(**_list_tasks_args(request))
+            )
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except Exception as e:
+            context.abort(grpc.StatusCode.INTERNAL, f"Task listing failed: {e}")
+
     def GetSprintTasks(self, request, context):
 
         try:
             sprint_tasks = self.task_service.get_sprint_tasks(request.sprint_id)
 
-            return task_pb2.TasksResponse(
-                tasks=[
-                    task_pb2.TaskResponse(
-                        id=task["id"],
-                        title=task["title"],
-                        description=task["description"],
-                        priority=task["priority"],
-                        type=task["type"],
-                        status=task["status"],
-                        assigned_to=task["assigned_to"],
-                        epic_id=task["epic_id"],
-                        sprint_id=task["sprint_id"],
-                        project_id=task["project_id"],
-                        start_date=task["start_date"],
-                        end_date=task["end_date"],
-                    )
-                    for task in sprint_tasks
-                ]
-            )
+            return task_pb2.TasksResponse.FromString(sprint_tasks)
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Sprint tasks reading failed: {e}")
 
@@ -91,93 +147,25 @@ class TaskServicer(task_pb2_grpc.TaskServiceServicer):
         try:
             epic_tasks = self.task_service.get_epic_tasks(request.epic_id)
 
-            return task_pb2.TasksResponse(
-                tasks=[
-                    task_pb2.TaskResponse(
-                        id=task["id"],
-                        title=task["title"],
-                        description=task["description"],
-                        priority=task["priority"],
-                        type=task["type"],
-                        status=task["status"],
-                        assigned_to=task["assigned_to"],
-                        epic_id=task["epic_id"],
-                        sprint_id=task["sprint_id"],
-                        project_id=task["project_id"],
-                        start_date=task["start_date"],
-                        end_date=task["end_date"],
-                    )
-                    for task in epic_tasks
-                ]
-            )
+            return task_pb2.TasksResponse.FromString(epic_tasks)
         except Exception as e:
             context.abort(grpc.StatusCode.INTERNAL, f"Epic tasks reading failed: {e}")
 
     def CreateTask(self, request, context):
-        task = self.task_service.create_task(
-            title=request.title,
-            description=request.description,
-            priority=request.priority,
-            type=request.type,
-            assigned_to=request.assigned_to,
-            epic_id=request.epic_id,
-            sprint_id=request.sprint_id,
-            project_id=request.project_id,
-            start_date=request.start_date,
-            end_date=request.end_date,
-        )
+        task = self.task_service.create_task(**_create_task_args(request))
 
         if task:
-            return task_pb2.TaskResponse(
-                id=task["id"],
-                title=task["title"],
-                description=task["description"],
-                priority=task["priority"],
-                type=task["type"],
-                status=task["status"],
-                assigned_to=task["assigned_to"],
-                epic_id=task["epic_id"],
-                sprint_id=task["sprint_id"],
-                project_id=task["project_id"],
-                start_date=task["start_date"],
-                end_date=task["end_date"],
-            )
+            return _task_response(task)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Task creating failed")
             return task_pb2.TaskResponse()
 
     def UpdateTask(self, request, context):
-        task = self.task_service.update_task(
-            id=request.id,
-            title=request.title,
-            description=request.description,
-            priority=request.priority,
-            type=request.type,
-            status=request.status,
-            assigned_to=request.assigned_to,
-            epic_id=request.epic_id,
-            sprint_id=request.sprint_id,
-            project_id=request.project_id,
-            start_date=request.start_date,
-            end_date=request.end_date,
-        )
+        task = self.task_service.update_task(**_update_task_args(request))
 
         if task:
-            return task_pb2.TaskResponse(
-                id=task["id"],
-                title=task["title"],
-                description=task["description"],
-                priority=task["priority"],
-                type=task["type"],
-                status=task["status"],
-                assigned_to=task["assigned_to"],
-                epic_id=task["epic_id"],
-                sprint_id=task["sprint_id"],
-                project_id=task["project_id"],
-                start_date=task["start_date"],
-                end_date=task["end_date"],
-            )
+            return _task_response(task)
         else:
             context.set_code(grpc.StatusCode.UNKNOWN)
             context.set_details("Task updating failed")
@@ -195,9 +183,101 @@ class TaskServicer(task_pb2_grpc.TaskServiceServicer):
             context.set_details("Task deleting failed")
             return task_pb2.DeleteTaskResponse()
 
+    def BatchCreateTasks(self, request, context):
+        try:
+            results = self.task_service.batch_create_tasks(
+                [_create_task_args(t) for t in request.tasks]
+            )
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        return _batch_response(results)
+
+    def BatchUpdateTasks(self, request, context):
+        try:
+            results = self.task_service.batch_update_tasks(
+                [_update_task_args(t) for t in request.tasks]
+            )
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        return _batch_response(results)
+
+    def GetMetrics(self, request, context):
+        return task_pb2.MetricsResponse(values={**db_stats(), **cache.stats()})
+
+
+class AsyncTaskServicer(TaskServicer):
+    """Servicer for the grpc.aio server.
+
+    Reads are served on the event loop; the write RPCs are inherited from
+    TaskServicer and run in the server's migration thread pool.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.async_task_service = AsyncTaskService()
+
+    async def GetTask(self, request, context):
+        try:
+            task = await self.async_task_service.get_task(request.id)
+        except ValueError:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "Task reading failed")
+        return _task_response(task)
+
+    async def GetProjectTasks(self, request, context):
+        try:
+            project_tasks = await self.async_task_service.get_project_tasks(request.project_id)
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Project tasks reading failed: {e}")
+        return task_pb2.TasksResponse.FromString(project_tasks)
+
+    async def StreamProjectTasks(self, request, context):
+        try:
+            async for tasks in self.async_task_service.stream_project_tasks(
+                request.project_id, request.chunk_size
+            ):
+                yield task_pb2.TasksResponse(tasks=[_task_response(task) for task in tasks])
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+    async def ListTasks(self, request, context):
+        try:
+            page = await self.async_task_service.list_tasks(**_list_tasks_args(request))
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Task listing failed: {e}")
+        return task_pb2.ListTasksResponse.FromString(page)
+
+    async def GetSprintTasks(self, request, context):
+        try:
+            sprint_tasks = await self.async_task_service.get_sprint_tasks(request.sprint_id)
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Sprint tasks reading failed: {e}")
+        return task_pb2.TasksResponse.FromString(sprint_tasks)
+
+    async def GetEpicTasks(self, request, context):
+        try:
+            epic_tasks = await self.async_task_service.get_epic_tasks(request.epic_id)
+        except Exception as e:
+            await context.abort(grpc.StatusCode.INTERNAL, f"Epic tasks reading failed: {e}")
+        return task_pb2.TasksResponse.FromString(epic_tasks)
+
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=GRPC_MAX_WORKERS), options=SERVER_OPTIONS
+    )
     task_pb2_grpc.add_TaskServiceServicer_to_server(TaskServicer(), server)
     server.add_insecure_port("[::]:50053")
     return server
+
+
+def serve_aio():
+    # Sync handlers (the write RPCs) are run in the migration thread pool
+    server = grpc.aio.server(
+        migration_thread_pool=futures.ThreadPoolExecutor(max_workers=GRPC_MAX_WORKERS),
+        options=SERVER_OPTIONS,
+    )
+    task_pb2_grpc.add_TaskServiceServicer_to_server(AsyncTaskServicer(), server)
+    server.add_insecure_port("[::]:50053")
+    return server
@@ -3,10 +3,29 @@ import os
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from grpc_app.task_service import serve
+from taskio_cache import InvalidationListener
+from taskio_models.lookup import LookupListener
+from taskio_server import run
+
+from app.clients.redis import redis_client, cache
+from app.database import engine, async_engine, lookups
+from grpc_app.task_service import serve, serve_aio
+
+
+def _start_listeners():
+    # Per process, after the fork: the listeners are threads
+    LookupListener(redis_client, lookups).start()
+    if cache.local is not None:
+        InvalidationListener(redis_client, cache.local).start()
+    lookups.preload()
+
 
 if __name__ == "__main__":
-    server = serve()
-    print("Starting TaskService on port 50053...")
-    server.start()
-    server.wait_for_termination()
+    run(
+        "TaskService",
+        50053,
+        serve,
+        serve_aio,
+        engines=(engine, async_engine.sync_engine),
+        on_start=_start_listeners,
+    )
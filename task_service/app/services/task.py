@@ -1,12 +1,23 @@
-from app.database import SessionLocal
+from app.database import SessionLocal, AsyncSessionLocal, lookups
 from app.models.models import Task, Status, TaskType
+from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import joinedload
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from datetime import date, datetime
-from app.clients.redis import redis_client, TASKS_TTL
-import json
+from app.clients.redis import redis_client, binary_redis_client, async_binary_redis_client, cache
+from taskio_models import tables
+from taskio_models.lookup import publish_invalidation
+from taskio_cache import jittered_ttl
+from taskio_cache.tags import register as register_tags
+from app.services import task_cache, task_list, task_wire
+from app.services.task_list import TaskQuery, pages_key
+import os
 import uuid
 
+TASK_BATCH_MAX = int(os.getenv("TASK_BATCH_MAX", 500))
+TASK_STREAM_CHUNK = int(os.getenv("TASK_STREAM_CHUNK", 500))
+TASK_STREAM_CHUNK_MAX = int(os.getenv("TASK_STREAM_CHUNK_MAX", 5000))
+
 
 def _to_uuid_or_none(v):
     if v in (None, "", 0):
@@ -34,6 +45,24 @@ def _parse_date(v) -> date | None:
     raise ValueError(f"Incorrect date format: {v}. Waiting for dd.mm.yyyy")
 
 
+def _check_dates(start_date, end_date):
+    if start_date and end_date and end_date < start_date:
+        raise ValueError("end_date cannot be earlier than start_date")
+
+
+def _updated_dates(status, start_date, end_date, current_end_date):
+    """Start and end date of an updated task; marking it done stamps today."""
+    sd = _parse_date(start_date)
+    _check_dates(sd, current_end_date)
+
+    if status == "done":
+        today = date.today()
+        if sd and today < sd:
+            return today, today
+        return sd, today
+    return sd, _parse_date(end_date)
+
+
 def _serialize_task(t: Task) -> dict:
     return {
         "id": str(t.id),
@@ -51,6 +80,272 @@ def _serialize_task(t: Task) -> dict:
     }
 
 
+def _serialize_values(values: dict) -> dict:
+    """_serialize_task for a task written in bulk, from the values written."""
+    return {
+        "id": str(values["id"]),
+        "title": values["title"],
+        "description": values["description"],
+        "priority": values["priority"],
+        "type": lookups.name_of("task_types", values["type_id"]),
+        "status": lookups.name_of("statuses", values["status_id"]),
+        "assigned_to": str(values["assigned_to"]) if values["assigned_to"] else "",
+        "epic_id": str(values["epic_id"]) if values["epic_id"] else "",
+        "sprint_id": str(values["sprint_id"]) if values["sprint_id"] else "",
+        "project_id": str(values["project_id"]),
+        "start_date": _fmt_date(values["start_date"]),
+        "end_date": _fmt_date(values["end_date"]),
+    }
+
+
+def _task_values(item: dict, status_id, start_date, end_date) -> dict:
+    project_id = _to_uuid_or_none(item["project_id"])
+    if project_id is None:
+        raise ValueError("project_id is required")
+    return {
+        "title": item["title"],
+        "description": item["description"],
+        "priority": item["priority"],
+        "type_id": lookups.id_of("task_types", item["type"]),
+        "status_id": status_id,
+        "assigned_to": _to_uuid_or_none(item["assigned_to"]),
+        "epic_id": _to_uuid_or_none(item["epic_id"]),
+        "sprint_id": _to_uuid_or_none(item["sprint_id"]),
+        "project_id": project_id,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+
+
+# Rows a task points to, checked up front so one bad reference fails its
+# own item instead of the whole executemany
+_REFERENCES = (
+    ("project_id", tables.projects.c.id, "Project"),
+    ("epic_id", tables.epics.c.id, "Epic"),
+    ("sprint_id", tables.sprints.c.id, "Sprint"),
+    ("assigned_to", tables.users.c.id, "User"),
+)
+
+
+def _drop_dangling(db, pending: dict, errors: dict):
+    """Moves the pending items whose references do not exist to ``errors``."""
+    for field, column, label in _REFERENCES:
+        ids = {values[field] for values in pending.values() if values[field] is not None}
+        if not ids:
+            continue
+        found = set(db.scalars(select(column).where(column.in_(ids))))
+        for index, values in list(pending.items()):
+            if values[field] is not None and values[field] not in found:
+                errors[index] = f"{label} ({values[field]}) not found"
+                del pending[index]
+
+
+def _page_keys(project_id, sprint_id, epic_id) -> set:
+    """The cached listing pages a task appears in."""
+    keys = {pages_key("project", project_id)}
+    if sprint_id:
+        keys.add(pages_key("sprint", sprint_id))
+    if epic_id:
+        keys.add(pages_key("epic", epic_id))
+    return keys
+
+
+def _write_through(changes):
+    """Patches the cached task lists after a commit, in one round trip.
+
+    ``changes`` holds a (task id, placement before, task after) triple per
+    written task; the placement is the (project_id, sprint_id, epic_id) of
+    the stored row, None for a new task, and the task None once deleted.
+    Listing pages cannot be patched and are dropped instead, with UNLINK
+    as a page hash can be large, and their generation is bumped so that
+    a page read before the write is not stored after it.
+    """
+    with cache.batch() as batch:
+        pages = set()
+        for task_id, before, task in changes:
+            was_in = ()
+            if before:
+                was_in = task_cache.list_keys(*before)
+                pages |= _page_keys(*before)
+            if task:
+                pages |= _page_keys(task["project_id"], task["sprint_id"], task["epic_id"])
+            task_cache.patch(batch, task_id, was_in, task)
+        if pages:
+            batch.pipe.unlink(*pages)
+            for key in pages:
+                batch.pipe.incr(_pages_gen_key(key))
+                batch.pipe.expire(_pages_gen_key(key), task_list.TASK_PAGES_TTL)
+
+
+def _placement(values) -> tuple:
+    return values["project_id"], values["sprint_id"], values["epic_id"]
+
+
+def _load_tasks(*where) -> list[dict]:
+    db = SessionLocal()
+    try:
+        return _select_tasks(db, *where)
+    finally:
+        db.close()
+
+
+def _update_returning_old(values: dict):
+    """UPDATE of one task that returns the row as it was before.
+
+    RETURNING only sees the new row, so the old one is locked and read in a
+    CTE the UPDATE joins against; the stale cache keys and the end-date
+    check come back in the same round trip as the write.
+    """
+    tasks = tables.tasks
+    old = (
+        select(tasks.c.id, tasks.c.project_id, tasks.c.sprint_id, tasks.c.epic_id, tasks.c.end_date)
+        .where(tasks.c.id == values["id"])
+        .with_for_update()
+        .cte("old")
+    )
+    return (
+        update(tasks)
+        .where(tasks.c.id == old.c.id)
+        .values({k: v for k, v in values.items() if k != "id"})
+        .returning(old.c.project_id, old.c.sprint_id, old.c.epic_id, old.c.end_date)
+    )
+
+
+def _batch_results(size, written: dict, errors: dict) -> list:
+    return [
+        (_serialize_values(written[i]), None) if i in written else (None, errors[i])
+        for i in range(size)
+    ]
+
+
+def _check_batch_size(items):
+    if len(items) > TASK_BATCH_MAX:
+        raise ValueError(f"At most {TASK_BATCH_MAX} tasks per batch")
+
+
+def _stream_chunk_size(chunk_size) -> int:
+    if chunk_size <= 0:
+        return TASK_STREAM_CHUNK
+    return min(chunk_size, TASK_STREAM_CHUNK_MAX)
+
+
+def _project_tasks_stream(project_id, chunk_size):
+    # Plain columns without joins, type and status names come from the
+    # lookup cache. yield_per fetches chunk_size rows at a time through a
+    # server-side cursor instead of buffering the whole result
+    return (
+        select(tables.tasks)
+        .where(tables.tasks.c.project_id == _to_uuid_or_none(project_id))
+        .execution_options(yield_per=chunk_size)
+    )
+
+
+def _ids_of(table_name, names) -> tuple:
+    try:
+        return tuple(sorted({str(lookups.id_of(table_name, name)) for name in names}))
+    except NoResultFound:
+        raise ValueError(f"Unknown {table_name} in {list(names)}")
+
+
+def _task_query(
+    scope,
+    scope_id,
+    statuses=(),
+    types=(),
+    assigned_to=(),
+    min_priority=0,
+    max_priority=0,
+    date_from="",
+    date_to="",
+    sort="",
+    descending=False,
+) -> TaskQuery:
+    """Normalizes a ListTasks request; 0 and "" mean "no filter"."""
+    scope_id = _to_uuid_or_none(scope_id)
+    if scope not in task_list.SCOPES or scope_id is None:
+        raise ValueError("One of project_id, sprint_id or epic_id is required")
+    sort = sort or "created_at"
+    if sort not in task_list.SORTS:
+        raise ValueError(f"Cannot sort by {sort}, expected one of {sorted(task_list.SORTS)}")
+    date_from, date_to = _parse_date(date_from), _parse_date(date_to)
+
+    return TaskQuery(
+        scope=scope,
+        scope_id=str(scope_id),
+        status_ids=_ids_of("statuses", statuses),
+        type_ids=_ids_of("task_types", types),
+        assignees=tuple(sorted({str(_to_uuid_or_none(a)) for a in assigned_to})),
+        min_priority=min_priority or None,
+        max_priority=max_priority or None,
+        date_from=date_from.isoformat() if date_from else None,
+        date_to=date_to.isoformat() if date_to else None,
+        sort=sort,
+        descending=bool(descending),
+    )
+
+
+def _list_page(db, query: TaskQuery, size, token) -> dict:
+    after = task_list.decode_token(query, token) if token else None
+    rows = db.execute(task_list.select_page(query, size, after)).all()
+    page = [row._mapping for row in rows[:size]]
+    return {
+        "tasks": [_serialize_values(values) for values in page],
+        "next_page_token": task_list.encode_token(query, page[-1]) if len(rows) > size else "",
+    }
+
+
+# KEYS: the pages hash, its generation key
+# ARGV: the generation seen before reading the page, field, page, ttl
+_STORE_PAGE = """
+if redis.call('GET', KEYS[2]) ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+def _pages_gen_key(cache_key) -> str:
+    return f"{cache_key}:gen"
+
+
+def _queue_page_read(pipe, cache_key, field):
+    """Queues the read of a cached page and of the generation of its scope's pages.
+
+    The generation is created if missing, so that every write, including
+    the tag invalidations of the pm service, bumps it.
+    """
+    pipe.hget(cache_key, field)
+    pipe.set(_pages_gen_key(cache_key), 0, nx=True, ex=task_list.TASK_PAGES_TTL)
+    pipe.get(_pages_gen_key(cache_key))
+
+
+def _page_field(query: TaskQuery, size, token) -> str:
+    # "pb" keeps pages cached as JSON by earlier versions from being read
+    return f"pb:{query.fingerprint()}:{size}:{token}"
+
+
+def _queue_page(pipe, query: TaskQuery, cache_key, field, page, payload, generation):
+    """Queues the store of ``page``, dropped if a write bumped ``generation`` since it was read."""
+    ttl = jittered_ttl(task_list.TASK_PAGES_TTL)
+    pipe.eval(_STORE_PAGE, 2, cache_key, _pages_gen_key(cache_key), generation, field, payload, ttl)
+    tags = task_cache.list_tags(query.scope, query.scope_id, page["tasks"])
+    register_tags(pipe, cache_key, ttl, tags)
+
+
+def _select_tasks(db, *where) -> list[dict]:
+    stmt = (
+        select(Task)
+        .options(
+            joinedload(Task.status),
+            joinedload(Task.type),
+        )
+        .where(*where)
+    )
+    return [_serialize_task(t) for t in db.scalars(stmt).all()]
+
+
 class TaskService:
     def init_statuses_types(self):
         db = SessionLocal()
@@ -77,98 +372,87 @@ class TaskService:
                 db.add(type_model)
                 db.commit()
 
+            lookups.invalidate("statuses", "task_types")
+            publish_invalidation(redis_client, "statuses", "task_types")
         finally:
             db.close()
 
     def get_task(self, task_id):
         db = SessionLocal()
         try:
-            stmt = (
-                select(Task)
-                .options(
-                    joinedload(Task.status),
-                    joinedload(Task.type),
-                )
-                .where(Task.id == task_id)
-            )
-            task = db.scalars(stmt).first()
-            if task is None:
+            tasks = _select_tasks(db, Task.id == task_id)
+            if not tasks:
                 raise ValueError(f"Task ({task_id}) not found")
-            return _serialize_task(task)
+            return tasks[0]
         finally:
             db.close()
 
     def get_project_tasks(self, project_id):
-        cache_key = f"project_tasks:{project_id}"
-        raw = redis_client.get(cache_key)
-        if raw:
-            return json.loads(raw)
-
+        return task_cache.cached_tasks(
+            f"project_task_map:{project_id}",
+            lambda: _load_tasks(Task.project_id == project_id),
+            "project",
+            project_id,
+        )
+
+    def stream_project_tasks(self, project_id, chunk_size=0):
+        """Yields the tasks of a project as lists of at most ``chunk_size``.
+
+        For projects too large for one message; it reads the database
+        directly and leaves the project_tasks cache alone.
+        """
         db = SessionLocal()
         try:
-            stmt = (
-                select(Task)
-                .options(
-                    joinedload(Task.status),
-                    joinedload(Task.type),
-                )
-                .where(Task.project_id == project_id)
-            )
-            tasks = db.scalars(stmt).all()
-
-            payload = [_serialize_task(t) for t in tasks]
-            redis_client.setex(cache_key, TASKS_TTL, json.dumps(payload))
-            return payload
+            result = db.execute(_project_tasks_stream(project_id, _stream_chunk_size(chunk_size)))
+            for rows in result.partitions():
+                yield [_serialize_values(row._mapping) for row in rows]
         finally:
             db.close()
 
-    def get_sprint_tasks(self, sprint_id):
-        cache_key = f"sprint_tasks:{sprint_id}"
-        raw = redis_client.get(cache_key)
-        if raw:
-            return json.loads(raw)
+    def list_tasks(self, scope, scope_id, page_size=0, page_token="", **filters):
+        """One page of the filtered, sorted tasks of a project, sprint or epic.
+
+        Returns a serialized ListTasksResponse; its next_page_token is
+        empty on the last page. Pages are cached in one hash per scope that
+        every write to the scope drops.
+        """
+        query = _task_query(scope, scope_id, **filters)
+        size = task_list.page_size(page_size)
+        cache_key = pages_key(query.scope, query.scope_id)
+        field = _page_field(query, size, page_token)
+        pipe = binary_redis_client.pipeline(transaction=False)
+        _queue_page_read(pipe, cache_key, field)
+        raw, _, generation = pipe.execute()
+        if raw is not None:
+            return raw
 
         db = SessionLocal()
         try:
-            stmt = (
-                select(Task)
-                .options(
-                    joinedload(Task.status),
-                    joinedload(Task.type),
-                )
-                .where(Task.sprint_id == sprint_id)
-            )
-            tasks = db.scalars(stmt).all()
-
-            payload = [_serialize_task(t) for t in tasks]
-            redis_client.setex(cache_key, TASKS_TTL, json.dumps(payload))
-            return payload
+            page = _list_page(db, query, size, page_token)
         finally:
             db.close()
 
-    def get_epic_tasks(self, epic_id):
-        cache_key = f"epic_tasks:{epic_id}"
-        raw = redis_client.get(cache_key)
-        if raw:
-            return json.loads(raw)
+        payload = task_wire.page_bytes(page)
+        pipe = binary_redis_client.pipeline(transaction=False)
+        _queue_page(pipe, query, cache_key, field, page, payload, generation)
+        pipe.execute()
+        return payload
 
-        db = SessionLocal()
-        try:
-            stmt = (
-                select(Task)
-                .options(
-                    joinedload(Task.status),
-                    joinedload(Task.type),
-                )
-                .where(Task.epic_id == epic_id)
-            )
-            tasks = db.scalars(stmt).all()
+    def get_sprint_tasks(self, sprint_id):
+        return task_cache.cached_tasks(
+            f"sprint_task_map:{sprint_id}",
+            lambda: _load_tasks(Task.sprint_id == sprint_id),
+            "sprint",
+            sprint_id,
+        )
 
-            payload = [_serialize_task(t) for t in tasks]
-            redis_client.setex(cache_key, TASKS_TTL, json.dumps(payload))
-            return payload
-        finally:
-            db.close()
+    def get_epic_tasks(self, epic_id):
+        return task_cache.cached_tasks(
+            f"epic_task_map:{epic_id}",
+            lambda: _load_tasks(Task.epic_id == epic_id),
+            "epic",
+            epic_id,
+        )
 
     def create_task(
         self,
@@ -183,55 +467,39 @@ class TaskService:
         start_date,
         end_date,
     ):
+        sd = _parse_date(start_date)
+        ed = _parse_date(end_date)
+        _check_dates(sd, ed)
+
+        item = {
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "type": type,
+            "assigned_to": assigned_to,
+            "epic_id": epic_id,
+            "sprint_id": sprint_id,
+            "project_id": project_id,
+        }
+        # Everything the response needs is known before the INSERT: the id is
+        # generated here and the type and status names come from the lookups
+        values = _task_values(item, lookups.id_of("statuses", "to do"), sd, ed)
+        values["id"] = uuid.uuid4()
+
         db = SessionLocal()
         try:
-            type_model = db.query(TaskType).filter_by(name=type).one()
-            status_model = db.query(Status).filter_by(name="to do").one()
-
-            sd = _parse_date(start_date)
-            ed = _parse_date(end_date)
-
-            if sd and ed and ed < sd:
-                raise ValueError("end_date cannot be earlier than start_date")
-
-            task = Task(
-                title=title,
-                description=description,
-                priority=priority,
-                type_id=type_model.id,
-                status_id=_to_uuid_or_none(status_model.id),
-                assigned_to=_to_uuid_or_none(assigned_to),
-                epic_id=_to_uuid_or_none(epic_id),
-                sprint_id=_to_uuid_or_none(sprint_id),
-                project_id=project_id,
-                start_date=sd,
-                end_date=ed,
-            )
-
-            db.add(task)
+            db.execute(insert(tables.tasks).values(**values))
             db.commit()
-            db.refresh(task)
-
-            stmt = (
-                select(Task)
-                .options(
-                    joinedload(Task.status),
-                    joinedload(Task.type),
-                )
-                .where(Task.id == task.id)
-            )
-            task = db.scalars(stmt).first()
-
-            redis_client.delete(f"project_tasks:{task.project_id}")
-            if task.sprint_id:
-                redis_client.delete(f"sprint_tasks:{task.sprint_id}")
-            if task.epic_id:
-                redis_client.delete(f"epic_tasks:{task.epic_id}")
-
-            return _serialize_task(task)
+        except:
+            db.rollback()
+            raise
         finally:
             db.close()
 
+        task = _serialize_values(values)
+        _write_through([(values["id"], None, task)])
+        return task
+
     def update_task(
         self,
         id,
@@ -247,72 +515,38 @@ class TaskService:
         start_date,
         end_date,
     ):
+        item = {
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "type": type,
+            "assigned_to": assigned_to,
+            "epic_id": epic_id,
+            "sprint_id": sprint_id,
+            "project_id": project_id,
+        }
+        sd, ed = _updated_dates(status, start_date, end_date, None)
+        values = _task_values(item, lookups.id_of("statuses", status), sd, ed)
+        values["id"] = _to_uuid_or_none(id)
+
         db = SessionLocal()
         try:
-            task = db.get(Task, id)
-            if task is None:
+            old = db.execute(_update_returning_old(values)).first()
+            if old is None:
                 raise ValueError(f"Task ({id}) not found")
-
-            old_sprint_id = task.sprint_id
-            old_epic_id = task.epic_id
-
-            task.title = title
-            task.description = description
-            task.priority = priority
-
-            type_model = db.query(TaskType).filter_by(name=type).one()
-            task.type_id = type_model.id
-
-            status_model = db.query(Status).filter_by(name=status).one()
-            task.status_id = status_model.id
-
-            task.assigned_to = _to_uuid_or_none(assigned_to)
-            task.epic_id = _to_uuid_or_none(epic_id)
-            task.sprint_id = _to_uuid_or_none(sprint_id)
-            task.project_id = _to_uuid_or_none(project_id)
-
-            task.start_date = _parse_date(start_date)
-            if task.start_date and task.end_date and task.end_date < task.start_date:
-                raise ValueError("end_date cannot be earlier than start_date")
-
-            if status == "done" and date.today() < task.start_date:
-                task.start_date = date.today()
-                task.end_date = date.today()
-            elif status == "done":
-                task.end_date = date.today()
-            else:
-                task.end_date = _parse_date(end_date)
-
-
-
+            # The stored end date is only known now, the UPDATE is undone if it fails
+            _check_dates(sd, old.end_date)
             db.commit()
-
-            stmt = (
-                select(Task)
-                .options(
-                    joinedload(Task.status),
-                    joinedload(Task.type),
-                )
-                .where(Task.id == task.id)
-            )
-            task = db.scalars(stmt).first()
-
-            redis_client.delete(f"project_tasks:{task.project_id}")
-
-            if old_sprint_id:
-                redis_client.delete(f"sprint_tasks:{old_sprint_id}")
-            if task.sprint_id:
-                redis_client.delete(f"sprint_tasks:{task.sprint_id}")
-
-            if old_epic_id:
-                redis_client.delete(f"epic_tasks:{old_epic_id}")
-            if task.epic_id:
-                redis_client.delete(f"epic_tasks:{task.epic_id}")
-
-            return _serialize_task(task)
+        except:
+            db.rollback()
+            raise
         finally:
             db.close()
 
+        task = _serialize_values(values)
+        _write_through([(values["id"], tuple(old[:3]), task)])
+        return task
+
     def delete_task(self, task_id):
         db = SessionLocal()
         try:
@@ -321,18 +555,12 @@ class TaskService:
             if task is None:
                 raise ValueError(f"Task ({task_id}) not found")
 
-            project_id = task.project_id
-            sprint_id = task.sprint_id
-            epic_id = task.epic_id
+            before = task.id, (task.project_id, task.sprint_id, task.epic_id)
 
             db.delete(task)
             db.commit()
 
-            redis_client.delete(f"project_tasks:{project_id}")
-            if sprint_id:
-                redis_client.delete(f"sprint_tasks:{sprint_id}")
-            if epic_id:
-                redis_client.delete(f"epic_tasks:{epic_id}")
+            _write_through([(*before, None)])
 
             return True
         except:
@@ -340,3 +568,174 @@ class TaskService:
             raise
         finally:
             db.close()
+
+    def batch_create_tasks(self, items):
+        """Creates tasks from dicts shaped like the create_task arguments.
+
+        The valid items are inserted in one transaction with one
+        executemany. Returns a (task, error) pair per item in request order;
+        an invalid item gets its error and does not stop the others.
+        """
+        _check_batch_size(items)
+        pending, errors = {}, {}
+        for index, item in enumerate(items):
+            try:
+                sd = _parse_date(item["start_date"])
+                ed = _parse_date(item["end_date"])
+                _check_dates(sd, ed)
+
+                values = _task_values(item, lookups.id_of("statuses", "to do"), sd, ed)
+                values["id"] = uuid.uuid4()
+                pending[index] = values
+            except (ValueError, NoResultFound) as e:
+                errors[index] = str(e)
+
+        db = SessionLocal()
+        try:
+            _drop_dangling(db, pending, errors)
+            if pending:
+                # render_nulls keeps rows with and without NULLs in one executemany
+                db.execute(
+                    insert(Task).execution_options(render_nulls=True), list(pending.values())
+                )
+            db.commit()
+        except:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        results = _batch_results(len(items), pending, errors)
+        _write_through([(task["id"], None, task) for task, _ in results if task])
+        return results
+
+    def batch_update_tasks(self, items):
+        """Updates tasks from dicts shaped like the update_task arguments.
+
+        Same contract as batch_create_tasks: one SELECT of the current rows,
+        one executemany UPDATE by primary key, a (task, error) pair per item.
+        """
+        _check_batch_size(items)
+        pending, errors = {}, {}
+        db = SessionLocal()
+        try:
+            ids = {}
+            for index, item in enumerate(items):
+                try:
+                    ids[index] = _to_uuid_or_none(item["id"])
+                except ValueError as e:
+                    errors[index] = str(e)
+
+            current = {
+                row.id: row
+                for row in db.execute(
+                    select(Task.id, Task.project_id, Task.sprint_id, Task.epic_id, Task.end_date)
+                    .where(Task.id.in_({i for i in ids.values() if i is not None}))
+                )
+            }
+
+            before = {}
+            for index, task_id in ids.items():
+                item = items[index]
+                try:
+                    row = current.get(task_id)
+                    if row is None:
+                        raise ValueError(f"Task ({item['id']}) not found")
+
+                    sd, ed = _updated_dates(item["status"], item["start_date"], item["end_date"], row.end_date)
+                    values = _task_values(item, lookups.id_of("statuses", item["status"]), sd, ed)
+                    values["id"] = task_id
+                    pending[index] = values
+                    before[task_id] = _placement(row._mapping)
+                except (ValueError, NoResultFound) as e:
+                    errors[index] = str(e)
+
+            _drop_dangling(db, pending, errors)
+            if pending:
+                db.execute(update(Task), list(pending.values()))
+            db.commit()
+        except:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        results = _batch_results(len(items), pending, errors)
+        _write_through([
+            (pending[i]["id"], before[pending[i]["id"]], results[i][0]) for i in pending
+        ])
+        return results
+
+
+class AsyncTaskService:
+    """Read side of TaskService for the grpc.aio server mode.
+
+    Reuses the sync loaders through ``AsyncSession.run_sync`` so the ORM code
+    runs on the event loop over asyncpg instead of in a worker thread.
+    """
+
+    async def get_task(self, task_id):
+        async with AsyncSessionLocal() as db:
+            tasks = await db.run_sync(_select_tasks, Task.id == _to_uuid_or_none(task_id))
+        if not tasks:
+            raise ValueError(f"Task ({task_id}) not found")
+        return tasks[0]
+
+    async def get_project_tasks(self, project_id):
+        return await self._get_cached_tasks(
+            f"project_task_map:{project_id}",
+            Task.project_id == _to_uuid_or_none(project_id),
+            "project",
+            project_id,
+        )
+
+    async def stream_project_tasks(self, project_id, chunk_size=0):
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(
+                _project_tasks_stream(project_id, _stream_chunk_size(chunk_size))
+            )
+            async for rows in result.partitions():
+                yield [_serialize_values(row._mapping) for row in rows]
+
+    async def list_tasks(self, scope, scope_id, page_size=0, page_token="", **filters):
+        query = _task_query(scope, scope_id, **filters)
+        size = task_list.page_size(page_size)
+        cache_key = pages_key(query.scope, query.scope_id)
+        field = _page_field(query, size, page_token)
+        pipe = async_binary_redis_client.pipeline(transaction=False)
+        _queue_page_read(pipe, cache_key, field)
+        raw, _, generation = await pipe.execute()
+        if raw is not None:
+            return raw
+
+        async with AsyncSessionLocal() as db:
+            page = await db.run_sync(_list_page, query, size, page_token)
+
+        payload = task_wire.page_bytes(page)
+        pipe = async_binary_redis_client.pipeline(transaction=False)
+        _queue_page(pipe, query, cache_key, field, page, payload, generation)
+        await pipe.execute()
+        return payload
+
+    async def get_sprint_tasks(self, sprint_id):
+        return await self._get_cached_tasks(
+            f"sprint_task_map:{sprint_id}",
+            Task.sprint_id == _to_uuid_or_none(sprint_id),
+            "sprint",
+            sprint_id,
+        )
+
+    async def get_epic_tasks(self, epic_id):
+        return await self._get_cached_tasks(
+            f"epic_task_map:{epic_id}",
+            Task.epic_id == _to_uuid_or_none(epic_id),
+            "epic",
+            epic_id,
+        )
+
+    async def _get_cached_tasks(self, cache_key, where, scope, scope_id):
+        async def load():
+            async with AsyncSessionLocal() as db:
+                return await db.run_sync(_select_tasks, where)
+
+        return await task_cache.async_cached_tasks(cache_key, load, scope, scope_id)
@@ -0,0 +1,230 @@
+"""Project, sprint and epic task lists cached as Redis hashes.
+
+Each list is one hash, task id -> serialized TaskResponse, plus a
+``_complete`` field telling a fully loaded list (possibly empty) from a
+missing one. A read returns the list as serialized TasksResponse bytes
+put together from the hash values (see ``task_wire``).
+Writes patch the hashes of the lists a task left or joined in place, so
+a single-task write costs O(1) in Redis and readers keep hitting a warm
+list instead of rebuilding it after every change.
+
+A missing list is rebuilt by one reader at a time: the one that takes
+its lease in the shared ReadThroughCache loads it from the database
+while the others wait for the hash to appear, and fall back to reading
+the database themselves after ``CACHE_LEASE_WAIT`` seconds. Every patch
+bumps ``<key>:gen``, and a rebuild only stores its result if the
+generation it saw before loading is still current, so a write that lands
+during a rebuild is never overwritten by the older rows the rebuild read.
+
+Lists read from Redis are also kept in the L1 of the shared cache, if it
+has one; every patch publishes the keys it touched so that the L1s of
+all the replicas drop them. A rebuilt list registers the cache tags of
+its scope and of the projects of its rows (``list_tags``), for the pm
+service writes that move many tasks at once to drop it by tag.
+"""
+import asyncio
+import time
+
+from taskio_cache import jittered_ttl
+from taskio_cache.tags import register as register_tags
+
+from app.clients.redis import binary_redis_client, async_binary_redis_client, cache, TASKS_TTL
+from app.services import task_wire
+
+_POLL_INTERVAL = 0.02
+
+_COMPLETE = b"_complete"
+# Value of _COMPLETE; lists stored as JSON by earlier versions hold b"1"
+# and read as missing, so they are rebuilt rather than misparsed
+_FORMAT = b"pb"
+
+# KEYS: the list hashes, then their generation keys in the same order
+# ARGV: task id, serialized task ("" removes it), ttl of the generation keys
+_PATCH = """
+local n = #KEYS / 2
+for i = 1, n do
+    redis.call('INCR', KEYS[n + i])
+    redis.call('EXPIRE', KEYS[n + i], ARGV[3])
+    if redis.call('EXISTS', KEYS[i]) == 1 then
+        if ARGV[2] == '' then
+            redis.call('HDEL', KEYS[i], ARGV[1])
+        else
+            redis.call('HSET', KEYS[i], ARGV[1], ARGV[2])
+        end
+    end
+end
+"""
+
+# KEYS: the list hash, its generation key
+# ARGV: generation seen before loading, ttl, then task id / serialized task pairs
+_STORE = """
+if redis.call('GET', KEYS[2]) ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], '_complete', 'pb')
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+_store = binary_redis_client.register_script(_STORE)
+_async_store = async_binary_redis_client.register_script(_STORE)
+
+
+def list_keys(project_id, sprint_id, epic_id) -> set:
+    """The cached lists a task with these ids belongs to."""
+    keys = {f"project_task_map:{project_id}"}
+    if sprint_id:
+        keys.add(f"sprint_task_map:{sprint_id}")
+    if epic_id:
+        keys.add(f"epic_task_map:{epic_id}")
+    return keys
+
+
+def list_tags(scope, scope_id, tasks=()) -> set:
+    """Cache tags of a task list or listing page of a project, sprint or epic holding ``tasks``."""
+    tags = {f"{scope}:{scope_id}"}
+    if scope == "project":
+        tags.add(f"tasks:{scope_id}")
+    for project_id in {task["project_id"] for task in tasks}:
+        tags |= {f"project:{project_id}", f"tasks:{project_id}"}
+    return tags
+
+
+def _gen_key(key) -> str:
+    return f"{key}:gen"
+
+
+def _queue_generation(pipe, key):
+    """Queues the bump of ``key``'s generation, which expires like the patched ones."""
+    pipe.incr(_gen_key(key))
+    pipe.expire(_gen_key(key), TASKS_TTL)
+
+
+def _tasks(raw: dict) -> bytes | None:
+    if raw.get(_COMPLETE) != _FORMAT:
+        return None
+    return task_wire.tasks_bytes(value for field, value in raw.items() if field != _COMPLETE)
+
+
+def _encoded(tasks) -> list[tuple[str, bytes]]:
+    return [(task["id"], task_wire.task_bytes(task)) for task in tasks]
+
+
+def _store_args(generation, encoded) -> list:
+    args = [str(generation), jittered_ttl(TASKS_TTL)]
+    for task_id, value in encoded:
+        args += [task_id, value]
+    return args
+
+
+def _from_local(key):
+    """(the list in the L1 or None, the L1 generation to keep a list read now with)."""
+    if cache.local is None:
+        return None, None
+    return cache.local.get(key), cache.local.generation
+
+
+def _keep(key, tasks, generation):
+    if cache.local is not None:
+        cache.local.put(key, tasks, len(tasks), generation=generation)
+
+
+def patch(batch, task_id, was_in=(), task=None):
+    """Queues on ``batch`` (a ``Batch`` of the cache) the patches for one written task.
+
+    ``was_in`` are the lists the task was in before the write, ``task`` is
+    the serialized task after it, None once deleted.
+    """
+    now_in = list_keys(task["project_id"], task["sprint_id"], task["epic_id"]) if task else set()
+    left = sorted(set(was_in) - now_in)
+    if left:
+        batch.eval(_PATCH, [*left, *map(_gen_key, left)], [str(task_id), "", TASKS_TTL])
+    if now_in:
+        joined = sorted(now_in)
+        batch.eval(
+            _PATCH,
+            [*joined, *map(_gen_key, joined)],
+            [str(task_id), task_wire.task_bytes(task), TASKS_TTL],
+        )
+    if left or now_in:
+        cache.invalidate(*left, *now_in, pipe=batch.pipe)
+
+
+def cached_tasks(key, load, scope, scope_id) -> bytes:
+    """The list at ``key``, of ``scope`` ``scope_id``, as a serialized TasksResponse.
+
+    If it is not cached, it is rebuilt from ``load()``, which reads the
+    tasks (as ``_serialize_task`` dicts) from the database.
+    """
+    tasks, generation = _from_local(key)
+    if tasks is not None:
+        return tasks
+    tasks = _tasks(binary_redis_client.hgetall(key))
+    if tasks is not None:
+        _keep(key, tasks, generation)
+        return tasks
+
+    token = cache.acquire(key)
+    if token is not None:
+        try:
+            pipe = binary_redis_client.pipeline(transaction=False)
+            _queue_generation(pipe, key)
+            generation = pipe.execute()[0]
+            tasks = load()
+            encoded = _encoded(tasks)
+            pipe = binary_redis_client.pipeline(transaction=False)
+            _store(keys=[key, _gen_key(key)], args=_store_args(generation, encoded), client=pipe)
+            register_tags(pipe, key, TASKS_TTL, list_tags(scope, scope_id, tasks))
+            pipe.execute()
+            return task_wire.tasks_bytes(value for _, value in encoded)
+        finally:
+            cache.release(key, token)
+
+    deadline = time.monotonic() + cache.lease_wait
+    while time.monotonic() < deadline:
+        time.sleep(_POLL_INTERVAL)
+        tasks = _tasks(binary_redis_client.hgetall(key))
+        if tasks is not None:
+            return tasks
+    return task_wire.tasks_bytes(map(task_wire.task_bytes, load()))
+
+
+async def async_cached_tasks(key, load, scope, scope_id) -> bytes:
+    """cached_tasks for the grpc.aio server mode, ``load`` is a coroutine function."""
+    tasks, generation = _from_local(key)
+    if tasks is not None:
+        return tasks
+    tasks = _tasks(await async_binary_redis_client.hgetall(key))
+    if tasks is not None:
+        _keep(key, tasks, generation)
+        return tasks
+
+    token = await cache.aacquire(key)
+    if token is not None:
+        try:
+            pipe = async_binary_redis_client.pipeline(transaction=False)
+            _queue_generation(pipe, key)
+            generation = (await pipe.execute())[0]
+            tasks = await load()
+            encoded = _encoded(tasks)
+            pipe = async_binary_redis_client.pipeline(transaction=False)
+            await _async_store(
+                keys=[key, _gen_key(key)], args=_store_args(generation, encoded), client=pipe
+            )
+            register_tags(pipe, key, TASKS_TTL, list_tags(scope, scope_id, tasks))
+            await pipe.execute()
+            return task_wire.tasks_bytes(value for _, value in encoded)
+        finally:
+            await cache.arelease(key, token)
+
+    deadline = time.monotonic() + cache.lease_wait
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_POLL_INTERVAL)
+        tasks = _tasks(await async_binary_redis_client.hgetall(key))
+        if tasks is not None:
+            return tasks
+    return task_wire.tasks_bytes(map(task_wire.task_bytes, await load()))
@@ -0,0 +1,150 @@
+"""Filtered, sorted and keyset-paged task listings (ListTasks).
+
+A listing is scoped to one project, sprint or epic and optionally filtered
+by status, type, assignee, priority range and date window. Rows are
+ordered by one sort column with the task id as tie-breaker, so the order
+is total and a page token can carry the (value, id) of the last row: the
+next page starts right after it whatever was inserted meanwhile, and deep
+pages cost the same as the first one. NULLs sort last in both directions.
+
+The default sort (created_at) within a project, with or without a status
+filter, is answered straight from ix_tasks_project_id_created_at_id and
+ix_tasks_project_id_status_id_created_at_id.
+"""
+import base64
+import hashlib
+import json
+import os
+import uuid
+from dataclasses import dataclass, asdict
+from datetime import date, datetime
+
+from sqlalchemy import and_, or_, select, tuple_
+from taskio_models import tables
+
+LIST_PAGE_SIZE = int(os.getenv("TASK_LIST_PAGE_SIZE", 50))
+LIST_MAX_PAGE_SIZE = int(os.getenv("TASK_LIST_MAX_PAGE_SIZE", 500))
+# Cached pages live until the scope is written to, or this many seconds
+TASK_PAGES_TTL = int(os.getenv("TASK_PAGES_TTL", 300))
+
+_tasks = tables.tasks
+
+SCOPES = {
+    "project": _tasks.c.project_id,
+    "sprint": _tasks.c.sprint_id,
+    "epic": _tasks.c.epic_id,
+}
+
+SORTS = {
+    "created_at": _tasks.c.created_at,
+    "priority": _tasks.c.priority,
+    "start_date": _tasks.c.start_date,
+    "end_date": _tasks.c.end_date,
+    "title": _tasks.c.title,
+}
+
+
+@dataclass(frozen=True)
+class TaskQuery:
+    """A normalized listing request; equal queries share cache entries."""
+
+    scope: str
+    scope_id: str
+    status_ids: tuple = ()
+    type_ids: tuple = ()
+    assignees: tuple = ()
+    min_priority: int | None = None
+    max_priority: int | None = None
+    date_from: str | None = None
+    date_to: str | None = None
+    sort: str = "created_at"
+    descending: bool = False
+
+    def fingerprint(self) -> str:
+        raw = json.dumps(asdict(self), sort_keys=True)
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def pages_key(scope, scope_id) -> str:
+    """Redis hash holding every cached page of one project, sprint or epic."""
+    return f"task_pages:{scope}:{scope_id}"
+
+
+def page_size(value) -> int:
+    if not value or value < 0:
+        return LIST_PAGE_SIZE
+    return min(value, LIST_MAX_PAGE_SIZE)
+
+
+def _dump_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _load_value(sort, value):
+    if value is None:
+        return None
+    if sort == "created_at":
+        return datetime.fromisoformat(value)
+    if sort in ("start_date", "end_date"):
+        return date.fromisoformat(value)
+    return value
+
+
+def encode_token(query: TaskQuery, row) -> str:
+    raw = json.dumps([query.fingerprint(), _dump_value(row[query.sort]), str(row["id"])])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_token(query: TaskQuery, token):
+    try:
+        fingerprint, value, task_id = json.loads(base64.urlsafe_b64decode(token.encode()))
+        after = _load_value(query.sort, value), uuid.UUID(task_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid page token")
+    if fingerprint != query.fingerprint():
+        raise ValueError("Page token belongs to another query")
+    return after
+
+
+def _after(column, descending, value, task_id):
+    """Rows strictly after (value, task_id) in (column, id) order, NULLs last."""
+    if not column.nullable:
+        # A row comparison is what lets Postgres range-scan the index
+        key = tuple_(column, _tasks.c.id)
+        return key < (value, task_id) if descending else key > (value, task_id)
+
+    past = _tasks.c.id < task_id if descending else _tasks.c.id > task_id
+    if value is None:
+        return and_(column.is_(None), past)
+    beyond = column < value if descending else column > value
+    return or_(beyond, and_(column == value, past), column.is_(None))
+
+
+def select_page(query: TaskQuery, size, after=None):
+    """The statement for one page, fetching one extra row to detect the next page."""
+    column = SORTS[query.sort]
+    conditions = [SCOPES[query.scope] == uuid.UUID(query.scope_id)]
+    if query.status_ids:
+        conditions.append(_tasks.c.status_id.in_([uuid.UUID(i) for i in query.status_ids]))
+    if query.type_ids:
+        conditions.append(_tasks.c.type_id.in_([uuid.UUID(i) for i in query.type_ids]))
+    if query.assignees:
+        conditions.append(_tasks.c.assigned_to.in_([uuid.UUID(i) for i in query.assignees]))
+    if query.min_priority is not None:
+        conditions.append(_tasks.c.priority >= query.min_priority)
+    if query.max_priority is not None:
+        conditions.append(_tasks.c.priority <= query.max_priority)
+    if query.date_from:
+        conditions.append(_tasks.c.start_date >= date.fromisoformat(query.date_from))
+    if query.date_to:
+        conditions.append(_tasks.c.end_date <= date.fromisoformat(query.date_to))
+    if after is not None:
+        conditions.append(_after(column, query.descending, *after))
+
+    order = column.desc() if query.descending else column.asc()
+    if column.nullable:
+        order = order.nulls_last()
+    tie_break = _tasks.c.id.desc() if query.descending else _tasks.c.id.asc()
+    return select(_tasks).where(*conditions).order_by(order, tie_break).limit(size + 1)
@@ -0,0 +1,40 @@
+"""Cached task payloads in the protobuf wire format of the responses.
+
+Task lists and ListTasks pages are cached as the serialized messages the
+servicer answers with, so a cache hit becomes a response through
+protobuf's C parser rather than json.loads and a message built field by
+field in Python. A ``TasksResponse`` is nothing but its tasks as repeated
+field 1, so a list is put together from individually cached tasks by
+concatenating them, without decoding any.
+"""
+from app.grpc_app import task_pb2
+
+# Field 1 (tasks), wire type 2 (length-delimited)
+_TASKS_TAG = b"\x0a"
+
+
+def _varint(n) -> bytes:
+    out = bytearray()
+    while n > 0x7F:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def task_bytes(task: dict) -> bytes:
+    """A serialized task as a TaskResponse."""
+    return task_pb2.TaskResponse(**task).SerializeToString()
+
+
+def tasks_bytes(encoded) -> bytes:
+    """The TasksResponse holding the TaskResponse bytes in ``encoded``."""
+    return b"".join(_TASKS_TAG + _varint(len(task)) + task for task in encoded)
+
+
+def page_bytes(page: dict) -> bytes:
+    """A ListTasks page, ``{"tasks": [...], "next_page_token": str}``, as a ListTasksResponse."""
+    return task_pb2.ListTasksResponse(
+        tasks=[task_pb2.TaskResponse(**task) for task in page["tasks"]],
+        next_page_token=page["next_page_token"],
+    ).SerializeToString()
@@ -0,0 +1,38 @@
+import uuid
+from contextlib import contextmanager
+
+from sqlalchemy import delete, insert, select
+
+from app.clients.redis import cache
+from app.database import engine
+from taskio_models import tables
+
+
+def percentile(timings, p):
+    timings = sorted(timings)
+    return timings[min(len(timings) - 1, int(len(timings) * p))]
+
+
+@contextmanager
+def throwaway_project():
+    """Yields the id of a project created for a benchmark run.
+
+    On exit the project is deleted, its tasks with it, and its cached lists
+    and pages are invalidated by tag, as DeleteProject does.
+    """
+    project_id = uuid.uuid4()
+    with engine.begin() as conn:
+        type_id = conn.scalar(select(tables.project_types.c.id).limit(1))
+        if type_id is None:
+            raise SystemExit("no project types in the database, run InitDB first")
+        conn.execute(
+            insert(tables.projects).values(
+                id=project_id, name="benchmark", color="#000000", type_id=type_id
+            )
+        )
+    try:
+        yield project_id
+    finally:
+        with engine.begin() as conn:
+            conn.execute(delete(tables.projects).where(tables.projects.c.id == project_id))
+        cache.invalidate_tags(f"project:{project_id}")
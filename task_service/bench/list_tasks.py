@@ -0,0 +1,103 @@
+"""Times ListTasks pages, cold and warm, for common filter and sort shapes.
+
+Runs against the configured database and Redis, in a project created for
+the run, seeded with synthetic tasks and deleted with them afterwards.
+
+    python -m bench.list_tasks --seed 100000 --cases default status
+"""
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+
+from app.clients.redis import redis_client
+from app.database import engine, lookups
+from app.grpc_app import task_pb2
+from app.services import task_list
+from app.services.task import TaskService
+from app.services.task_list import pages_key
+from bench.common import percentile, throwaway_project
+from taskio_models import tables
+
+# Query shapes timed, as ListTasks filters
+CASES = {
+    "default": {},
+    "status": {"statuses": ["in progress"]},
+    "status+priority": {"statuses": ["to do", "in progress"], "min_priority": 3},
+    "type+dates": {"types": ["bug"], "date_from": "2026-03-01", "date_to": "2026-09-30"},
+    "priority desc": {"sort": "priority", "descending": True},
+    "title": {"sort": "title"},
+}
+
+
+def seed_tasks(project_id, count, chunk=5000):
+    status_ids = [lookups.id_of("statuses", name) for name in ("to do", "in progress", "done")]
+    type_ids = [lookups.id_of("task_types", name) for name in ("bug", "feature", "docs", "refactor")]
+    first_day = date(2026, 1, 1)
+    started = datetime.now()
+    rows = []
+    for i in range(count):
+        start = first_day + timedelta(days=random.randrange(365))
+        rows.append({
+            "id": uuid.uuid4(),
+            "title": f"bench task {i}",
+            "description": "",
+            "priority": random.randint(1, 5),
+            "type_id": random.choice(type_ids),
+            "status_id": random.choice(status_ids),
+            "assigned_to": None,
+            "epic_id": None,
+            "sprint_id": None,
+            "project_id": project_id,
+            "start_date": start,
+            "end_date": start + timedelta(days=random.randrange(30)) if i % 4 else None,
+            "created_at": started - timedelta(seconds=count - i),
+        })
+    with engine.begin() as conn:
+        for offset in range(0, count, chunk):
+            conn.execute(insert(tables.tasks), rows[offset:offset + chunk])
+
+
+def run(project_id, cases, samples, max_pages, page_size):
+    service = TaskService()
+    print(f"{'case':<18}{'mode':>6}{'pages':>7}{'p50 ms':>10}{'p99 ms':>10}")
+    for case in cases:
+        filters = CASES[case]
+        for mode in ("cold", "warm"):
+            timings = []
+            for _ in range(samples):
+                if mode == "cold":
+                    redis_client.delete(pages_key("project", project_id))
+                token, pages = "", 0
+                while pages < max_pages:
+                    started = time.perf_counter()
+                    page = service.list_tasks("project", project_id, page_size, token, **filters)
+                    timings.append((time.perf_counter() - started) * 1000)
+                    pages += 1
+                    token = task_pb2.ListTasksResponse.FromString(page).next_page_token
+                    if not token:
+                        break
+            print(
+                f"{case:<18}{mode:>6}{pages:>7}"
+                f"{statistics.median(timings):>10.1f}{percentile(timings, 0.99):>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--seed", type=int, default=10000, help="synthetic tasks in the project")
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--pages", type=int, default=20, help="pages walked per sample")
+    parser.add_argument("--page-size", type=int, default=task_list.LIST_PAGE_SIZE)
+    args = parser.parse_args()
+
+    with throwaway_project() as project_id:
+        started = time.perf_counter()
+        seed_tasks(project_id, args.seed)
+        print(f"seeded {args.seed} tasks in {time.perf_counter() - started:.1f}s")
+        run(project_id, args.cases, args.samples, args.pages, args.page_size)
@@ -0,0 +1,105 @@
+"""Times CreateTask and UpdateTask against the ORM write path they replaced.
+
+Runs against the configured database and Redis, in a project created for
+the run and deleted with its tasks afterwards. Every path writes through
+to the cached task lists, so the caches stay coherent meanwhile.
+
+    python -m bench.write_tasks --samples 50
+"""
+import argparse
+import statistics
+import time
+import uuid
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import joinedload
+
+from app.database import SessionLocal, engine, lookups
+from app.models.models import Task
+from app.services.task import TaskService, _serialize_task, _task_values, _write_through
+from bench.common import percentile, throwaway_project
+
+
+def _orm_write(db, task, before):
+    # The write path CreateTask and UpdateTask replaced, as the baseline:
+    # commit, refresh, then re-select with the status and type joined
+    db.add(task)
+    db.commit()
+    db.refresh(task)
+    stmt = select(Task).options(joinedload(Task.status), joinedload(Task.type)).where(Task.id == task.id)
+    written = _serialize_task(db.scalars(stmt).first())
+    _write_through([(task.id, before, written)])
+    return written
+
+
+def run(project_id, samples):
+    service = TaskService()
+    statements = {"count": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(*_):
+        statements["count"] += 1
+
+    item = {
+        "title": "bench write",
+        "description": "",
+        "priority": 3,
+        "type": "bug",
+        "assigned_to": "",
+        "epic_id": "",
+        "sprint_id": "",
+        "project_id": str(project_id),
+        "start_date": "",
+        "end_date": "",
+    }
+
+    def orm_create():
+        db = SessionLocal()
+        try:
+            values = _task_values(item, lookups.id_of("statuses", "to do"), None, None)
+            return _orm_write(db, Task(**values), None)
+        finally:
+            db.close()
+
+    def orm_update(task_id):
+        db = SessionLocal()
+        try:
+            task = db.get(Task, uuid.UUID(task_id))
+            before = task.project_id, task.sprint_id, task.epic_id
+            task.status_id = lookups.id_of("statuses", "in progress")
+            return _orm_write(db, task, before)
+        finally:
+            db.close()
+
+    def service_update(task_id):
+        return service.update_task(id=task_id, status="in progress", **item)
+
+    paths = {
+        "create (orm)": lambda _: orm_create(),
+        "create": lambda _: service.create_task(**item),
+        "update (orm)": orm_update,
+        "update": service_update,
+    }
+    task_ids = [service.create_task(**item)["id"] for _ in range(samples)]
+    print(f"{'write':<16}{'stmts':>7}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, write in paths.items():
+        timings = []
+        statements["count"] = 0
+        for task_id in task_ids:
+            started = time.perf_counter()
+            write(task_id)
+            timings.append((time.perf_counter() - started) * 1000)
+        print(
+            f"{name:<16}{statements['count'] / len(task_ids):>7.1f}"
+            f"{statistics.median(timings):>10.1f}{percentile(timings, 0.99):>10.1f}"
+        )
+    event.remove(engine, "before_cursor_execute", _count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--samples", type=int, default=10)
+    args = parser.parse_args()
+
+    with throwaway_project() as project_id:
+        run(project_id, args.samples)